@@ -0,0 +1,579 @@
+# 全取得源の記事を1つの SQLite データベース（WALモード）にまとめて保存するストアです。
+# 取得源ごとの JSON ファイルを毎回すべて読み込まず、重複チェックはインデックスを使った検索で行い、
+# 新しい記事はまとめて1トランザクションで書き込む。
+#
+#     python article_store_oriike.py migrate        # ./data/*.jsonl / *.json をデータベースに取り込む
+#     python article_store_oriike.py compact [日数]  # 古い記事をアーカイブに移してデータベースを詰める
+#
+# 保存期間（RETENTION_DAYS）を過ぎた記事は ./data/archive/<年>.jsonl.gz に移し、重複チェックに必要な
+# キー（タイトル・リンク・日付・本文の指紋のハッシュ）だけを archived_keys に残す
+# （全文検索の索引 article_fts（search_oriike）には残す）。
+# compact は収集を実行していないときに行う。
+#
+# 「この記事は保存済みか」の判定は、まず既存キーのファイル（seen_keys_oriike）をメモリマップして調べる。
+#
+# load_existing_data / save_json（utilities_oriike）はこのストアを使う。取得源の名前は
+# JSON ファイル名（./data/jftc.json → jftc）で、初めて読み込むときに既存のファイルを自動で取り込む。
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import sqlite3
+import hashlib
+import datetime
+import threading
+import multiprocessing
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from dedup_oriike import normalize_key, canonical_url
+from jsonl_store_oriike import jsonl_path, iter_records
+from run_journal_oriike import current_journal, record_item
+from search_oriike import create_index, index_article
+from seen_keys_oriike import get_seen_keys, seen_key
+from summary_service_oriike import resolve_summaries, when_summarized
+from summary_budget_oriike import PendingSummary, defer_summary
+
+DB_FILE = "./data/articles.sqlite3"
+ARCHIVE_DIR = "./data/archive"
+RETENTION_DAYS = 365    # データベースに残す期間（日）。これより古い記事はアーカイブに移す
+
+# news_item のうち、列として持つ項目（それ以外は extra に JSON で入れる）
+_COLUMNS = ('organization', 'title', 'link', 'pubDate', 'execution_timestamp', 'summary', 'content_hash')
+
+_INSERT = ("INSERT INTO articles (source, organization, title, title_hash, link, canonical_link, pub_date,"
+           " norm_date, execution_timestamp, summary, content_hash, extra)"
+           " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    organization TEXT,
+    title TEXT NOT NULL,
+    title_hash TEXT NOT NULL,
+    link TEXT,
+    canonical_link TEXT,
+    pub_date TEXT,
+    norm_date TEXT,
+    execution_timestamp TEXT,
+    summary TEXT,
+    content_hash TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS migrated_sources (
+    source TEXT PRIMARY KEY,
+    migrated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS archived_keys (
+    source TEXT NOT NULL,
+    title_hash TEXT NOT NULL,
+    pub_key TEXT,
+    canonical_link TEXT,
+    content_hash TEXT,
+    norm_date TEXT
+);
+CREATE TABLE IF NOT EXISTS link_claims (
+    run_id TEXT NOT NULL,
+    canonical_link TEXT NOT NULL,
+    source TEXT NOT NULL,
+    claimed_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, canonical_link)
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_articles_source_title ON articles (source, title_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_title ON articles (title_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_organization ON articles (organization);
+CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link);
+CREATE INDEX IF NOT EXISTS idx_articles_canonical_link ON articles (canonical_link);
+CREATE INDEX IF NOT EXISTS idx_articles_norm_date ON articles (norm_date);
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles (source, content_hash);
+CREATE INDEX IF NOT EXISTS idx_archived_keys_title ON archived_keys (source, title_hash);
+CREATE INDEX IF NOT EXISTS idx_archived_keys_link ON archived_keys (canonical_link);
+CREATE INDEX IF NOT EXISTS idx_archived_keys_content_hash ON archived_keys (source, content_hash);
+"""
+
+
+def title_hash(title):
+    """正規化したタイトルのハッシュ値を返します。"""
+    return hashlib.sha1(normalize_key(title).encode('utf-8')).hexdigest()
+
+
+def normalize_date(value):
+    """さまざまな形式の日付を YYYY-MM-DD に揃えます。解釈できなければ None を返します。
+
+    例: "2025年04月01日"、"2025年年 2025年04月01日"、"2025.4.1"、"Tue, 01 Apr 2025 09:00:00 +0900"、
+        "2025-04-01T09:00:00+09:00"
+    """
+    if not value:
+        return None
+    text = str(value)
+    matches = re.findall(r'(\d{4})\s*[年./\-]\s*(\d{1,2})\s*[月./\-]\s*(\d{1,2})', text)
+    if matches:
+        year, month, day = matches[-1]
+        try:
+            return datetime.date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            return None
+    try:
+        return parsedate_to_datetime(text).date().isoformat()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def source_name(json_file):
+    """JSON ファイルのパスから取得源の名前を返します（./data/jftc.json → jftc）。"""
+    return os.path.splitext(os.path.basename(json_file))[0]
+
+
+def _archive_key(record):
+    return record.get('source'), record.get('title'), record.get('link'), record.get('pubDate')
+
+
+def _archived_records(path):
+    """アーカイブのファイルに書き出し済みの記事のキーの集合を返します。書き込み途中で中断された末尾は読み飛ばします。"""
+    keys = set()
+    if not os.path.exists(path):
+        return keys
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    keys.add(_archive_key(json.loads(line)))
+                except json.JSONDecodeError:
+                    continue
+    except (EOFError, OSError):
+        pass
+    return keys
+
+
+def _claim_run_id():
+    """引き受けの記録を区別する実行IDを返します。
+
+    実行ジャーナルがあればその実行ID、なければ親プロセス（取得源を別プロセスで実行した元）のプロセスIDです。
+    """
+    journal = current_journal()
+    if journal is not None:
+        return os.path.basename(journal.run_dir)
+    process = multiprocessing.parent_process() or multiprocessing.current_process()
+    return f"pid-{process.pid}"
+
+
+def _row_to_item(row):
+    item = {
+        'pubDate': row['pub_date'],
+        'execution_timestamp': row['execution_timestamp'],
+        'organization': row['organization'],
+        'title': row['title'],
+        'link': row['link'],
+        'summary': row['summary'],
+    }
+    if row['content_hash']:
+        item['content_hash'] = row['content_hash']
+    if row['extra']:
+        item.update(json.loads(row['extra']))
+    return item
+
+
+def _item_to_row(source, item):
+    extra = {key: value for key, value in item.items() if key not in _COLUMNS}
+    return (
+        source,
+        item.get('organization'),
+        item.get('title') or "",
+        title_hash(item.get('title')),
+        item.get('link'),
+        canonical_url(item.get('link')),
+        item.get('pubDate'),
+        normalize_date(item.get('pubDate')),
+        item.get('execution_timestamp'),
+        item.get('summary'),
+        item.get('content_hash'),
+        json.dumps(extra, ensure_ascii=False) if extra else None,
+    )
+
+
+class ArticleStore:
+    """記事データベースです。接続はスレッドごとに作ります。"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+            self._upgrade(conn)
+            conn.executescript(_INDEXES)
+            create_index(conn)
+
+    def _upgrade(self, conn):
+        """以前のバージョンで作ったデータベースに、後から追加した列を加えます。"""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(articles)")}
+        if 'canonical_link' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN canonical_link TEXT")
+            rows = conn.execute("SELECT id, link FROM articles").fetchall()
+            conn.executemany("UPDATE articles SET canonical_link = ? WHERE id = ?",
+                             [(canonical_url(row['link']), row['id']) for row in rows])
+        if 'content_hash' not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN content_hash TEXT")
+        # 引き受けの記録は実行ごとのため、実行IDを持たない以前の表は作り直す
+        claim_columns = {row['name'] for row in conn.execute("PRAGMA table_info(link_claims)")}
+        if 'run_id' not in claim_columns:
+            conn.execute("DROP TABLE link_claims")
+            conn.executescript(_SCHEMA)
+
+    def connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _insert(self, conn, source, items):
+        """トランザクションの中で記事をまとめて書き込み、全文検索の索引にも加えます。"""
+        rows = [_item_to_row(source, item) for item in items]
+        if not rows:
+            return
+        conn.executemany(_INSERT, rows)
+        # 1つのトランザクションで挿入した行の id は連番になる
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        for rowid, item, row in zip(range(last_id - len(rows) + 1, last_id + 1), items, rows):
+            index_article(conn, rowid, source, item, row[7])
+
+    @property
+    def seen_keys(self):
+        """既存キーのファイル（seen_keys_oriike）です。"""
+        return get_seen_keys(self.connection())
+
+    def _add_seen_keys(self, source, items):
+        keys = []
+        for item in items:
+            keys.append(seen_key(source, "title", title_hash(item.get('title'))))
+            if item.get('link'):
+                keys.append(seen_key(source, "link", canonical_url(item['link'])))
+        self.seen_keys.add(keys)
+
+    def insert_many(self, source, items):
+        """記事をまとめて書き込みます。"""
+        items = list(items)
+        if not items:
+            return
+        with self.connection() as conn:
+            self._insert(conn, source, items)
+        # 既存キーはデータベースに書き込んでから追記する（中断しても未保存の記事を保存済みとみなさない）
+        self._add_seen_keys(source, items)
+
+    def find_by_title(self, source, title):
+        """取得源の中で、正規化したタイトルが一致する記事を返します。"""
+        rows = self.connection().execute(
+            "SELECT * FROM articles WHERE source = ? AND title_hash = ?", (source, title_hash(title)))
+        return [_row_to_item(row) for row in rows]
+
+    def is_archived(self, source, title, pub_date=None):
+        """アーカイブに移した記事に、タイトル（pub_date を指定した場合は日付も）が一致するものがあるかを返します。"""
+        sql = "SELECT 1 FROM archived_keys WHERE source = ? AND title_hash = ?"
+        params = [source, title_hash(title)]
+        if pub_date is not None:
+            sql += " AND pub_key = ?"
+            params.append(normalize_key(pub_date))
+        return self.connection().execute(sql + " LIMIT 1", params).fetchone() is not None
+
+    def has_link(self, source, link):
+        canonical = canonical_url(link)
+        conn = self.connection()
+        row = conn.execute(
+            "SELECT 1 FROM articles WHERE source = ? AND canonical_link = ? LIMIT 1", (source, canonical)).fetchone()
+        if row is None:
+            row = conn.execute("SELECT 1 FROM archived_keys WHERE source = ? AND canonical_link = ? LIMIT 1",
+                               (source, canonical)).fetchone()
+        return row is not None
+
+    def find_by_content(self, source, fingerprint):
+        """取得源の中で、本文の指紋が一致する記事のリンクを返します。なければ None を返します。"""
+        conn = self.connection()
+        row = conn.execute(
+            "SELECT link FROM articles WHERE source = ? AND content_hash = ? LIMIT 1",
+            (source, fingerprint)).fetchone()
+        if row is None:
+            row = conn.execute(
+                "SELECT canonical_link AS link FROM archived_keys WHERE source = ? AND content_hash = ? LIMIT 1",
+                (source, fingerprint)).fetchone()
+        return row['link'] if row else None
+
+    def update_item(self, source, item):
+        """保存済みの記事（タイトルとリンクが一致するもの）を item の内容で書き換えます。"""
+        norm_date = normalize_date(item.get('pubDate'))
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT id, organization FROM articles WHERE source = ? AND title_hash = ? AND canonical_link = ?",
+                (source, title_hash(item.get('title')), canonical_url(item.get('link')))).fetchall()
+            conn.executemany(
+                "UPDATE articles SET pub_date = ?, norm_date = ?, execution_timestamp = ?, summary = ?,"
+                " content_hash = ? WHERE id = ?",
+                [(item.get('pubDate'), norm_date, item.get('execution_timestamp'),
+                  item.get('summary'), item.get('content_hash'), row['id']) for row in rows])
+            for row in rows:
+                index_article(conn, row['id'], source, {'organization': row['organization'], **item}, norm_date)
+
+    def claim(self, source, link):
+        """取得源 source がリンクの記事を引き受けられれば True を返します。
+
+        他の取得源が同じ記事（正規化したURLが一致するもの）を保存済みか、今回の実行で先に引き受けていれば
+        False を返します。引き受けの記録は複数のプロセスで共有されますが、今回の実行の間だけ有効です
+        （引き受けた取得源が記事を保存できなかった場合も、次の実行では他の取得源が取得できます）。
+        """
+        canonical = canonical_url(link)
+        run_id = _claim_run_id()
+        with self.connection() as conn:
+            row = conn.execute("SELECT 1 FROM articles WHERE canonical_link = ? AND source != ? LIMIT 1",
+                               (canonical, source)).fetchone()
+            if row is None:
+                row = conn.execute("SELECT 1 FROM archived_keys WHERE canonical_link = ? AND source != ? LIMIT 1",
+                                   (canonical, source)).fetchone()
+            if row is not None:
+                return False
+            conn.execute("INSERT OR IGNORE INTO link_claims (run_id, canonical_link, source, claimed_at)"
+                         " VALUES (?, ?, ?, ?)",
+                         (run_id, canonical, source, datetime.datetime.now().isoformat(timespec='seconds')))
+            owner = conn.execute("SELECT source FROM link_claims WHERE run_id = ? AND canonical_link = ?",
+                                 (run_id, canonical)).fetchone()[0]
+        return owner == source
+
+    def archive(self, days=RETENTION_DAYS, archive_dir=ARCHIVE_DIR):
+        """days 日より古い記事を年ごとの圧縮ファイルに移し、重複チェック用のキーだけを残します。移した件数を返します。
+
+        日付を解釈できない記事は取得日時（execution_timestamp）で判断し、どちらもなければ移しません。
+        """
+        cutoff = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+        conn = self.connection()
+        rows = conn.execute(
+            "SELECT * FROM articles WHERE COALESCE(norm_date, substr(execution_timestamp, 1, 10)) < ? ORDER BY id",
+            (cutoff,)).fetchall()
+        if not rows:
+            return 0
+        by_year = {}
+        for row in rows:
+            year = (row['norm_date'] or row['execution_timestamp'])[:4]
+            by_year.setdefault(year, []).append(row)
+
+        # 先にアーカイブを書き出してから、データベースから削除する
+        # （削除の前に中断した場合は、次の実行でアーカイブ済みの記事を書き足さずに削除だけを行う）
+        os.makedirs(archive_dir, exist_ok=True)
+        for year, year_rows in sorted(by_year.items()):
+            path = os.path.join(archive_dir, f"{year}.jsonl.gz")
+            archived = _archived_records(path)
+            records = [{'source': row['source'], **_row_to_item(row)} for row in year_rows]
+            records = [record for record in records if _archive_key(record) not in archived]
+            if not records:
+                continue
+            with open(path, 'ab') as raw:
+                with gzip.open(raw, 'at', encoding='utf-8') as f:
+                    for record in records:
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                raw.flush()
+                os.fsync(raw.fileno())
+
+        with conn:
+            conn.executemany(
+                "INSERT INTO archived_keys (source, title_hash, pub_key, canonical_link, content_hash, norm_date)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(row['source'], row['title_hash'], normalize_key(row['pub_date']), row['canonical_link'],
+                  row['content_hash'], row['norm_date']) for row in rows])
+            conn.executemany("DELETE FROM articles WHERE id = ?", [(row['id'],) for row in rows])
+            # 全文検索の索引には残す。新しい記事の id と重ならないよう、負の rowid に付け替える
+            conn.executemany("UPDATE article_fts SET rowid = ? WHERE rowid = ?",
+                             [(-row['id'], row['id']) for row in rows])
+        return len(rows)
+
+    def compact(self, days=RETENTION_DAYS):
+        """古い記事をアーカイブに移し、WALを書き戻してデータベースファイルを詰めます。移した件数を返します。"""
+        count = self.archive(days)
+        conn = self.connection()
+        with conn:
+            # 収集を実行していないときに行うため、これまでの実行の引き受けの記録は要らない
+            conn.execute("DELETE FROM link_claims")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        return count
+
+    def iter_source(self, source):
+        """取得源の記事を保存した順に返します。"""
+        rows = self.connection().execute(
+            "SELECT * FROM articles WHERE source = ? ORDER BY id", (source,))
+        for row in rows:
+            yield _row_to_item(row)
+
+    def count(self, source):
+        return self.connection().execute(
+            "SELECT COUNT(*) FROM articles WHERE source = ?", (source,)).fetchone()[0]
+
+    def is_migrated(self, source):
+        row = self.connection().execute(
+            "SELECT 1 FROM migrated_sources WHERE source = ?", (source,)).fetchone()
+        return row is not None
+
+    def migrate_file(self, json_file):
+        """取得源の既存ファイル（.jsonl があればそちら、なければ .json）を取り込みます。取り込んだ件数を返します。"""
+        source = source_name(json_file)
+        if self.is_migrated(source):
+            return 0
+        path = jsonl_path(json_file)
+        if os.path.exists(path):
+            items = list(iter_records(path))
+        elif os.path.exists(json_file):
+            with open(json_file, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+            if not isinstance(items, list):
+                return 0
+        else:
+            items = []
+        items = [item for item in items if isinstance(item, dict)]
+        with self.connection() as conn:
+            self._insert(conn, source, items)
+            conn.execute("INSERT INTO migrated_sources (source, migrated_at) VALUES (?, ?)",
+                         (source, datetime.datetime.now().isoformat(timespec='seconds')))
+        self._add_seen_keys(source, items)
+        return len(items)
+
+
+class SourceHistory:
+    """1つの取得源の既存データです。load_existing_data が返すリストの代わりに使います。
+
+    append() した記事は save_json() でまとめてデータベースに書き込まれます
+    （実行ジャーナルが有効な間は、要約が済んだ時点で書き込みます）。
+    DedupIndex はこのオブジェクトを受け取ると、全件を読み込まずにデータベースを検索して重複を判定します。
+    """
+
+    def __init__(self, store, source):
+        self.store = store
+        self.source = source
+        self.pending = []
+        self._lock = threading.Lock()
+
+    def append(self, item):
+        with self._lock:
+            self.pending.append(item)
+        when_summarized(item, self._summarized)
+
+    def _summarized(self, item):
+        defer_summary(item, {"store": self.source})
+        if record_item(item):
+            self.flush(wait=False)
+
+    def flush(self, wait=True):
+        """未保存の記事をデータベースに書き込みます。
+
+        wait が False なら、要約（summarize_later の Future）が済んでいない記事は書き込まずに残します。
+        """
+        if wait:
+            resolve_summaries(list(self.pending))
+        with self._lock:
+            ready = [item for item in self.pending if not isinstance(item.get('summary'), Future)]
+            self.pending = [item for item in self.pending if isinstance(item.get('summary'), Future)]
+            self.store.insert_many(self.source, ready)
+
+    def lookup(self, fields, key):
+        """fields の値を正規化したタプル key と一致する記事がデータベースにあるかを返します。"""
+        # 既存キーのファイルにあれば保存済み。なければデータベースで確かめる
+        if fields == ('title',) and self.store.seen_keys.contains(self.source, "title", title_hash(key[0])):
+            return True
+        if 'title' in fields:
+            candidates = self.store.find_by_title(self.source, key[fields.index('title')])
+        else:
+            candidates = self.store.iter_source(self.source)
+        if any(tuple(normalize_key(item.get(field)) for field in fields) == key for item in candidates):
+            return True
+        # アーカイブに移した記事はタイトル（と日付）のキーだけで判定する
+        if fields == ('title',):
+            return self.store.is_archived(self.source, key[0])
+        if fields == ('title', 'pubDate'):
+            return self.store.is_archived(self.source, key[0], key[1])
+        return False
+
+    def lookup_link(self, link):
+        if self.store.seen_keys.contains(self.source, "link", canonical_url(link)):
+            return True
+        return self.store.has_link(self.source, link)
+
+    def lookup_content(self, fingerprint):
+        return self.store.find_by_content(self.source, fingerprint)
+
+    def stored_item(self, title):
+        """タイトルが一致する保存済みの記事を返します。なければ None を返します。"""
+        items = self.store.find_by_title(self.source, title)
+        return items[-1] if items else None
+
+    def replace(self, item):
+        """保存済みの記事を item の内容で書き換えます（本文が更新された記事の要約し直しなど）。
+
+        要約の予算で後から要約する記事は、候補として記録するだけで書き換えません。予算で選ばれれば要約と一緒に
+        書き換え、選ばれなければ前の要約と本文の指紋が残るため、次の実行でもう一度候補になります。
+        """
+        when_summarized(item, self._replaced)
+
+    def _replaced(self, item):
+        deferred = isinstance(item.get('summary'), PendingSummary)
+        defer_summary(item, {"store": self.source})
+        record_item(item)
+        if not deferred:
+            self.store.update_item(self.source, item)
+
+    def claim(self, link):
+        return self.store.claim(self.source, link)
+
+    def __iter__(self):
+        yield from self.store.iter_source(self.source)
+        yield from self.pending
+
+    def __len__(self):
+        return self.store.count(self.source) + len(self.pending)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """共有の ArticleStore を返します。"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+        return _store
+
+
+def open_history(json_file):
+    """取得源の既存データを開きます。まだ取り込んでいない既存ファイルがあれば先に取り込みます。"""
+    store = get_store()
+    store.migrate_file(json_file)
+    return SourceHistory(store, source_name(json_file))
+
+
+def migrate_all(data_dir="./data"):
+    """data_dir 内の取得源のファイルをまとめてデータベースに取り込みます。"""
+    store = get_store()
+    sources = {}
+    for path in glob.glob(os.path.join(data_dir, "*.jsonl")) + glob.glob(os.path.join(data_dir, "*.json")):
+        sources.setdefault(source_name(path), os.path.splitext(path)[0] + ".json")
+    for source, json_file in sorted(sources.items()):
+        count = store.migrate_file(json_file)
+        if count:
+            print(f"取り込みました: {source}（{count}件）")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "migrate":
+        migrate_all()
+    elif command == "compact":
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else RETENTION_DAYS
+        count = get_store().compact(days)
+        print(f"{days}日より古い記事 {count}件をアーカイブに移しました: {ARCHIVE_DIR}")
+    else:
+        print("使い方: python article_store_oriike.py migrate|compact [日数]")
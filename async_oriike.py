@@ -0,0 +1,262 @@
+# ブラウザを必要としない情報取得源（requests/feedparser）を、1つのイベントループ上で並行に取得するエンジンです。
+#
+# 情報取得源は次のキーを持つ辞書（SOURCE）で定義します。
+#   organization : 組織名（news_item['organization'] に入る）
+#   url          : 一覧ページまたはRSSフィードのURL
+#   json_file    : 既存データのJSONファイル
+#   parse        : 一覧の本文(str)を受け取り、{'title', 'link', 'pubDate'} の辞書のリストを返す関数
+#                  RSSフィードの場合は parse_feed_entries を指定する
+#   encoding     : 一覧・記事ページの文字コード（省略時は 'UTF-8'）
+#   content      : 記事ページのHTMLから要約対象のテキストを取り出す関数（省略時はHTMLをそのまま使う）
+#   watch        : True にすると、一覧に載っている既存の記事も毎回確認し、本文が更新されていれば要約し直す
+#   near_duplicate : 過去の記事とほとんど同じ記事（続報など）の扱い。"skip" は要約せずに既存データにだけ保存し、
+#                  "flag" は要約せずに duplicate_of（元の記事のリンク）を付けて返す（省略時は判定しない）
+import asyncio
+import feedparser
+from http_oriike import http_get
+from validator_cache_oriike import conditional_get, commit_validators
+from dedup_oriike import DedupIndex, content_hash
+from simhash_oriike import get_index
+from article_store_oriike import source_name
+from search_oriike import remember_body
+from content_extract_oriike import looks_like_html, extract_main_text
+from run_journal_oriike import source_context
+from utilities_oriike import summarize_later, load_existing_data, save_json, is_pdf_link, extract_text_from_pdf, extract_text_from_pdf_bytes
+
+REQUEST_TIMEOUT = 15    # 1リクエストあたりのタイムアウト（秒）
+MAX_IN_FLIGHT = 16      # 同時に発行するHTTPリクエストの最大数
+
+
+def parse_feed_entries(text):
+    """RSS/Atomフィードの本文を {'title', 'link', 'pubDate'} のリストに変換します。"""
+    feed = feedparser.parse(text)
+    entries = []
+    for entry in feed.entries:
+        entries.append({
+            'title': entry.title,
+            'link': entry.link,
+            'pubDate': entry.get('published', entry.get('updated', '')),
+        })
+    return entries
+
+
+async def _get_text(url, encoding, http_slots):
+    """URLの本文を取得します。requestsの呼び出しはスレッドに逃がしてイベントループを止めません。"""
+    async with http_slots:
+        response = await asyncio.to_thread(http_get, url, timeout=REQUEST_TIMEOUT)
+    response.encoding = encoding
+    return response.text
+
+
+async def _get_content(source, link, http_slots, conditional=False):
+    """記事の本文（要約対象のテキスト）を取得します。
+
+    conditional=True の場合は条件付きGETで取得し、前回から更新がなければ None を返します。
+    """
+    if is_pdf_link(link) and not conditional:
+        async with http_slots:
+            return await asyncio.to_thread(extract_text_from_pdf, link)
+    encoding = source.get('encoding', 'UTF-8')
+    if conditional:
+        async with http_slots:
+            response = await asyncio.to_thread(conditional_get, link, timeout=REQUEST_TIMEOUT)
+        if response is None:
+            return None
+        if is_pdf_link(link):
+            return extract_text_from_pdf_bytes(response.content)
+        response.encoding = encoding
+        html = response.text
+    else:
+        html = await _get_text(link, encoding, http_slots)
+    extract = source.get('content')
+    return extract(html) if extract else html
+
+
+def _main_text(content):
+    """本文の指紋に使うテキストを返します。HTML（本文の取り出し方を指定していない取得源）なら本文だけを取り出します。
+
+    ページのメニューや広告、アクセス解析のタグが変わっただけで本文が更新されたと判定しないようにする。
+    """
+    return extract_main_text(content) if looks_like_html(content) else content
+
+
+async def _collect_source(source, max_count, execution_timestamp, http_slots):
+    """1つの情報取得源について、一覧・記事・要約をまとめて取得します。"""
+    organization = source['organization']
+    json_file = source['json_file']
+    watch = source.get('watch', False)
+    existing_data = await asyncio.to_thread(load_existing_data, json_file)
+
+    try:
+        # 一覧は条件付きGETで取得し、前回から更新がなければ取得源ごとスキップする
+        # （監視する取得源は記事ページを確認し直すため、一覧は毎回取得する）
+        async with http_slots:
+            get = http_get if watch else conditional_get
+            response = await asyncio.to_thread(get, source['url'], timeout=REQUEST_TIMEOUT)
+        if response is None:
+            return []
+        response.encoding = source.get('encoding', 'UTF-8')
+        entries = source['parse'](response.text)
+    except Exception as e:
+        print(f"{organization}: ページ取得中にエラー発生 {e}")
+        return []
+
+    seen = DedupIndex(existing_data)
+    new_entries = []
+    watched_entries = []
+    for entry in entries:
+        if entry['title'] in seen:
+            if watch:
+                watched_entries.append(entry)
+            continue  # 既に存在するニュースはスキップ
+        if seen.claimed_elsewhere(entry['link']):
+            continue
+        seen.add(entry)
+        new_entries.append(entry)
+
+    # 記事ページは一覧に載っている分をまとめて並行に取得する
+    # 監視する記事は条件付きGETで確認し、更新がなければ本文を受け取らない
+    async def fetch(entry, conditional=False):
+        if not conditional:
+            print(f"{organization}: 記事取得開始 - {entry['title']}")
+        try:
+            return await _get_content(source, entry['link'], http_slots, conditional)
+        except Exception as e:
+            print(f"{organization}: コンテンツ取得中にエラー発生 - {entry['link']}, {e}")
+            return ""
+    contents = await asyncio.gather(*(fetch(entry) for entry in new_entries))
+    watched_contents = await asyncio.gather(*(fetch(entry, True) for entry in watched_entries))
+
+    # 新しい記事がmax_count件に達したら要約をスキップ
+    targets = [(entry, content) for entry, content in zip(new_entries, contents) if content]
+    for entry, content in zip(new_entries, contents):
+        if not content:
+            print(f"{organization}: コンテンツ取得失敗 - {entry['link']}")
+
+    # 本文は記事を保存するときに全文検索の索引に入れる
+    for entry, content in targets:
+        remember_body(entry['title'], content)
+
+    # タイトルだけ言い換えた記事は、本文の指紋が既存の記事と一致するため要約しない
+    main_texts = await asyncio.gather(*(asyncio.to_thread(_main_text, content) for _, content in targets))
+    main_texts = {entry['link']: text for (entry, _), text in zip(targets, main_texts)}
+    fingerprints = {link: content_hash(text) for link, text in main_texts.items()}
+    duplicates = {}
+    for entry, _ in targets:
+        original = seen.same_content(fingerprints[entry['link']])
+        if original:
+            duplicates[entry['link']] = original
+            print(f"{organization}: 本文が既存の記事と同じため要約しません - {entry['title']}")
+
+    # 続報など、過去の記事とほとんど同じ記事は要約の前に見分ける（一覧の順に判定し、索引にも順に加える）
+    if source.get('near_duplicate'):
+        near_index = get_index()
+        key = source_name(json_file)
+        # 初めて使うときは保存済みの記事から索引を作る（最初の続報も過去の記事と比べられるようにする）
+        await asyncio.to_thread(near_index.seed, key)
+        for entry, _ in targets:
+            if entry['link'] in duplicates:
+                continue
+            # ページのメニューなどが共通なだけで近いと判定しないよう、取り出した本文で比べる
+            text = entry['title'] + "\n" + main_texts[entry['link']]
+            match = await asyncio.to_thread(near_index.find, text, key, entry['link'])
+            if match:
+                duplicates[entry['link']] = match[1]
+                print(f"{organization}: 近似重複のため要約しません - {entry['title']}（元の記事: {match[0]}）")
+            await asyncio.to_thread(near_index.add, text, key, entry['title'], entry['link'])
+
+    # 監視する記事は、本文の指紋が変わったものだけ要約し直す
+    updated = []
+    for entry, content in zip(watched_entries, watched_contents):
+        stored = seen.stored_item(entry['title'])
+        if not content or stored is None:
+            continue
+        fingerprint = content_hash(await asyncio.to_thread(_main_text, content))
+        if stored.get('content_hash') == fingerprint:
+            continue
+        if not stored.get('content_hash') or stored['content_hash'] == content_hash(content):
+            # 指紋を保存する前の記事と、HTML全体の指紋を保存していた記事は、今回の本文を基準として保存するだけにする
+            existing_data.replace({**stored, 'content_hash': fingerprint})
+            continue
+        print(f"{organization}: 本文が更新されたため要約し直します - {entry['title']}")
+        fingerprints[entry['link']] = fingerprint
+        updated.append((entry, content))
+
+    async def summarize(index, entry, content):
+        if index >= max_count:
+            return ""
+        # 同時に実行する数とレート制限は要約サービス（summary_service_oriike）が全取得源で共有して守る
+        future = await asyncio.to_thread(summarize_later, entry['title'], content)
+        return await asyncio.wrap_future(future)
+    originals = [(entry, content) for entry, content in targets if entry['link'] not in duplicates] + updated
+    summaries = await asyncio.gather(
+        *(summarize(index, entry, content) for index, (entry, content) in enumerate(originals))
+    )
+    summary_by_link = {entry['link']: summary for (entry, _), summary in zip(originals, summaries)}
+
+    updated_links = {entry['link'] for entry, _ in updated}
+    news_items = []
+    for entry, _ in targets + updated:
+        news_item = {
+            'pubDate': entry['pubDate'],
+            'execution_timestamp': execution_timestamp,
+            'organization': organization,
+            'title': entry['title'],
+            'link': entry['link'],
+            'summary': summary_by_link.get(entry['link'], ""),
+            'content_hash': fingerprints[entry['link']],
+        }
+        if entry['link'] in duplicates:
+            news_item['duplicate_of'] = duplicates[entry['link']]
+            existing_data.append(news_item)
+            if source.get('near_duplicate') == "flag":
+                news_items.append(news_item)
+            continue
+        news_items.append(news_item)
+        if entry['link'] in updated_links:
+            existing_data.replace(news_item)
+        else:
+            existing_data.append(news_item)
+
+    await asyncio.to_thread(save_json, existing_data, json_file)
+    # 取得できなかった記事があれば一覧の ETag / Last-Modified は保存せず、次回も一覧を取得してその記事を取得し直す
+    urls = [entry['link'] for entry, content in zip(watched_entries, watched_contents) if content != ""]
+    if all(contents):
+        urls.append(source['url'])
+    commit_validators(*urls)
+    return news_items
+
+
+async def _collect_sources(sources, max_count, execution_timestamp):
+    http_slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def collect(source):
+        # 要約のトークン数などを取得源ごとに記録する（コンテキストはタスクごとに分かれる）
+        with source_context(source['organization']):
+            return await _collect_source(source, max_count, execution_timestamp, http_slots)
+    results = await asyncio.gather(
+        *(collect(source) for source in sources),
+        return_exceptions=True,
+    )
+    news_items = []
+    for source, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            print(f"⚠️ {source['organization']} の取得でエラー発生: {result}")
+            continue
+        news_items.extend(result)
+    return news_items
+
+
+def collect_sources(sources, max_count, execution_timestamp):
+    """複数の情報取得源を1つのイベントループ上で並行に取得し、登録順に結合したニュースのリストを返します。"""
+    return asyncio.run(_collect_sources(sources, max_count, execution_timestamp))
+
+
+def collect_source(source, max_count, execution_timestamp):
+    """1つの情報取得源を取得します。従来の fetch_* 関数と同じく list[dict] を返します。"""
+    return collect_sources([source], max_count, execution_timestamp)
+
+
+def fetch_sources(sources, max_count, execution_timestamp, executable_path):
+    """collect_sources を fetch_* 関数と同じ引数で呼び出します（run_sources に1件の取得源として渡すため）。"""
+    return collect_sources(sources, max_count, execution_timestamp)
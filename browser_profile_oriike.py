@@ -0,0 +1,75 @@
+# 情報取得用のブラウザの設定です。
+# 解析しないリソース（画像・フォント・CSS・動画・アクセス解析）を読み込まないようにし、
+# ページは固定時間ではなくニュース一覧の要素が現れた時点で読み取れるようにする。
+from selenium.webdriver.common.by import By
+from selenium.webdriver.edge.options import Options
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+WAIT_TIMEOUT = 10       # ニュース一覧が現れるのを待つ最大時間（秒）
+
+# DevTools（Network.setBlockedURLs）で読み込みを止めるURLのパターン
+BLOCKED_URL_PATTERNS = [
+    # 画像
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    # フォント
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # スタイルシート
+    "*.css",
+    # 動画・音声
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    # アクセス解析・広告
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*connect.facebook.com*", "*platform.twitter.com*",
+    "*youtube.com/embed*", "*ytimg.com*", "*clarity.ms*", "*hotjar.com*",
+]
+
+# 画像は DevTools だけでなくブラウザ設定でも読み込まない
+CONTENT_SETTING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+
+def configure_options(options):
+    """既存のオプションに、解析に不要なリソースを読み込まない設定を加えて返します。"""
+    options.add_experimental_option("prefs", CONTENT_SETTING_PREFS)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    return options
+
+
+def browser_options(page_load_strategy='normal'):
+    """情報取得用のEdgeのオプションを返します。"""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument("--no-sandbox")
+    options.add_argument("--lang=ja")
+    options.add_argument("--disable-gpu")
+    options.use_chromium = True
+    options.set_capability("acceptInsecureCerts", True)
+    options.page_load_strategy = page_load_strategy
+    return configure_options(options)
+
+
+def block_resources(driver):
+    """現在のタブで、BLOCKED_URL_PATTERNS に一致するリクエストを止めます。タブを開くたびに呼び出してください。"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"⚠️ リソースのブロックを設定できませんでした: {e}")
+
+
+def wait_for(driver, selector, timeout=WAIT_TIMEOUT):
+    """selector（CSSセレクタ）の要素が現れるまで待ちます。
+
+    現れれば True、timeout 秒待っても現れなければ False を返します（例外にはしません）。
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        return True
+    except Exception:
+        print(f"⚠️ {timeout}秒待っても要素が見つかりませんでした: {selector}")
+        return False
@@ -0,0 +1,90 @@
+# 長い文書（年次の開示資料や厚生労働省の通知のPDFなど）を要約するための分割計画です。
+# 短い文書はそのまま1回で要約し、長い文書はページ（"\f"、extract_text_from_pdf がページの間に入れる）と
+# 見出し（「第１章」「１．」「（１）」「■」「【】」など）の区切りで分けて、部分ごとに並行に要約してから
+# 最後に1回でまとめる（summarize_later、utilities_oriike）。
+#
+# 1つの文書から要約に送るトークン数は MAX_INPUT_TOKENS までにし、1件の文書が実行全体の時間を占めないようにする。
+import re
+from summary_service_oriike import estimate_tokens
+
+SINGLE_CALL_TOKENS = 6000   # これ以下の文書は分けずに1回で要約する
+CHUNK_TOKENS = 4000         # 分けた部分1つの最大トークン数
+MAX_INPUT_TOKENS = 40000    # 1つの文書から要約に送る最大トークン数（超えた分は送らない）
+
+_HEADING = re.compile(
+    r'^[ \t　]*(?:第[0-9０-９一二三四五六七八九十百]+[章節部編款]'
+    r'|[0-9０-９]+[.．][ 　]*\S'
+    r'|[（(][0-9０-９一二三四五六七八九十]+[)）]'
+    r'|[一二三四五六七八九十]+[、．]'
+    r'|[■□●◆◇【])')
+
+
+def split_sections(text):
+    """テキストをページと見出しの区切りで分けたリストを返します。"""
+    sections = []
+    for page in text.split('\f'):
+        current = []
+        for line in page.splitlines(keepends=True):
+            if current and _HEADING.match(line):
+                sections.append("".join(current))
+                current = []
+            current.append(line)
+        if current:
+            sections.append("".join(current))
+    return [section for section in sections if section.strip()]
+
+
+def _split_large(section, max_tokens):
+    """max_tokens を超える区切りを、行の境目で（1行が長すぎる場合は文字数で）分けます。"""
+    pieces, current, size = [], [], 0
+    for line in section.splitlines(keepends=True):
+        tokens = estimate_tokens(line)
+        if tokens > max_tokens:
+            # 1行が長すぎる場合（改行のない抽出結果など）は、およそ max_tokens ずつに切る
+            step = max(1, len(line) * max_tokens // tokens)
+            lines = [line[i:i + step] for i in range(0, len(line), step)]
+        else:
+            lines = [line]
+        for piece in lines:
+            tokens = estimate_tokens(piece)
+            if current and size + tokens > max_tokens:
+                pieces.append("".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += tokens
+    if current:
+        pieces.append("".join(current))
+    return pieces
+
+
+def plan_chunks(text, single_call_tokens=SINGLE_CALL_TOKENS, chunk_tokens=CHUNK_TOKENS,
+                max_input_tokens=MAX_INPUT_TOKENS):
+    """要約に送る部分のリストを返します。1件なら分けずに1回で要約します。
+
+    各部分がおよそ chunk_tokens 以下になるよう、区切りを先頭からまとめていきます。
+    合計が max_input_tokens を超える分は含めません。
+    """
+    text = text or ""
+    if estimate_tokens(text) <= single_call_tokens:
+        return [text]
+
+    chunks, current, size, total = [], [], 0, 0
+    for section in split_sections(text):
+        for piece in _split_large(section, chunk_tokens):
+            tokens = estimate_tokens(piece)
+            if total and total + tokens > max_input_tokens:
+                if current:
+                    chunks.append("".join(current))
+                print(f"⚠️ 文書が長いため、先頭の約{total}トークンだけを要約します"
+                      f"（全体の約{estimate_tokens(text)}トークン）。")
+                return chunks
+            # 見出しだけのような小さい部分は、次の区切りと合わせる（少しだけ chunk_tokens を超えてもよい）
+            if current and size + tokens > chunk_tokens and size >= chunk_tokens // 10:
+                chunks.append("".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += tokens
+            total += tokens
+    if current:
+        chunks.append("".join(current))
+    return chunks
@@ -1,10 +1,10 @@
 import datetime
-import json
 import feedparser
 import os
 from dotenv import load_dotenv
 import csv
 import requests
+from http_oriike import http_get
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
@@ -12,15 +12,17 @@ from openai import AzureOpenAI
 from pypdf import PdfReader
 from io import BytesIO
 import re
+from parallel_oriike import run_sources
+from isolation_oriike import SOURCE_TIMEOUT
+# 既存データは functions/ の取得関数と同じ記事データベースに保存する（JSON ファイルを毎回書き直さない）
+from utilities_oriike import load_existing_data, save_json
+from dedup_oriike import DedupIndex
 
 # .envから環境変数を読み込む
 load_dotenv()
 
 max_count = 20   # 取得するニュースの最大数
 
-# 実行日時を取得
-execution_timestamp = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=9))).strftime('%Y-%m-%d %H;%M;%S')
-
 # Seleniumのオプションを設定
 options = Options()
 options.add_argument("--headless")
@@ -62,18 +64,6 @@ def summarize_text(title, content):
         print(f"要約中にエラーが発生しました: {e}")
         return ""
 
-def load_existing_data(file_path):
-    """既存のJSONデータをロードします。"""
-    if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
-
-def save_json(data, file_path):
-    """データをJSONファイルに保存します。"""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-
 def is_pdf_link(url):
     """リンクがPDFファイルかどうかを判定します。"""
     return url.lower().endswith('.pdf')
@@ -81,7 +71,7 @@ def is_pdf_link(url):
 def extract_text_from_pdf(url):
     """PDFリンクからテキストを抽出します。"""
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         pdf_file = BytesIO(response.content)
         reader = PdfReader(pdf_file)
@@ -129,17 +119,18 @@ def remove_news_with_exception_keyword(news):
     return filtered_news
 
 # 以下の関数は、各官公庁の新着情報を取得するための関数です。
-def fetch_fsa_news():
+def fetch_fsa_news(execution_timestamp):
     """金融庁の新着情報を収集・要約します。"""
     url = "https://www.fsa.go.jp/fsaNewsListAll_rss2.xml"
     feed = feedparser.parse(url)
     json_file = f"./data/fsa-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"金融庁: 記事取得開始 - {entry.title}")
@@ -147,7 +138,7 @@ def fetch_fsa_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -169,6 +160,7 @@ def fetch_fsa_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"金融庁: 要約中にエラー発生 - {e}")
@@ -177,11 +169,12 @@ def fetch_fsa_news():
     return new_news
 
 
-def fetch_jma_news():
+def fetch_jma_news(execution_timestamp):
     """気象庁の新着情報を収集・要約します。"""
     url = "https://www.jma.go.jp/jma/press/kako.html?t=1&y=06"
     json_file = f"./data/jma.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -209,7 +202,7 @@ def fetch_jma_news():
             title = title_tag.get_text(strip=True)
             pub_date = li.get_text().split('　')[0]
 
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"気象庁: 記事取得開始 - {title}")
@@ -217,7 +210,7 @@ def fetch_jma_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     content = response.text
 
@@ -240,6 +233,7 @@ def fetch_jma_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"気象庁: 要約中にエラー発生 - {e}")
@@ -248,14 +242,15 @@ def fetch_jma_news():
     return news_items
 
 
-def fetch_jishinhonbu():
+def fetch_jishinhonbu(execution_timestamp):
     """地震本部の新着情報を収集・要約します。"""
     url = "https://www.jishin.go.jp/update/2024/"
     json_file = f"./data/jishinhonbu.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.encoding = 'UTF-8'
         soup = BeautifulSoup(response.text, 'html.parser')
     except Exception as e:
@@ -285,7 +280,7 @@ def fetch_jishinhonbu():
             link = "https://www.jishin.go.jp" + link
 
         # 既存のニュースに含まれているか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"地震本部: 記事取得開始 - {title}")
@@ -293,7 +288,7 @@ def fetch_jishinhonbu():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -316,6 +311,7 @@ def fetch_jishinhonbu():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"地震本部: 要約中にエラー発生 - {e}")
@@ -324,14 +320,15 @@ def fetch_jishinhonbu():
     return news_items
 
 
-def fetch_mlit_disaster_info():
+def fetch_mlit_disaster_info(execution_timestamp):
     """国土交通省の災害・防災情報を収集・要約します。"""
     url = "https://www.mlit.go.jp/saigai/index.html"
     json_file = f"./data/mlit_disaster.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.encoding = 'UTF-8'
         soup = BeautifulSoup(response.text, 'html.parser')
     except Exception as e:
@@ -369,7 +366,7 @@ def fetch_mlit_disaster_info():
             pub_date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
         # 既存のニュースに含まれているか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"国土交通省: 記事取得開始 - {title}")
@@ -377,7 +374,7 @@ def fetch_mlit_disaster_info():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -399,6 +396,7 @@ def fetch_mlit_disaster_info():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"国土交通省: 要約中にエラー発生 - {e}")
@@ -407,11 +405,12 @@ def fetch_mlit_disaster_info():
     return news_items
 
 
-def fetch_cao_kotsu():
+def fetch_cao_kotsu(execution_timestamp):
     """内閣府（交通安全対策）の新着情報を収集・要約します。"""
     url = "https://www8.cao.go.jp/koutu/news.html"
     json_file = "./data/cao_kotsu.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -453,7 +452,7 @@ def fetch_cao_kotsu():
                 link = "https://www8.cao.go.jp/koutu/" + link.lstrip('/')
 
             # 既存データに存在するかチェック
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在する場合はスキップ
 
             print(f"内閣府_交通安全対策: 記事取得開始 - {title}")
@@ -461,7 +460,7 @@ def fetch_cao_kotsu():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     content = response.text
 
@@ -483,6 +482,7 @@ def fetch_cao_kotsu():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"内閣府_交通安全対策: 要約中にエラー発生 - {e}")
@@ -491,11 +491,12 @@ def fetch_cao_kotsu():
     return news_items
 
 
-def fetch_nisc_news():
+def fetch_nisc_news(execution_timestamp):
     """NISCの新着情報を収集・要約します。"""
     url = "https://www.nisc.go.jp/news/list/index.html"
     json_file = "./data/nisc.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -538,7 +539,7 @@ def fetch_nisc_news():
         pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else "不明"
 
         # 既存のデータに存在する場合はスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"NISC: 記事取得開始 - {title}")
@@ -546,7 +547,7 @@ def fetch_nisc_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -568,6 +569,7 @@ def fetch_nisc_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"NISC: 要約中にエラー発生 - {e}")
@@ -576,11 +578,12 @@ def fetch_nisc_news():
     return news_items
 
 
-def fetch_mlit_jinji():
+def fetch_mlit_jinji(execution_timestamp):
     """国土交通省（人事異動）の最新情報を収集・要約します。"""
     url = "https://www.mlit.go.jp/about/R6jinji.html"  # 最新年度のURL
     json_file = f"./data/mlit_jinji.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -629,7 +632,7 @@ def fetch_mlit_jinji():
                 # 例: "令和６年１０月　１日付　（国土交通省第５０号）"
                 pub_date_text = entry_title.split('付')[0].strip() + '付'
 
-                if any(entry_title == item['title'] for item in existing_data):
+                if entry_title in seen:
                     continue  # 既に存在するニュースはスキップ
 
                 print(f"国土交通省: 記事取得開始 - {entry_title}")
@@ -638,7 +641,7 @@ def fetch_mlit_jinji():
                     if is_pdf_link(full_url):
                         content = extract_text_from_pdf(full_url)
                     else:
-                        response = requests.get(full_url)
+                        response = http_get(full_url)
                         response.encoding = 'UTF-8'
                         content = response.text
 
@@ -660,6 +663,7 @@ def fetch_mlit_jinji():
                     }
                     news_items.append(news_item)
                     existing_data.append(news_item)
+                    seen.add(news_item)
                     new_count += 1  # カウンターを増加
                 except Exception as e:
                     print(f"国土交通省: 要約中にエラー発生 - {e}")
@@ -670,11 +674,12 @@ def fetch_mlit_jinji():
     return news_items
 
 
-def fetch_cas_kyojin():
+def fetch_cas_kyojin(execution_timestamp):
     """内閣官房(国土強靭化)の新着情報を収集・要約します。"""
     url = "https://www.cas.go.jp/jp/seisaku/kokudo_kyoujinka/topics.html"
     json_file = f"./data/cas_kyojin.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
@@ -722,7 +727,7 @@ def fetch_cas_kyojin():
         title = a_tag.get_text(strip=True)
 
         # 既存データと照合
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"内閣官房_国土強靭化: 記事取得開始 - {title}")
@@ -730,7 +735,7 @@ def fetch_cas_kyojin():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -752,6 +757,7 @@ def fetch_cas_kyojin():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"内閣官房_国土強靭化: 要約中にエラー発生 - {e}")
@@ -760,11 +766,12 @@ def fetch_cas_kyojin():
     return new_news
 
 
-def fetch_nta_news():
+def fetch_nta_news(execution_timestamp):
     """国税庁の新着情報を収集・要約します。"""
     url = "https://www.nta.go.jp/information/release/index.htm"
     json_file = f"./data/nta.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -816,7 +823,7 @@ def fetch_nta_news():
                     link = "https://www.nta.go.jp/information/release/" + link
 
                 # 既存のデータと照合
-                if any(title == item['title'] for item in existing_data):
+                if title in seen:
                     continue  # 既に存在するニュースはスキップ
 
                 print(f"国税庁: 記事取得開始 - {title}")
@@ -824,7 +831,7 @@ def fetch_nta_news():
                     if is_pdf_link(link):
                         content = extract_text_from_pdf(link)
                     else:
-                        response = requests.get(link)
+                        response = http_get(link)
                         response.encoding = 'utf-8'
                         content = response.text
 
@@ -846,6 +853,7 @@ def fetch_nta_news():
                     }
                     new_news.append(news_item)
                     existing_data.append(news_item)
+                    seen.add(news_item)
                     new_count += 1  # カウンターを増加
                 except Exception as e:
                     print(f"国税庁: 要約中にエラー発生 - {e}")
@@ -857,11 +865,12 @@ def fetch_nta_news():
     return new_news
 
 
-def fetch_kensatsu_news():
+def fetch_kensatsu_news(execution_timestamp):
     """検察庁の最新情報を収集・要約します。"""
     url = "https://www.kensatsu.go.jp/rireki/index.shtml"
     json_file = f"./data/kensatsu.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -900,7 +909,7 @@ def fetch_kensatsu_news():
         # 日付形式に合わせてパース。例: "2023年10月01日"
         pub_date = pub_date_text.split('）')[-1].strip() if '）' in pub_date_text else pub_date_text
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"検察庁: 記事取得開始 - {title}")
@@ -908,7 +917,7 @@ def fetch_kensatsu_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -930,6 +939,7 @@ def fetch_kensatsu_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"検察庁: 要約中にエラー発生 - {e}")
@@ -938,11 +948,12 @@ def fetch_kensatsu_news():
     return new_news
 
 
-def fetch_courts_news():
+def fetch_courts_news(execution_timestamp):
     """裁判所の最新情報を収集・要約します。"""
     url = "https://www.courts.go.jp/news/index.html"
     json_file = f"./data/courts_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1006,7 +1017,7 @@ def fetch_courts_news():
             link = "https://www.courts.go.jp" + link[2:]
 
         # 既存データに存在するか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"裁判所: 記事取得開始 - {title}")
@@ -1014,7 +1025,7 @@ def fetch_courts_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 soup_link = BeautifulSoup(response.text, 'html.parser')
                 # ページから本文を抽出するロジックを適宜追加
@@ -1038,6 +1049,7 @@ def fetch_courts_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"裁判所: 要約中にエラー発生 - {e}")
@@ -1045,11 +1057,12 @@ def fetch_courts_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_jftc_news():
+def fetch_jftc_news(execution_timestamp):
     """公正取引委員会の最新情報を収集・要約します。"""
     url = "https://www.jftc.go.jp/index.html"
     json_file = f"./data/jftc.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1125,7 +1138,7 @@ def fetch_jftc_news():
             link = "https://www.jftc.go.jp" + link
 
         # 既存データと照合して新規か確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"公正取引委員会: 記事取得開始 - {title}")
@@ -1168,6 +1181,7 @@ def fetch_jftc_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"公正取引委員会: 要約中にエラー発生 - {e}")
@@ -1176,11 +1190,12 @@ def fetch_jftc_news():
     return news_items
 
 
-def fetch_ppc_news():
+def fetch_ppc_news(execution_timestamp):
     """個人情報保護委員会の最新情報を収集・要約します。"""
     url = "https://www.ppc.go.jp/information/"
     json_file = f"./data/ppc.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1224,7 +1239,7 @@ def fetch_ppc_news():
                 link = "https://www.ppc.go.jp" + link
 
             # 既存のデータに存在するかチェック
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"個人情報保護委員会: 記事取得開始 - {title}")
@@ -1232,7 +1247,7 @@ def fetch_ppc_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     content = response.text
 
@@ -1254,6 +1269,7 @@ def fetch_ppc_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"個人情報保護委員会: 要約中にエラー発生 - {e}")
@@ -1263,11 +1279,12 @@ def fetch_ppc_news():
     return news_items
 
 
-def fetch_env_news():
+def fetch_env_news(execution_timestamp):
     """環境省の新着情報を収集・要約します。"""
     url = "https://www.env.go.jp/press/index.html"
     json_file = f"./data/env.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1309,7 +1326,7 @@ def fetch_env_news():
                 link = "https://www.env.go.jp" + link
             title = title_tag.get_text(strip=True)
 
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"環境省: 記事取得開始 - {title}")
@@ -1317,7 +1334,7 @@ def fetch_env_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     content = response.text
 
@@ -1339,6 +1356,7 @@ def fetch_env_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"環境省: 要約中にエラー発生 - {e}")
@@ -1347,11 +1365,12 @@ def fetch_env_news():
     return news_items
 
 
-def fetch_road_to_l4_news():
+def fetch_road_to_l4_news(execution_timestamp):
     """Road-to-the-L4の新着情報を収集・要約します。"""
     url = "https://www.road-to-the-l4.go.jp/news/"
     json_file = "./data/road_to_l4.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1407,7 +1426,7 @@ def fetch_road_to_l4_news():
             link = url  # メインニュースページへのリンク
 
         # 既存データに存在するか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"Road-to-the-L4: 記事取得開始 - {title}")
@@ -1415,7 +1434,7 @@ def fetch_road_to_l4_news():
             if is_pdf_link(link):
                 content_text = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content_text = response.text
 
@@ -1437,6 +1456,7 @@ def fetch_road_to_l4_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"Road-to-the-L4: 要約中にエラー発生 - {e}")
@@ -1445,11 +1465,12 @@ def fetch_road_to_l4_news():
     return new_news
 
 
-def fetch_statistics_bureau_news():
+def fetch_statistics_bureau_news(execution_timestamp):
     """総務省統計局の新着情報を収集・要約します。"""
     url = "https://www.stat.go.jp/whatsnew/index.html"
     json_file = "./data/statistics_bureau.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -1509,7 +1530,7 @@ def fetch_statistics_bureau_news():
                             title = a_tag.get_text(strip=True).replace("NEW", "").strip()
 
                             # 既存データに存在するか確認
-                            if any(item['title'] == title for item in existing_data):
+                            if title in seen:
                                 continue  # 既に存在するニュースはスキップ
 
                             print(f"統計局: 記事取得開始 - {title}")
@@ -1517,7 +1538,7 @@ def fetch_statistics_bureau_news():
                                 if is_pdf_link(link):
                                     content = extract_text_from_pdf(link)
                                 else:
-                                    response = requests.get(link)
+                                    response = http_get(link)
                                     response.encoding = response.apparent_encoding
                                     content = response.text
 
@@ -1539,6 +1560,7 @@ def fetch_statistics_bureau_news():
                                 }
                                 news_items.append(news_item)
                                 existing_data.append(news_item)
+                                seen.add(news_item)
                                 new_count += 1
                             except Exception as e:
                                 print(f"統計局: 要約中にエラー発生 - {e}")
@@ -1548,18 +1570,19 @@ def fetch_statistics_bureau_news():
     return news_items
 
 
-def fetch_mlit_news():
+def fetch_mlit_news(execution_timestamp):
     """国土交通省の新着情報を収集・要約します。"""
     url = "https://www.mlit.go.jp/pressrelease.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/mlit-pressrelease.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"国土交通省_プレスリリース: 記事取得開始 - {entry.title}")
@@ -1567,7 +1590,7 @@ def fetch_mlit_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -1589,6 +1612,7 @@ def fetch_mlit_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"国土交通省_プレスリリース: 要約中にエラー発生 - {e}")
@@ -1597,19 +1621,20 @@ def fetch_mlit_news():
     return new_news
 
 
-def fetch_mlit_kisha_news():
+def fetch_mlit_kisha_news(execution_timestamp):
     """国土交通省_記者会見の新着情報を収集・要約します。"""
     url = "https://www.mlit.go.jp/index.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/mlit_kisha.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data, ('title', 'pubDate'))
 
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
         # 既に存在するニュース(タイトルが同じかつ更新日時が同じ場合)はスキップ
-        if any(entry.title + entry.updated == item['title'] + item['pubDate'] for item in existing_data):
+        if (entry.title, entry.updated) in seen:
             continue
 
         print(f"国土交通省_記者会見: 記事取得開始 - {entry.title}, {entry.updated}")
@@ -1618,7 +1643,7 @@ def fetch_mlit_kisha_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -1642,6 +1667,7 @@ def fetch_mlit_kisha_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -1652,17 +1678,18 @@ def fetch_mlit_kisha_news():
     return new_news
 
 
-def fetch_mof_news():
+def fetch_mof_news(execution_timestamp):
     """財務省の新着情報を収集・要約します。"""
     url = "https://www.mof.go.jp/news.rss"  # 財務省のRSSフィードURL
     feed = feedparser.parse(url)
     json_file = f"./data/mof-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # 新規ニュースのカウンター
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"財務省: 記事取得開始 - {entry.title}")
@@ -1670,7 +1697,7 @@ def fetch_mof_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1692,6 +1719,7 @@ def fetch_mof_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"財務省: 要約中にエラー発生 - {e}")
@@ -1700,17 +1728,18 @@ def fetch_mof_news():
     return new_news
 
 
-def fetch_kantei_news():
+def fetch_kantei_news(execution_timestamp):
     """首相官邸の最新情報を収集・要約します。"""
     url = "https://www.kantei.go.jp/index-jnews.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/kantei.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"首相官邸: 記事取得開始 - {entry.title}")
@@ -1719,7 +1748,7 @@ def fetch_kantei_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1741,6 +1770,7 @@ def fetch_kantei_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"首相官邸: 要約中にエラー発生 - {e}")
@@ -1748,11 +1778,12 @@ def fetch_kantei_news():
     save_json(existing_data, json_file)
     return new_news
 
-def fetch_cao_hodo_news():
+def fetch_cao_hodo_news(execution_timestamp):
     """内閣府_報道発表の新着情報を収集・要約します。"""
     url = "https://www.cao.go.jp/rss/news.rdf"
     json_file = f"./data/cao-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     feed = feedparser.parse(url)
     new_news = []
@@ -1760,7 +1791,7 @@ def fetch_cao_hodo_news():
 
     for entry in feed.entries:
         # タイトルが既に存在する場合はスキップ
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue
 
         print(f"内閣府_報道発表: 記事取得開始 - {entry.title}")
@@ -1769,7 +1800,7 @@ def fetch_cao_hodo_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1794,6 +1825,7 @@ def fetch_cao_hodo_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -1803,18 +1835,19 @@ def fetch_cao_hodo_news():
     return new_news
 
 
-def fetch_npa_news():
+def fetch_npa_news(execution_timestamp):
     """警察庁の最新情報を収集・要約します。"""
     url = "https://www.npa.go.jp/newlyarrived/rss20.xml"
     json_file = f"./data/npa-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     feed = feedparser.parse(url)
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"警察庁: 記事取得開始 - {entry.title}")
@@ -1822,7 +1855,7 @@ def fetch_npa_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1844,6 +1877,7 @@ def fetch_npa_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"警察庁: 要約中にエラー発生 - {e}")
@@ -1852,17 +1886,18 @@ def fetch_npa_news():
     return new_news
 
 
-def fetch_fdma_news():
+def fetch_fdma_news(execution_timestamp):
     """消防庁の最新情報を収集・要約します。"""
     url = "https://www.fdma.go.jp/index.xml"
     feed = feedparser.parse(url)
     json_file = f"./data/fdma.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"消防庁: 記事取得開始 - {entry.title}")
@@ -1871,7 +1906,7 @@ def fetch_fdma_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1908,6 +1943,7 @@ def fetch_fdma_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"消防庁: 要約中にエラー発生 - {e}")
@@ -1915,17 +1951,18 @@ def fetch_fdma_news():
     save_json(existing_data, json_file)
     return new_news
 
-def fetch_mhlw_news():
+def fetch_mhlw_news(execution_timestamp):
     """厚生労働省の新着情報を収集・要約します。"""
     url = "https://www.mhlw.go.jp/stf/news.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/mhlw-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"厚生労働省: 記事取得開始 - {entry.title}")
@@ -1933,7 +1970,7 @@ def fetch_mhlw_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -1955,6 +1992,7 @@ def fetch_mhlw_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"厚生労働省: 要約中にエラー発生 - {e}")
@@ -1962,17 +2000,18 @@ def fetch_mhlw_news():
     save_json(existing_data, json_file)
     return new_news
 
-def fetch_mhlw_kinkyu_news():
+def fetch_mhlw_kinkyu_news(execution_timestamp):
     """厚生労働省の緊急情報を収集・要約します。"""
     url = "https://www.mhlw.go.jp/stf/kinkyu.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/mhlw_kinkyu.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"厚生労働省_緊急情報: 記事取得開始 - {entry.title}")
@@ -1980,7 +2019,7 @@ def fetch_mhlw_kinkyu_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 # 厚生労働省のページから本文を抽出（適宜調整が必要）
@@ -2012,6 +2051,7 @@ def fetch_mhlw_kinkyu_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"厚生労働省_緊急情報: 要約中にエラー発生 - {e}")
@@ -2020,17 +2060,18 @@ def fetch_mhlw_kinkyu_news():
     return new_news
 
 
-def fetch_meti_news():
+def fetch_meti_news(execution_timestamp):
     """経済産業省の新着情報を収集・要約します。"""
     url = "https://www.meti.go.jp/ml_index_release_atom.xml"
     feed = feedparser.parse(url)
     json_file = f"./data/meti.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"経済産業省: 記事取得開始 - {entry.title}")
@@ -2047,23 +2088,25 @@ def fetch_meti_news():
         }
         new_news.append(news_item)
         existing_data.append(news_item)
+        seen.add(news_item)
 
     save_json(existing_data, json_file)
     return new_news
 
 
-def fetch_e_gov_news():
+def fetch_e_gov_news(execution_timestamp):
     """e-Govポータルの最新情報を収集・要約します。"""
     url = "https://www.e-gov.go.jp/news/news.xml"  # e-GovポータルのRSSフィードURL
     feed = feedparser.parse(url)
     json_file = f"./data/e_gov-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"e-Govポータル: 記事取得開始 - {entry.title}")
@@ -2071,7 +2114,7 @@ def fetch_e_gov_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 # 要約に必要な本文を抽出（具体的なHTML構造に応じて調整）
@@ -2100,6 +2143,7 @@ def fetch_e_gov_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"e-Govポータル: 要約中にエラー発生 - {e}")
@@ -2108,18 +2152,19 @@ def fetch_e_gov_news():
     return new_news
 
 
-def fetch_egov_comments():
+def fetch_egov_comments(execution_timestamp):
     """e-Govパブリックコメントの新着情報を収集・要約します。"""
     url = "https://public-comment.e-gov.go.jp/rss/pcm_list.xml"
     feed = feedparser.parse(url)
     json_file = "./data/egov.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_comments = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するコメントはスキップ
 
         print(f"e-Gov: 記事取得開始 - {entry.title}")
@@ -2127,7 +2172,7 @@ def fetch_egov_comments():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 # 必要に応じて特定の要素を抽出
@@ -2154,6 +2199,7 @@ def fetch_egov_comments():
             }
             new_comments.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -2163,19 +2209,20 @@ def fetch_egov_comments():
     return new_comments
 
 
-def fetch_moj_news():
+def fetch_moj_news(execution_timestamp):
     """法務省の新着情報を収集・要約します。"""
     url = "https://www.moj.go.jp/news.xml"
     feed = feedparser.parse(url)
     json_file = "./data/moj-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # 新しい記事のカウンター
 
     for entry in feed.entries:
         # 既に存在するニュースはスキップ
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue
 
         print(f"法務省: 記事取得開始 - {entry.title}")
@@ -2184,7 +2231,7 @@ def fetch_moj_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -2210,6 +2257,7 @@ def fetch_moj_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"法務省: 要約中にエラー発生 - {e}")
@@ -2218,18 +2266,19 @@ def fetch_moj_news():
     return new_news
 
 
-def fetch_gsi_news():
+def fetch_gsi_news(execution_timestamp):
     """国土地理院の新着情報を収集・要約します。"""
     url = "https://www.gsi.go.jp/index.rdf"
     json_file = f"./data/gsi-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     feed = feedparser.parse(url)
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"国土地理院: 記事取得開始 - {entry.title}")
@@ -2237,7 +2286,7 @@ def fetch_gsi_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 # ページのテキスト部分を抽出（適宜調整が必要です）
@@ -2261,6 +2310,7 @@ def fetch_gsi_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"国土地理院: 要約中にエラー発生 - {e}")
@@ -2269,18 +2319,19 @@ def fetch_gsi_news():
     return new_news
 
 
-def fetch_caa_news():
+def fetch_caa_news(execution_timestamp):
     """消費者庁の新着情報を収集・要約します。"""
     url = "https://www.caa.go.jp/news.rss"
     json_file = f"./data/caa-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     feed = feedparser.parse(url)
     new_news = []
     new_count = 0  # カウンターを追加
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"消費者庁: 記事取得開始 - {entry.title}")
@@ -2288,7 +2339,7 @@ def fetch_caa_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -2310,6 +2361,7 @@ def fetch_caa_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"消費者庁: 要約中にエラー発生 - {e}")
@@ -2318,19 +2370,20 @@ def fetch_caa_news():
     return new_news
 
 
-def fetch_digital_agency_news():
+def fetch_digital_agency_news(execution_timestamp):
     """デジタル庁の新着情報を収集・要約します。"""
     url = "https://www.digital.go.jp/rss/news.xml"
     feed = feedparser.parse(url)
     json_file = f"./data/digital_agency_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     exception_category = ["組織情報","申請・届出","採用","調達情報"]
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         if entry.category in exception_category:
@@ -2342,7 +2395,7 @@ def fetch_digital_agency_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.raise_for_status()
                 response.encoding = 'utf-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -2374,6 +2427,7 @@ def fetch_digital_agency_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"デジタル庁: 要約中にエラー発生 - {e}")
@@ -2384,11 +2438,12 @@ def fetch_digital_agency_news():
 
 # 以下の関数は、各保険会社の新着情報を取得するための関数です。
 
-def fetch_aioi_news():
+def fetch_aioi_news(execution_timestamp):
     """あいおいニッセイ同和損害保険株式会社の最新ニュースを収集・要約します。"""
     url = "https://www.aioinissaydowa.co.jp/corporate/about/news/"
     json_file = f"./data/aioi_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2434,7 +2489,7 @@ def fetch_aioi_news():
             link = url + link
 
         # 既存のデータに存在する場合はスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"あいおいニッセイ同和損害保険: 記事取得開始 - {title}")
@@ -2443,7 +2498,7 @@ def fetch_aioi_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -2465,6 +2520,7 @@ def fetch_aioi_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"あいおいニッセイ同和損害保険: 要約中にエラー発生 - {e}")
@@ -2473,11 +2529,12 @@ def fetch_aioi_news():
     return news_items
 
 
-def fetch_axadirect_pr():
+def fetch_axadirect_pr(execution_timestamp):
     """アクサダイレクトのプレスリリースを収集・要約します。"""
     url = "https://www.axa-direct.co.jp/company/official_info/pr/"
     json_file = f"./data/axa_direct_pr.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2517,7 +2574,7 @@ def fetch_axadirect_pr():
         date_tag = a_tag.find('p', class_='releaseList-item-link-date')
         pub_date = date_tag.get_text(strip=True) if date_tag else "不明"
 
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"アクサダイレクト_プレスリリース: 記事取得開始 - {title}")
@@ -2526,7 +2583,7 @@ def fetch_axadirect_pr():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -2549,6 +2606,7 @@ def fetch_axadirect_pr():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -2557,11 +2615,12 @@ def fetch_axadirect_pr():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_axa_news():
+def fetch_axa_news(execution_timestamp):
     """アクサ損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.axa-direct.co.jp/company/official_info/announce/"
     json_file = "./data/axa_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2606,7 +2665,7 @@ def fetch_axa_news():
         pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ''
 
         # 既存データとの重複チェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"AXA: 記事取得開始 - {title}")
@@ -2614,7 +2673,7 @@ def fetch_axa_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -2636,6 +2695,7 @@ def fetch_axa_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"AXA_お知らせ: 要約中にエラー発生 - {e}")
@@ -2643,11 +2703,12 @@ def fetch_axa_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_americanhome_news():
+def fetch_americanhome_news(execution_timestamp):
     """アメリカンホーム医療・損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www2.americanhome.co.jp/v2/news/"
     json_file = f"./data/americanhome_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2687,7 +2748,7 @@ def fetch_americanhome_news():
             link = "https://www2.americanhome.co.jp" + link
 
         # 既に存在するニュースはスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"アメリカンホーム: 記事取得開始 - {title}")
@@ -2695,7 +2756,7 @@ def fetch_americanhome_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -2726,6 +2787,7 @@ def fetch_americanhome_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"アメリカンホーム: 要約中にエラー発生 - {e}")
@@ -2735,11 +2797,12 @@ def fetch_americanhome_news():
 
 
 
-def fetch_aig_news():
+def fetch_aig_news(execution_timestamp):
     """AIG損害保険株式会社の最新ニュースを収集・要約します。"""
     url = "https://www.aig.co.jp/sonpo/company/news"
     json_file = "./data/aig_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
     
     # ディレクトリが存在しない場合は作成
     os.makedirs(os.path.dirname(json_file), exist_ok=True)
@@ -2783,7 +2846,7 @@ def fetch_aig_news():
         pub_date = article.find('div', class_='cmp-newslist-item__date').get_text(strip=True)
 
         # 既存のデータにタイトルが存在する場合はスキップ
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue
 
         print(f"AIG損保: 記事取得開始 - {title}")
@@ -2792,7 +2855,7 @@ def fetch_aig_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # 本文の抽出方法はページの構造に依存します。適宜調整してください。
@@ -2823,6 +2886,7 @@ def fetch_aig_news():
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -2833,11 +2897,12 @@ def fetch_aig_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_edsp_news():
+def fetch_edsp_news(execution_timestamp):
     """イーデザイン損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.e-design.net/company/news/2024/"
     json_file = f"./data/edsp.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2877,7 +2942,7 @@ def fetch_edsp_news():
             pub_date = ""
 
         # 既に存在するニュースはスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"イーデザイン損害保険株式会社: 記事取得開始 - {title}")
@@ -2885,7 +2950,7 @@ def fetch_edsp_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = response.apparent_encoding
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # ニュース記事の内容を取得
@@ -2916,6 +2981,7 @@ def fetch_edsp_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"イーデザイン損害保険株式会社: 要約中にエラー発生 - {e}")
@@ -2923,11 +2989,12 @@ def fetch_edsp_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_hs_news():
+def fetch_hs_news(execution_timestamp):
     """エイチ・エス損害保険の最新情報を収集・要約します。"""
     url = "https://www.hs-sonpo.co.jp/news/"
     json_file = "./data/hs.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -2978,7 +3045,7 @@ def fetch_hs_news():
             title = p_tag.get_text(strip=True) if p_tag else ""
 
             # 既存データに存在するか確認
-            if any(item['title'] == title for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"HS損保: 記事取得開始 - {title}")
@@ -2987,7 +3054,7 @@ def fetch_hs_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.raise_for_status()
                     response.encoding = 'utf-8'
                     detail_soup = BeautifulSoup(response.text, 'html.parser')
@@ -3014,6 +3081,7 @@ def fetch_hs_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1
             except Exception as e:
                 print(f"HS損保: 要約中にエラー発生 - {e}")
@@ -3024,11 +3092,12 @@ def fetch_hs_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_au_news():
+def fetch_au_news(execution_timestamp):
     """au損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.au-sonpo.co.jp/corporate/news/"
     json_file = f"./data/au_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3071,7 +3140,7 @@ def fetch_au_news():
             pub_date = ""
 
         # 既存データに存在する場合はスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"au損害保険: 記事取得開始 - {title}")
@@ -3079,7 +3148,7 @@ def fetch_au_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = response.apparent_encoding  # 正しいエンコーディングを自動検出
                 content = response.text
 
@@ -3101,6 +3170,7 @@ def fetch_au_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -3109,11 +3179,12 @@ def fetch_au_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_sbi_press():
+def fetch_sbi_press(execution_timestamp):
     """SBI損害保険の最新プレスリリースを収集・要約します。"""
     url = "https://www.sbisonpo.co.jp/company/news/"
     json_file = f"./data/sbi_press.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3154,7 +3225,7 @@ def fetch_sbi_press():
             link = f"https://www.sbisonpo.co.jp{link}"
 
         # 既存のニュースと重複しているかチェック
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 重複している場合はスキップ
 
         print(f"SBI損保_press: 記事取得開始 - {title}")
@@ -3163,7 +3234,7 @@ def fetch_sbi_press():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'shift_jis'  # ページのエンコーディングに合わせる
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # コンテンツを抽出（適宜変更が必要です）
@@ -3192,6 +3263,7 @@ def fetch_sbi_press():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -3201,11 +3273,12 @@ def fetch_sbi_press():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_sbi_news():
+def fetch_sbi_news(execution_timestamp):
     """SBI損害保険株式会社のお知らせを収集・要約します。"""
     url = "https://www.sbisonpo.co.jp/company/information/"
     json_file = "./data/sbi_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3245,7 +3318,7 @@ def fetch_sbi_news():
             link = f"https://www.sbisonpo.co.jp{link}"
 
         # 既存のニュースと重複しているかチェック
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 重複している場合はスキップ
 
         print(f"SBI損保_news: 記事取得開始 - {title}")
@@ -3254,7 +3327,7 @@ def fetch_sbi_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'shift_jis'  # ページのエンコーディングに合わせる
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # コンテンツを抽出（適宜変更が必要です）
@@ -3283,6 +3356,7 @@ def fetch_sbi_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
 
@@ -3292,14 +3366,15 @@ def fetch_sbi_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_cardif_news():
+def fetch_cardif_news(execution_timestamp):
     """カーディフ損害保険の最新情報を収集・要約します。"""
     url = "https://nonlife.cardif.co.jp/company/news/release"
     json_file = "./data/cardif_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
     except Exception as e:
@@ -3324,7 +3399,7 @@ def fetch_cardif_news():
         link = a_tag.get('href')
 
         # 既存のデータと重複していないか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"新しいニュースを検出: {title}")
@@ -3333,7 +3408,7 @@ def fetch_cardif_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -3356,6 +3431,7 @@ def fetch_cardif_news():
             
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"ニュース処理中にエラーが発生しました: {e}")
@@ -3363,11 +3439,12 @@ def fetch_cardif_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_capital_sonpo_news():
+def fetch_capital_sonpo_news(execution_timestamp):
     """キャピタル損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.capital-sonpo.co.jp/"  # 最新情報ページのURLに置き換えてください
     json_file = f"./data/capital_sonpo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3404,7 +3481,7 @@ def fetch_capital_sonpo_news():
         pub_date_tag = li.find('span', class_='date')  # 日付を含むタグのクラス名に置き換えてください
         pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else "不明"
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"キャピタル損害保険株式会社: 記事取得開始 - {title}")
@@ -3412,7 +3489,7 @@ def fetch_capital_sonpo_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'  # エンコーディングを必要に応じて調整
                 content_soup = BeautifulSoup(response.text, 'html.parser')
                 # 記事内容を含むセクションを特定します。以下は仮のセレクターです。
@@ -3438,6 +3515,7 @@ def fetch_capital_sonpo_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"キャピタル損害保険株式会社: 要約中にエラー発生 - {e}")
@@ -3446,11 +3524,12 @@ def fetch_capital_sonpo_news():
     return news_items
 
 
-def fetch_hdmf_news():
+def fetch_hdmf_news(execution_timestamp):
     """現代海上火災保険株式会社の最新情報を収集・要約します。"""
     url = "http://www.hdinsurance.co.jp/"
     json_file = f"./data/hdmf.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3481,7 +3560,7 @@ def fetch_hdmf_news():
         # 必要に応じて日付の解析を追加
         pub_date = "不明"
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"現代海上火災保険: 記事取得開始 - {title}")
@@ -3489,7 +3568,7 @@ def fetch_hdmf_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'shift_jis'
                 content = response.text
 
@@ -3511,6 +3590,7 @@ def fetch_hdmf_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"現代海上火災保険: 要約中にエラー発生 - {e}")
@@ -3518,11 +3598,12 @@ def fetch_hdmf_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_newindia_news():
+def fetch_newindia_news(execution_timestamp):
     """ザ・ニュー・インディア・アシュアランス・カンパニー・リミテッドの最新情報を収集・要約します。"""
     url = "https://www.newindia.co.jp/topics/"  # 最新情報ページのURLを指定
     json_file = f"./data/newindia.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3570,7 +3651,7 @@ def fetch_newindia_news():
         elif not link.startswith('http'):
             link = "https://www.newindia.co.jp/" + link
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"ニューインディア: 記事取得開始 - {title}")
@@ -3578,7 +3659,7 @@ def fetch_newindia_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -3610,6 +3691,7 @@ def fetch_newindia_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"ニューインディア: 要約中にエラー発生 - {e}")
@@ -3617,11 +3699,12 @@ def fetch_newindia_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_jai_news():
+def fetch_jai_news(execution_timestamp):
     """ジェイアイ傷害火災保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.jihoken.co.jp/whats/wh_index.html"
     json_file = "./data/jai_insurance.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3660,7 +3743,7 @@ def fetch_jai_news():
         pub_date = li.get_text().split('　')[0].strip()  # 仮に日付がタイトルの前にある場合
 
         # 既存データに存在するかチェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"JAI傷害火災保険: 記事取得開始 - {title}")
@@ -3668,7 +3751,7 @@ def fetch_jai_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -3690,6 +3773,7 @@ def fetch_jai_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"JAI傷害火災保険: 要約中にエラー発生 - {e}")
@@ -3697,11 +3781,12 @@ def fetch_jai_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_starr_news():
+def fetch_starr_news(execution_timestamp):
     """スター・インデムニティ・アンド・ライアビリティ・カンパニーの最新情報を収集・要約します。"""
     url = "https://www.starrcompanies.jp/News"
     json_file = "./data/starr_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3738,7 +3823,7 @@ def fetch_starr_news():
         title = a_tag.get_text(strip=True)
         pub_date = datetime.datetime.now().strftime("%Y-%m-%d")  # 公開日が明示されていないため、現在の日付を使用
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"スター保険会社: 記事取得開始 - {title}")
@@ -3746,7 +3831,7 @@ def fetch_starr_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 response.encoding = 'utf-8'
                 page_soup = BeautifulSoup(response.text, 'html.parser')
@@ -3773,6 +3858,7 @@ def fetch_starr_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"スター保険会社: 要約中にエラー発生 - {e}")
@@ -3783,11 +3869,12 @@ def fetch_starr_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_secom_news():
+def fetch_secom_news(execution_timestamp):
     """セコム損害保険株式会社のお知らせから最新情報を収集・要約します。"""
     url = "https://www.secom-sonpo.co.jp/infolist/"
     json_file = "./data/secom.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3827,7 +3914,7 @@ def fetch_secom_news():
                 link = "https://www.secom-sonpo.co.jp" + link
 
             # 既に存在するニュースはスキップ
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue
 
             print(f"セコム: 記事取得開始 - {title}")
@@ -3835,7 +3922,7 @@ def fetch_secom_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     page_soup = BeautifulSoup(response.text, 'html.parser')
                     # コンテンツの抽出方法は実際のページ構造に基づいて調整してください
@@ -3863,6 +3950,7 @@ def fetch_secom_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"セコム: 要約中にエラー発生 - {e}")
@@ -3871,11 +3959,12 @@ def fetch_secom_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_secom_product_news():
+def fetch_secom_product_news(execution_timestamp):
     """セコム損害保険の最新情報を収集・要約します。"""
     url = "https://www.secom-sonpo.co.jp/service-infolist/"
     json_file = f"./data/secom_product_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3918,7 +4007,7 @@ def fetch_secom_product_news():
             title = a_tag.get_text(strip=True)
 
             # 既に存在するニュースはスキップ
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue
 
             print(f"セコム損害保険_product_news: 記事取得開始 - {title}")
@@ -3926,7 +4015,7 @@ def fetch_secom_product_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'utf-8'
                     content_soup = BeautifulSoup(response.text, 'html.parser')
                     # 必要なコンテンツを抽出（例として本文を全て取得）
@@ -3950,6 +4039,7 @@ def fetch_secom_product_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
 
 
@@ -3960,11 +4050,12 @@ def fetch_secom_product_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_zenkankyo_reiwa_news():
+def fetch_zenkankyo_reiwa_news(execution_timestamp):
     """全管協れいわ損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.zkreiwa-sonpo.co.jp/"
     json_file = f"./data/zkreiwa_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -3999,7 +4090,7 @@ def fetch_zenkankyo_reiwa_news():
         pub_date = date_tag.get_text(strip=True)
 
         # 既に存在するニュースはスキップ
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue
 
         print(f"全管協れいわ損害保険株式会社: 記事取得開始 - {title}")
@@ -4008,7 +4099,7 @@ def fetch_zenkankyo_reiwa_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 response.encoding = 'utf-8'
                 content_soup = BeautifulSoup(response.text, 'html.parser')
@@ -4037,6 +4128,7 @@ def fetch_zenkankyo_reiwa_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
@@ -4046,11 +4138,12 @@ def fetch_zenkankyo_reiwa_news():
     return news_items
 
 
-def fetch_sonysonpo_news():
+def fetch_sonysonpo_news(execution_timestamp):
     """ソニー損害保険株式会社（お知らせ）の最新情報を収集・要約します。"""
     url = "https://from.sonysonpo.co.jp/topics/information/N0086000.html"
     json_file = "./data/sonysonpo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4087,7 +4180,7 @@ def fetch_sonysonpo_news():
                 pub_date = datetime.datetime.now().strftime("%Y-%m-%d")
 
             # 重複チェック
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"ソニー損保: 記事取得開始 - {title}")
@@ -4095,7 +4188,7 @@ def fetch_sonysonpo_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'utf-8'
                     content_soup = BeautifulSoup(response.text, 'html.parser')
                     # ニュース内容を抽出（適宜調整が必要）
@@ -4119,6 +4212,7 @@ def fetch_sonysonpo_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"ソニー損保: 要約中にエラー発生 - {e}")
@@ -4146,7 +4240,7 @@ def fetch_sonysonpo_news():
                     pub_date = datetime.datetime.now().strftime("%Y-%m-%d")
 
                 # 重複チェック
-                if any(title == item['title'] for item in existing_data):
+                if title in seen:
                     continue  # 既に存在するニュースはスキップ
 
                 print(f"ソニー損保: 記事取得開始 - {title}")
@@ -4154,7 +4248,7 @@ def fetch_sonysonpo_news():
                     if is_pdf_link(link):
                         content = extract_text_from_pdf(link)
                     else:
-                        response = requests.get(link)
+                        response = http_get(link)
                         response.encoding = 'utf-8'
                         content_soup = BeautifulSoup(response.text, 'html.parser')
                         # ニュース内容を抽出（適宜調整が必要）
@@ -4178,6 +4272,7 @@ def fetch_sonysonpo_news():
                     }
                     news_items.append(news_item)
                     existing_data.append(news_item)
+                    seen.add(news_item)
                     new_count += 1  # カウンターを増加
                 except Exception as e:
                     print(f"ソニー損保: 要約中にエラー発生 - {e}")
@@ -4186,11 +4281,12 @@ def fetch_sonysonpo_news():
     return news_items
 
 
-def fetch_sonysonpo_news_release():
+def fetch_sonysonpo_news_release(execution_timestamp):
     """ソニー損害保険株式会社の最新ニュースを収集・要約します。"""
     url = "https://from.sonysonpo.co.jp/topics/news/2024/"
     json_file = f"./data/sonysonpo_news_release.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4231,7 +4327,7 @@ def fetch_sonysonpo_news_release():
             link = "https://from.sonysonpo.co.jp" + link
 
         # 既存のデータに存在するか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"ソニー損保_news_release: 記事取得開始 - {title}")
@@ -4239,7 +4335,7 @@ def fetch_sonysonpo_news_release():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # ニュース内容がどのタグにあるかに応じて適宜変更してください
@@ -4268,6 +4364,7 @@ def fetch_sonysonpo_news_release():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
 
@@ -4277,11 +4374,12 @@ def fetch_sonysonpo_news_release():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_sonpohogo_news():
+def fetch_sonpohogo_news(execution_timestamp):
     """損害保険契約者保護機構の最新情報を収集・要約します。"""
     url = "http://www.sonpohogo.or.jp/"  # 最新情報ページのURLを設定
     json_file = "./data/sonpohogo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4331,7 +4429,7 @@ def fetch_sonpohogo_news():
             link = ""
 
         # 既存のデータに存在するかチェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"損保機構: 記事取得開始 - {title}")
@@ -4342,7 +4440,7 @@ def fetch_sonpohogo_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'EUC-JP'  # ソースがEUC-JPエンコーディングのため
                     content = response.text
 
@@ -4364,6 +4462,7 @@ def fetch_sonpohogo_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
 
         except Exception as e:
             print(f"損保機構: 要約中にエラー発生 - {e}")
@@ -4371,18 +4470,19 @@ def fetch_sonpohogo_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_sompo_news():
+def fetch_sompo_news(execution_timestamp):
     """損害保険ジャパン株式会社の最新情報を収集・要約します。"""
     url = "https://www.sompo-japan.co.jp/rss/news/"
     feed = feedparser.parse(url)
     json_file = f"./data/sompo-japan-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # 新しいニュースのカウンター
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"損害保険ジャパン: 記事取得開始 - {entry.title}")
@@ -4392,7 +4492,7 @@ def fetch_sompo_news():
             if is_pdf_link(link): # URLのクエリパラメータを削除
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content_soup = BeautifulSoup(response.text, 'html.parser')
                 # ニュース内容を抽出（適宜調整が必要）
@@ -4417,6 +4517,7 @@ def fetch_sompo_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"損害保険ジャパン: 要約中にエラー発生 - {e}")
@@ -4424,11 +4525,12 @@ def fetch_sompo_news():
     save_json(existing_data, json_file)
     return new_news
 
-def fetch_sompo_direct_news():
+def fetch_sompo_direct_news(execution_timestamp):
     """SOMPOダイレクト損害保険株式会社のニュースリリースから新着情報を収集・要約します。"""
     url = "https://news-ins-saison.dga.jp/topics/?type=news"
     json_file = f"./data/sompo_direct_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4475,7 +4577,7 @@ def fetch_sompo_direct_news():
         title = summary_text.split(' ', 1)[0]  # タイトルの抽出方法は適宜調整してください
 
         # 既存のデータと重複チェック
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"SOMPO_direct_news: 記事取得開始 - {title}")
@@ -4484,7 +4586,7 @@ def fetch_sompo_direct_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = response.apparent_encoding
                 content = response.text
 
@@ -4517,6 +4619,7 @@ def fetch_sompo_direct_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"SOMPO_direct_news: 要約中にエラー発生 - {e}")
@@ -4524,11 +4627,12 @@ def fetch_sompo_direct_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_sompo_direct_important_news():
+def fetch_sompo_direct_important_news(execution_timestamp):
     """SOMPOダイレクトの大切なお知らせを収集・要約します。"""
     url = "https://news-ins-saison.dga.jp/topics/?type=important"
     json_file = f"./data/sompo_direct_important_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4575,7 +4679,7 @@ def fetch_sompo_direct_important_news():
         title = summary_text.split(' ', 1)[0]  # タイトルの抽出方法は適宜調整してください
 
         # 既存のデータと重複チェック
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"SOMPO_direct_important_news: 記事取得開始 - {title}")
@@ -4584,7 +4688,7 @@ def fetch_sompo_direct_important_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = response.apparent_encoding
                 content = response.text
 
@@ -4617,6 +4721,7 @@ def fetch_sompo_direct_important_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"SOMPO_direct_important_news: 要約中にエラー発生 - {e}")
@@ -4625,11 +4730,12 @@ def fetch_sompo_direct_important_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_daidokasai_news():
+def fetch_daidokasai_news(execution_timestamp):
     """大同火災海上保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.daidokasai.co.jp/news/"
     json_file = "./data/daidokasai_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4673,7 +4779,7 @@ def fetch_daidokasai_news():
         category = badge.get_text(strip=True) if badge else "その他"
 
         # 既に存在するニュースか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在する場合はスキップ
 
         print(f"新規記事取得: {title}")
@@ -4682,7 +4788,7 @@ def fetch_daidokasai_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # 主要な記事コンテンツを抽出（適宜調整が必要）
@@ -4712,6 +4818,7 @@ def fetch_daidokasai_news():
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -4721,11 +4828,12 @@ def fetch_daidokasai_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_chubb_news():
+def fetch_chubb_news(execution_timestamp):
     """Chubb損害保険株式会社のお知らせページから最新情報を収集・要約します。"""
     url = "https://www.chubb.com/jp-jp/news/news-info.html"
     json_file = f"./data/chubb_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4776,7 +4884,7 @@ def fetch_chubb_news():
             link = "https://www.chubb.com" + link
 
         # 既存のデータに含まれているか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"Chubb_news: 記事取得開始 - {title}")
@@ -4785,7 +4893,7 @@ def fetch_chubb_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 page_soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -4816,6 +4924,7 @@ def fetch_chubb_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"Chubb_news: 要約中にエラー発生 - {e}")
@@ -4823,11 +4932,12 @@ def fetch_chubb_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_chubb_news_release():
+def fetch_chubb_news_release(execution_timestamp):
     """Chubb損害保険株式会社のニュースリリースを収集・要約します。"""
     url = "https://www.chubb.com/jp-jp/news/news-release.html"
     json_file = "./data/chubb_news_release.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4868,7 +4978,7 @@ def fetch_chubb_news_release():
             link = "https://www.chubb.com" + link
 
         # 既に存在するニュースはスキップ
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue
 
         print(f"Chubb_news_release: 記事取得開始 - {title}")
@@ -4876,7 +4986,7 @@ def fetch_chubb_news_release():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 response.encoding = 'UTF-8'
                 content_soup = BeautifulSoup(response.text, 'html.parser')
@@ -4904,6 +5014,7 @@ def fetch_chubb_news_release():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"Chubb_news_release: 要約中にエラー発生 - {e}")
@@ -4911,11 +5022,12 @@ def fetch_chubb_news_release():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_zurich_news():
+def fetch_zurich_news(execution_timestamp):
     """チューリッヒの最新情報を収集・要約します。"""
     url = "https://www.zurich.co.jp/aboutus/news/"
     json_file = f"./data/zurich_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -4958,7 +5070,7 @@ def fetch_zurich_news():
             link = "https://www.zurich.co.jp" + link
 
         # 既存データに存在するか確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"チューリッヒ: 記事取得開始 - {title}")
@@ -4966,7 +5078,7 @@ def fetch_zurich_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 if response.encoding is None:
                     response.encoding = 'utf-8'  # エンコーディング不明の場合はutf-8をデフォルト
                 content = response.text
@@ -4988,6 +5100,7 @@ def fetch_zurich_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"チューリッヒ: 要約中にエラー発生 - {e}")
@@ -4995,11 +5108,12 @@ def fetch_zurich_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_tokyo_kaijo_news():
+def fetch_tokyo_kaijo_news(execution_timestamp):
     """東京海上日動火災保険株式会社のお知らせを収集・要約します。"""
     url = "https://www.tokiomarine-nichido.co.jp/company/news/"
     json_file = f"./data/tokyo_kaijo_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5043,7 +5157,7 @@ def fetch_tokyo_kaijo_news():
             link = f"https://www.tokiomarine-nichido.co.jp{link}"
 
         # 既存データのチェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"東京海上日動_news: 記事取得開始 - {title}")
@@ -5051,7 +5165,7 @@ def fetch_tokyo_kaijo_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -5073,6 +5187,7 @@ def fetch_tokyo_kaijo_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
 
@@ -5082,11 +5197,12 @@ def fetch_tokyo_kaijo_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_tokiomarine_news():
+def fetch_tokiomarine_news(execution_timestamp):
     """東京海上日動火災保険のニュースリリースを収集・要約します。"""
     url = "https://www.tokiomarine-nichido.co.jp/company/release/"
     json_file = "./data/tokiomarine_news_release.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5137,7 +5253,7 @@ def fetch_tokiomarine_news():
             link = "https://www.tokiomarine-nichido.co.jp" + link
 
         # 既存データに同じタイトルが存在する場合はスキップ
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue
 
         print(f"東京海上日動_news_release: 記事取得開始 - {title}")
@@ -5145,7 +5261,7 @@ def fetch_tokiomarine_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = response.apparent_encoding
                 content = response.text
 
@@ -5168,6 +5284,7 @@ def fetch_tokiomarine_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -5177,11 +5294,12 @@ def fetch_tokiomarine_news():
     return news_items
 
 
-def fetch_toa_news():
+def fetch_toa_news(execution_timestamp):
     """トーア再保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.toare.co.jp/newsrelease"
     json_file = f"./data/toa_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5225,7 +5343,7 @@ def fetch_toa_news():
         title = p_tag.get_text(strip=True) if p_tag else ""
 
         # チェック用タイトル（重複確認）
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"トーア再保険株式会社: 記事取得開始 - {title}")
@@ -5233,7 +5351,7 @@ def fetch_toa_news():
             if is_pdf_link(link) or '/jp-news/download/' in link:
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -5256,6 +5374,7 @@ def fetch_toa_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
 
@@ -5265,11 +5384,12 @@ def fetch_toa_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_nisshinfire_news():
+def fetch_nisshinfire_news(execution_timestamp):
     """日新火災海上保険株式会社(お知らせ)の新着情報を収集・要約します。"""
     url = "https://www.nisshinfire.co.jp/info/"
     json_file = f"./data/nisshinfire.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5309,7 +5429,7 @@ def fetch_nisshinfire_news():
             title = a_tag.get_text(strip=True).split('(')[0].strip()
 
             # 既存データに存在するか確認
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"日新火災: 記事取得開始 - {title}")
@@ -5317,7 +5437,7 @@ def fetch_nisshinfire_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     soup_detail = BeautifulSoup(response.text, 'html.parser')
                     # 記事の本文を取得（サイト構造に合わせて調整が必要）
@@ -5341,6 +5461,7 @@ def fetch_nisshinfire_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
 
 
@@ -5353,14 +5474,15 @@ def fetch_nisshinfire_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_nisshin_news():
+def fetch_nisshin_news(execution_timestamp):
     """日新火災海上保険株式会社のニュースリリースから最新情報を収集・要約します。"""
     url = "https://www.nisshinfire.co.jp/news_release/"  # ニュースリリースページのURL
     json_file = f"./data/nisshin_fire_news_release.json"  # 保存するJSONファイルのパス
     existing_data = load_existing_data(json_file)  # 既存のデータをロード
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
     except Exception as e:
@@ -5398,7 +5520,7 @@ def fetch_nisshin_news():
             size_text = tds[0].get_text(strip=True).split('(')[-1].rstrip(')') if '(' in tds[0].get_text() else ""
 
             # 既に存在するニュースか確認
-            if any(title == item['title'] for item in existing_data):
+            if title in seen:
                 continue  # 既存のニュースはスキップ
 
             print(f"日新火災海上保険_news_release: 記事取得開始 - {title}")
@@ -5408,7 +5530,7 @@ def fetch_nisshin_news():
                 content = extract_text_from_pdf(link)
             else:
                 try:
-                    page_response = requests.get(link)
+                    page_response = http_get(link)
                     page_response.raise_for_status()
                     page_soup = BeautifulSoup(page_response.content, 'html.parser')
                     # ニュース内容の抽出方法は実際のページ構造に合わせて調整
@@ -5441,6 +5563,7 @@ def fetch_nisshin_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -5450,11 +5573,12 @@ def fetch_nisshin_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_nihonjishin():
+def fetch_nihonjishin(execution_timestamp):
     """日本地震再保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.nihonjishin.co.jp/news.html"
     json_file = "./data/nihonjishin_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5519,7 +5643,7 @@ def fetch_nihonjishin():
 
                 # カテゴリーを追加
                 # チェック: 既に存在するか
-                if any(title == item.get('title') for item in existing_data):
+                if title in seen:
                     continue
 
                 print(f"日本地震再保険: 記事取得開始 - {title}")
@@ -5527,7 +5651,7 @@ def fetch_nihonjishin():
                     if is_pdf_link(link):
                         content = extract_text_from_pdf(link)
                     else:
-                        response = requests.get(link)
+                        response = http_get(link)
                         response.raise_for_status()
                         response.encoding = 'UTF-8'
                         content_soup = BeautifulSoup(response.text, 'html.parser')
@@ -5553,6 +5677,7 @@ def fetch_nihonjishin():
                     }
                     news_items.append(news_item)
                     existing_data.append(news_item)
+                    seen.add(news_item)
                     new_count += 1
                 except Exception as e:
                     print(f"日本地震再保険: 要約中にエラー発生 - {e}")
@@ -5563,17 +5688,18 @@ def fetch_nihonjishin():
 
 
 
-def fetch_ms_ins_news():
+def fetch_ms_ins_news(execution_timestamp):
     """三井住友海上火災保険の最新情報を収集・要約します。"""
     url = "https://www.ms-ins.com/rss/news.rdf"
     feed = feedparser.parse(url)
     json_file = f"./data/msins-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"三井住友海上火災保険: 記事取得開始 - {entry.title}")
@@ -5581,7 +5707,7 @@ def fetch_ms_ins_news():
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 soup = BeautifulSoup(response.text, 'html.parser')
                 # ページのテキストを抽出
@@ -5607,6 +5733,7 @@ def fetch_ms_ins_news():
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"三井住友海上火災保険: 要約中にエラー発生 - {e}")
@@ -5614,11 +5741,12 @@ def fetch_ms_ins_news():
     save_json(existing_data, json_file)
     return new_news
 
-def fetch_mitsui_direct_news():
+def fetch_mitsui_direct_news(execution_timestamp):
     """三井ダイレクト損保の最新情報を収集・要約します。"""
     url = "https://news.mitsui-direct.co.jp/index.html?category=4000"
     json_file = f"./data/mitsui_direct_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5658,7 +5786,7 @@ def fetch_mitsui_direct_news():
             link = "https://news.mitsui-direct.co.jp" + link
         pub_date = date_tag.get_text(strip=True)
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"三井ダイレクト損保: 記事取得開始 - {title}")
@@ -5666,7 +5794,7 @@ def fetch_mitsui_direct_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -5688,6 +5816,7 @@ def fetch_mitsui_direct_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"三井ダイレクト損保: 要約中にエラー発生 - {e}")
@@ -5695,11 +5824,12 @@ def fetch_mitsui_direct_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_meijiyasuda_sonpo():
+def fetch_meijiyasuda_sonpo(execution_timestamp):
     """明治安田損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.meijiyasuda-sonpo.co.jp/newsrelease/"
     json_file = "./data/meijiyasuda_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5732,7 +5862,7 @@ def fetch_meijiyasuda_sonpo():
         pub_date_tag = li.find('span', class_='date')
         pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ""
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"明治安田損害保険: 記事取得開始 - {title}")
@@ -5740,7 +5870,7 @@ def fetch_meijiyasuda_sonpo():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 response.encoding = 'utf-8'
                 content = response.text
@@ -5761,6 +5891,7 @@ def fetch_meijiyasuda_sonpo():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"明治安田損害保険: 要約中にエラー発生 - {e}")
@@ -5768,11 +5899,12 @@ def fetch_meijiyasuda_sonpo():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_yamap_news():
+def fetch_yamap_news(execution_timestamp):
     """株式会社ヤマップネイチャランス損害保険の最新情報を収集・要約します。"""
     url = "https://yamap-naturance.co.jp/news"
     json_file = "./data/yamap_naturance_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5807,7 +5939,7 @@ def fetch_yamap_news():
         pub_date = date_tag.get_text(strip=True) if date_tag else ""
 
         # 既存データに存在するか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"YAMAP NATURANCE: 記事取得開始 - {title}")
@@ -5815,7 +5947,7 @@ def fetch_yamap_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # ニュース本文のHTML構造に基づいて調整してください。
@@ -5839,6 +5971,7 @@ def fetch_yamap_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"YAMAP NATURANCE: 要約中にエラー発生 - {e}")
@@ -5846,11 +5979,12 @@ def fetch_yamap_news():
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_rakuten_news():
+def fetch_rakuten_news(execution_timestamp):
     """楽天損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.rakuten-sonpo.co.jp/news/tabid/85/Default.aspx"
     json_file = f"./data/rakuten_sonpo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5894,7 +6028,7 @@ def fetch_rakuten_news():
             summary = summary_tag.get_text(strip=True) if summary_tag else ""
 
             # 既存のデータに存在するか確認
-            if any(item['title'] == title for item in existing_data):
+            if title in seen:
                 continue  # 既に存在するニュースはスキップ
 
             print(f"楽天損保: 記事取得開始 - {title}")
@@ -5902,7 +6036,7 @@ def fetch_rakuten_news():
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.raise_for_status()
                     response.encoding = 'UTF-8'
                     page_soup = BeautifulSoup(response.text, 'html.parser')
@@ -5935,17 +6069,19 @@ def fetch_rakuten_news():
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
             except Exception as e:
                 print(f"楽天損保: 要約中にエラー発生 - {e}")
 
     save_json(existing_data, json_file)
     return news_items
 
-def fetch_rescue_news():
+def fetch_rescue_news(execution_timestamp):
     """レスキュー損害保険株式会社の最新情報を収集・要約します。"""
     url = "https://www.rescue-sonpo.jp/news.php"
     json_file = f"./data/rescue.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # Seleniumドライバーを初期化
     driver = webdriver.Chrome(options=options)
@@ -5991,7 +6127,7 @@ def fetch_rescue_news():
         elif not link.startswith('http'):
             link = "https://www.rescue-sonpo.jp/" + link
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen:
             continue  # 既に存在するニュースはスキップ
 
         print(f"レスキュー損害保険: 記事取得開始 - {title}")
@@ -5999,7 +6135,7 @@ def fetch_rescue_news():
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -6032,6 +6168,7 @@ def fetch_rescue_news():
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"レスキュー損害保険: 要約中にエラー発生 - {e}")
@@ -6040,7 +6177,7 @@ def fetch_rescue_news():
     return news_items
 
 
-def save_to_csv(news_list):
+def save_to_csv(news_list, execution_timestamp):
     """ニュースリストをCSVファイルに保存します。"""
     if not news_list:
         print("新しいニュースはありません。")
@@ -6064,95 +6201,96 @@ def save_to_csv(news_list):
     print(f"ニュースの収集と要約が完了しました。CSVファイル: {csv_file}")
 
 def main():
-    all_news = []
-    all_news = all_news + fetch_fsa_news()
-    all_news = all_news + fetch_jma_news()
-    all_news = all_news + fetch_jishinhonbu()
-    all_news = all_news + fetch_mlit_disaster_info()
-    all_news = all_news + fetch_cao_kotsu()
-    all_news = all_news + fetch_mlit_jinji()
-    all_news = all_news + fetch_cas_kyojin()    
-    all_news = all_news + fetch_nta_news()      
-    all_news = all_news + fetch_jftc_news()     
-    all_news = all_news + fetch_ppc_news()     
-    all_news = all_news + fetch_env_news() 
-    all_news = all_news + fetch_road_to_l4_news()
-    all_news = all_news + fetch_statistics_bureau_news()
-    all_news = all_news + fetch_mlit_news()
-    all_news = all_news + fetch_mlit_kisha_news()
-    all_news = all_news + fetch_mof_news()
-    all_news = all_news + fetch_kantei_news()
-    all_news = all_news + fetch_cao_hodo_news()
-    all_news = all_news + fetch_npa_news()
-    all_news = all_news + fetch_fdma_news()
-    all_news = all_news + fetch_mhlw_news()
-    all_news = all_news + fetch_mhlw_kinkyu_news()
-    all_news = all_news + fetch_e_gov_news()
-    all_news = all_news + fetch_egov_comments()
-    all_news = all_news + fetch_moj_news()
-    all_news = all_news + fetch_gsi_news()
-    all_news = all_news + fetch_caa_news()
-    all_news = all_news + fetch_digital_agency_news()
-
-    all_news = all_news + fetch_courts_news()
-    print("fetch_courts_news() done")
-#    all_news = all_news + fetch_meti_news()    # 20241105 この関数を回すと処理が止まるためコメントアウト
-    print("fetch_meti_news() done")
-
-    all_news = all_news + fetch_axadirect_pr()
-    all_news = all_news + fetch_aig_news()
-    all_news = all_news + fetch_ms_ins_news()
-    all_news = all_news + fetch_aioi_news()
-    print("fetch_aioi_news() done")
-#    all_news = all_news + fetch_axa_news() # fail
-    all_news = all_news + fetch_americanhome_news()
-    all_news = all_news + fetch_edsp_news()
-    all_news = all_news + fetch_hs_news()
-    all_news = all_news + fetch_au_news()
-    all_news = all_news + fetch_sbi_press()
-    all_news = all_news + fetch_sbi_news()
-    print("fetch_sbi_news() done")
-    all_news = all_news + fetch_cardif_news()
-#   all_news = all_news + fetch_capital_sonpo_news() # fail 全然別のページを誤って情報収集しようとしてしまっている
-    all_news = all_news + fetch_hdmf_news()
-#   all_news = all_news + fetch_newindia_news()  # fail
-#   all_news = all_news + fetch_jai_news()   # fail
-#   all_news = all_news + fetch_starr_news() # fail
-    all_news = all_news + fetch_secom_news()
-    all_news = all_news + fetch_secom_product_news()
-    all_news = all_news + fetch_zenkankyo_reiwa_news()
-    all_news = all_news + fetch_sonysonpo_news()
-    print("fetch_sonysonpo_news() done")
-    all_news = all_news + fetch_sonysonpo_news_release()
-    all_news = all_news + fetch_sonpohogo_news()
-    all_news = all_news + fetch_sompo_news()
-    all_news = all_news + fetch_sompo_direct_news()
-    all_news = all_news + fetch_sompo_direct_important_news()
-    all_news = all_news + fetch_daidokasai_news()
-    all_news = all_news + fetch_chubb_news()
-    print("fetch_chubb_news() done")
-    all_news = all_news + fetch_chubb_news_release()
-    all_news = all_news + fetch_zurich_news()
-    all_news = all_news + fetch_tokyo_kaijo_news()
-    all_news = all_news + fetch_tokiomarine_news()
-    all_news = all_news + fetch_toa_news()
-#   all_news = all_news + fetch_nisshinfire_news()   # fail
-#   all_news = all_news + fetch_nisshin_news()   # fail
-    all_news = all_news +    fetch_nihonjishin()
-#   all_news = all_news + fetch_mitsui_direct_news() # fail
-#   all_news = all_news + fetch_meijiyasuda_sonpo() # fail
-#   all_news = all_news + fetch_yamap_news()  # fail
-    all_news = all_news +    fetch_rakuten_news()
-    all_news = all_news +   fetch_rescue_news() # レスキュー損害保険: コンテンツ取得失敗 - https://www.rescue-sonpo.jp/upload_files/news/disclo2023.pdf
-    print("fetch_rescue_news() done")
+    # 実行日時を取得（各取得源には引数で渡す。別プロセスの取得源がこのモジュールを読み込み直しても変わらない）
+    execution_timestamp = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=9))).strftime('%Y-%m-%d %H;%M;%S')
+
+    sources = [
+        fetch_fsa_news,
+        fetch_jma_news,
+        fetch_jishinhonbu,
+        fetch_mlit_disaster_info,
+        fetch_cao_kotsu,
+        fetch_mlit_jinji,
+        fetch_cas_kyojin,
+        fetch_nta_news,
+        fetch_jftc_news,
+        fetch_ppc_news,
+        fetch_env_news,
+        fetch_road_to_l4_news,
+        fetch_statistics_bureau_news,
+        fetch_mlit_news,
+        fetch_mlit_kisha_news,
+        fetch_mof_news,
+        fetch_kantei_news,
+        fetch_cao_hodo_news,
+        fetch_npa_news,
+        fetch_fdma_news,
+        fetch_mhlw_news,
+        fetch_mhlw_kinkyu_news,
+        fetch_e_gov_news,
+        fetch_egov_comments,
+        fetch_moj_news,
+        fetch_gsi_news,
+        fetch_caa_news,
+        fetch_digital_agency_news,
+
+        fetch_courts_news,
+        fetch_meti_news,    # 20241105 この関数を回すと処理が止まるため、制限時間付きの別プロセスで実行する
+
+        fetch_axadirect_pr,
+        fetch_aig_news,
+        fetch_ms_ins_news,
+        fetch_aioi_news,
+#        fetch_axa_news, # fail
+        fetch_americanhome_news,
+        fetch_edsp_news,
+        fetch_hs_news,
+        fetch_au_news,
+        fetch_sbi_press,
+        fetch_sbi_news,
+        fetch_cardif_news,
+#       fetch_capital_sonpo_news, # fail 全然別のページを誤って情報収集しようとしてしまっている
+        fetch_hdmf_news,
+#       fetch_newindia_news,  # fail
+#       fetch_jai_news,   # fail
+#       fetch_starr_news, # fail
+        fetch_secom_news,
+        fetch_secom_product_news,
+        fetch_zenkankyo_reiwa_news,
+        fetch_sonysonpo_news,
+        fetch_sonysonpo_news_release,
+        fetch_sonpohogo_news,
+        fetch_sompo_news,
+        fetch_sompo_direct_news,
+        fetch_sompo_direct_important_news,
+        fetch_daidokasai_news,
+        fetch_chubb_news,
+        fetch_chubb_news_release,
+        fetch_zurich_news,
+        fetch_tokyo_kaijo_news,
+        fetch_tokiomarine_news,
+        fetch_toa_news,
+#       fetch_nisshinfire_news,   # fail
+#       fetch_nisshin_news,   # fail
+        fetch_nihonjishin,
+#       fetch_mitsui_direct_news, # fail
+#       fetch_meijiyasuda_sonpo, # fail
+#       fetch_yamap_news,  # fail
+        fetch_rakuten_news,
+        fetch_rescue_news, # レスキュー損害保険: コンテンツ取得失敗 - https://www.rescue-sonpo.jp/upload_files/news/disclo2023.pdf
 # failed to fetch news
-#    all_news = all_news + fetch_nisc_news()    # 新着情報のページのhtmlが1部しか読み込めない。そのため、記事の取得が不可。
-#    all_news = all_news + fetch_kensatsu_news() # seleniumアクセス禁止のためかページのhtmlが読み込めない。
-#    all_news = all_news + fetch_e_design_news()
+#        fetch_nisc_news,    # 新着情報のページのhtmlが1部しか読み込めない。そのため、記事の取得が不可。
+#        fetch_kensatsu_news, # seleniumアクセス禁止のためかページのhtmlが読み込めない。
+#        fetch_e_design_news,
+    ]
+
+    # 各取得源を別プロセスで並列に実行し、登録順に結合する（制限時間を超えた取得源は打ち切る）
+    all_news = run_sources([(func.__name__, func) for func in sources], (execution_timestamp,),
+                           timeout=SOURCE_TIMEOUT)
 
     all_news = remove_news_with_exception_keyword(all_news)
 
-    save_to_csv(all_news)
+    save_to_csv(all_news, execution_timestamp)
 
 if __name__ == "__main__":
     main()
@@ -5,16 +5,21 @@ sys.path.append('c:/sasase/packages')
 import datetime
 import csv
 import importlib
+import functools
 import os
+from parallel_oriike import run_sources
+from async_oriike import fetch_sources
+from isolation_oriike import SOURCE_TIMEOUT
+from run_journal_oriike import start_run, resume_run
+from summary_cache_oriike import get_cache
+from summary_budget_oriike import enable_budget, run_budget
+from utilities_oriike import summarize_now
 
-max_count = 0   # 取得するニュースの最大数
-news_list: list[dict] = []
-# 実行日時を取得
-execution_timestamp = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=9))).strftime('%Y-%m-%d %H;%M;%S')
+max_count = 100   # 取得源ごとに要約の候補にする新着の最大数（どれを要約するかは要約の予算で全体から選ぶ）
 executable_path = "C:/sasase/msedgedriver.exe"
 # csv_file = f"./data/output/news_{execution_timestamp}.csv"
 
-def save_to_csv(news_list: list[dict]) -> None:
+def save_to_csv(news_list: list[dict], execution_timestamp: str) -> None:
     """ニュースリストを CSV ファイルに保存する。"""
     if not news_list:
         print("新しいニュースはありません。")
@@ -50,36 +55,85 @@ def save_to_csv(news_list: list[dict]) -> None:
     print(os.path.abspath(csv_file))
 
 
-# ファイルから org_func_map を読み込む
-org_func_map = {}
-with open("未確認情報取得源と関数.txt", "r", encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if not line or ":" not in line:
-            continue
-        org, func = line.split(":", 1)
-        # 空白やカンマ、クォートを除去
-        org = org.strip()
-        func = func.strip().strip(",").strip("'").strip('"')
-        org_func_map[org] = func
-
-# 各関数を実行して result.txt に追記
-for org, func in org_func_map.items():
-    print(f"# {org} から情報取得")
-
-    try:
-        module = importlib.import_module(f"functions.{func}")
-        # 各取得関数は list[dict] を返す前提
-        items = getattr(module, func)(
-            max_count, execution_timestamp, executable_path
-        )
-        news_list.extend(items)
-
-    except Exception as e:
-        print(f"⚠️ {org} の取得でエラー発生: {e}")
-
-# 全組織の処理が終わったら CSV 出力
-save_to_csv(news_list)
-
-        
-        
\ No newline at end of file
+def main():
+    # 実行日時を取得（各取得源には引数で渡す。別プロセスの取得源がこのモジュールを読み込み直しても変わらない）
+    execution_timestamp = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=9))).strftime('%Y-%m-%d %H;%M;%S')
+
+    # ファイルから org_func_map を読み込む
+    org_func_map = {}
+    with open("未確認情報取得源と関数.txt", "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or ":" not in line:
+                continue
+            org, func = line.split(":", 1)
+            # 空白やカンマ、クォートを除去
+            org = org.strip()
+            func = func.strip().strip(",").strip("'").strip('"')
+            org_func_map[org] = func
+
+    # 各関数を並列に実行し、登録順に結合する
+    sources = []
+    async_sources = []  # SOURCE を定義しているモジュールは非同期エンジンでまとめて取得する
+    for org, func in org_func_map.items():
+        try:
+            module = importlib.import_module(f"functions.{func}")
+            if hasattr(module, "SOURCE"):
+                async_sources.append(module.SOURCE)
+                continue
+            # 各取得関数は list[dict] を返す前提
+            sources.append((org, getattr(module, func)))
+        except Exception as e:
+            print(f"⚠️ {org} の取得でエラー発生: {e}")
+
+    if async_sources:
+        # 非同期エンジンの取得源は1件の取得源としてブラウザ系の取得源と並行に実行する
+        sources.insert(0, ("非同期取得源", functools.partial(fetch_sources, async_sources)))
+
+    # 実行ジャーナルに要約済みの記事と取得が終わった取得源を記録する
+    # python collect_edge.py --resume で、前回中断した実行の続きから再開する
+    journal = resume_run() if "--resume" in sys.argv[1:] else None
+    if journal is not None:
+        execution_timestamp = journal.meta["execution_timestamp"]
+        done_sources = journal.done_sources()
+        restored = journal.items()
+        print(f"前回中断した実行（{execution_timestamp}）を再開します。"
+              f"取得済みの取得源: {len(done_sources)}件、要約済みの記事: {len(restored)}件")
+        sources = [(org, func) for org, func in sources if org not in done_sources]
+    else:
+        if "--resume" in sys.argv[1:]:
+            print("再開できる実行はありません。最初から実行します。")
+        journal = start_run(execution_timestamp)
+        restored = []
+
+    # 取得中は要約せずに候補としてジャーナルに記録し、全取得源が終わってから予算に収まる分を要約する
+    enable_budget()
+
+    # 各取得源は別プロセスで実行し、制限時間を超えたものは打ち切って次に進む
+    news_list = run_sources(
+        sources, (max_count, execution_timestamp, executable_path), timeout=SOURCE_TIMEOUT
+    )
+
+    # 前回までに記録した記事を先頭に戻す（中断の直前に記録した記事が重複していれば除く。要約済みのものを残す）
+    merged = {}
+    for item in restored + news_list:
+        key = (item.get("title"), item.get("link"))
+        if key not in merged or (item.get("summary") and not merged[key].get("summary")):
+            merged[key] = item
+    news_list = list(merged.values())
+
+    # 要約の候補を順位付けし、予算（時間・トークン数・費用）に収まる分を要約する
+    news_list = run_budget(journal, news_list, summarize_now)
+
+    # 全組織の処理が終わったら CSV 出力
+    save_to_csv(news_list, execution_timestamp)
+    print(get_cache().report())
+    # 取得源ごとの要約のトークン数（取り出す前は記事ページのHTMLなどをそのまま送った場合の見積もり）
+    for org, usage in sorted(journal.usage().items(), key=lambda pair: -pair[1]["input"]):
+        print(f"{org}: 要約 {usage['calls']}件、入力 {usage['input']}トークン"
+              f"（取り出す前 {usage['raw']}トークン）、出力 {usage['output']}トークン")
+    journal.complete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# 記事ページのHTMLから本文を取り出します（要約に送るテキストを小さくするため）。
+# 多くの取得関数は記事ページの HTML（ヘッダー・メニュー・スクリプト・フッターを含む）をそのまま要約に渡している。
+# summarize_later（utilities_oriike）は HTML を受け取ったら、ここで本文だけにしてから要約に送る。
+#
+# 本文の見つけ方（readability と同じ考え方）:
+#   1. script / style / nav / header / footer などと、id・class がメニュー・パンくず・サイドバーなどを
+#      表す要素を取り除く
+#   2. 段落（p, li, dd, td と、直下に文字を持つ div）ごとに、句読点の数と長さから点数を付け、
+#      親に点数を、祖父母に半分の点数を足す
+#   3. リンクの文字の割合が高い要素は点数を下げ、id・class が本文を表す要素（官公庁・保険会社のページで
+#      よく使われる main, contents, tmp_contents, honbun など）は点数を上げる
+#   4. 点数が最も高い要素のテキストを本文とする（短すぎる場合はページ全体のテキストを使う）
+import re
+from bs4 import BeautifulSoup
+
+MIN_PARAGRAPH_LENGTH = 25   # これより短い段落は点数を付けない
+MIN_CONTENT_LENGTH = 100    # 本文がこれより短ければページ全体のテキストを使う
+
+_REMOVE_TAGS = ['script', 'style', 'noscript', 'iframe', 'svg', 'form', 'nav', 'header', 'footer', 'aside']
+_PARAGRAPH_TAGS = ['p', 'li', 'dd', 'td', 'pre', 'div']
+_CANDIDATE_TAGS = {'div', 'section', 'article', 'main', 'td', 'dd', 'ul', 'ol', 'dl', 'table', 'body'}
+
+# id・class の単語（"-" / "_" 区切り）で判定する
+_NEGATIVE = re.compile(
+    r'(?:^|[-_])(?:header|footer|nav|gnav|globalnav|localnav|lnav|snav|menu|breadcrumbs?|pankuzu|topicpath'
+    r'|side|sidebar|pagetop|share|sns|banner|related|relation|utility|skip|search|sitemap)(?:[-_]|$)', re.I)
+_POSITIVE = re.compile(
+    r'(?:^|[-_])(?:main|contents?|tmp_contents|maincontents?|article|entry|detail|body|text|honbun|news'
+    r'|release|press)(?:[-_]|$)', re.I)
+
+_HTML_PATTERN = re.compile(r'<(?:!doctype|html|head|body|div|p|table|span|a)\b', re.I)
+
+
+def looks_like_html(text):
+    """テキストが HTML かどうかを判定します。"""
+    return bool(text) and bool(_HTML_PATTERN.search(text[:5000]))
+
+
+def _hint(element):
+    """要素の id・class から本文らしさ（本文なら正、メニューなどなら負）を返します。"""
+    words = [element.get('id') or ""] + list(element.get('class') or [])
+    score = 0
+    for word in words:
+        if _NEGATIVE.search(word):
+            score -= 25
+        if _POSITIVE.search(word):
+            score += 25
+    return score
+
+
+def _text(element):
+    text = element.get_text('\n', strip=True)
+    return re.sub(r'\n{2,}', '\n', text)
+
+
+def _paragraph_text(element):
+    if element.name == 'div':
+        # div は直下の文字だけを段落とみなす（子の段落を二重に数えない）
+        return "".join(element.find_all(string=True, recursive=False)).strip()
+    return element.get_text(strip=True)
+
+
+def _link_density(element, text_length):
+    link_length = sum(len(a.get_text(strip=True)) for a in element.find_all('a'))
+    return link_length / text_length if text_length else 1.0
+
+
+def extract_main_text(html):
+    """HTML から本文のテキストを取り出します。"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup.find_all(_REMOVE_TAGS):
+        element.decompose()
+    for element in soup.find_all(True):
+        if element.decomposed or element.name in ('html', 'body'):
+            continue
+        if element.attrs and _hint(element) < 0:
+            element.decompose()
+
+    scores = {}
+    for paragraph in soup.find_all(_PARAGRAPH_TAGS):
+        text = _paragraph_text(paragraph)
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        score = 1 + len(re.findall(r'[、。，．,]', text)) + min(len(text) // 100, 3)
+        parent = paragraph if paragraph.name in ('div', 'td', 'dd') else paragraph.parent
+        for ancestor, weight in ((parent, 1.0), (parent.parent if parent else None, 0.5)):
+            if ancestor is None or ancestor.name not in _CANDIDATE_TAGS:
+                continue
+            if id(ancestor) not in scores:
+                scores[id(ancestor)] = [ancestor, _hint(ancestor)]
+            scores[id(ancestor)][1] += score * weight
+
+    best, best_score = None, 0
+    for element, score in scores.values():
+        text_length = len(element.get_text(strip=True))
+        score *= 1 - _link_density(element, text_length)
+        if score > best_score:
+            best, best_score = element, score
+
+    if best is not None:
+        text = _text(best)
+        if len(text) >= MIN_CONTENT_LENGTH:
+            return text
+    body = soup.body or soup
+    return _text(body)
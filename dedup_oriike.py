@@ -0,0 +1,153 @@
+# 既存データとの重複チェック用のインデックスです。
+# 既存データを一度だけ正規化したキーの集合にしておき、記事ごとの判定を O(1) で行う
+# （any(title == item['title'] for item in existing_data) のように毎回全件を走査しない）。
+#
+#     seen = DedupIndex(existing_data)                       # タイトルで判定
+#     seen = DedupIndex(existing_data, ('title', 'pubDate'))  # タイトル＋日付で判定
+#     if title in seen:              # 複数項目の場合は (title, pub_date) in seen
+#         continue
+#     ...
+#     existing_data.append(news_item)
+#     seen.add(news_item)
+#
+# 記事データベースの SourceHistory（load_existing_data の戻り値）を渡した場合は、全件を読み込まず
+# 判定のたびにデータベースのインデックスを検索する。
+#
+# 同じ発表が複数の取得源から届く（国土交通省のプレスRSSと記者発表フィードなど）ため、
+# 本文の取得・要約の前に、正規化したURLで取得源をまたいだ重複も確認する。
+#     if title in seen or seen.claimed_elsewhere(link):
+#         continue
+#
+# 記事には本文の指紋（content_hash）を保存しておき、タイトルだけ言い換えた記事や、
+# 同じタイトルのまま本文が更新された記事を、要約の前に本文の比較で見分ける。
+import re
+import html
+import hashlib
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, urljoin, parse_qsl, urlencode
+
+# 記事の同一性に関係しない（アクセス解析用の）クエリパラメータ
+TRACKING_PARAMS = {"fbclid", "gclid", "yclid", "msclkid", "mc_cid", "mc_eid", "_ga", "_gl"}
+INDEX_FILES = ("index.html", "index.htm", "index.php", "index.shtml")
+
+
+def normalize_key(value):
+    """比較用にキーを正規化します（全角/半角の統一、空白の除去）。"""
+    if value is None:
+        return ""
+    value = unicodedata.normalize('NFKC', str(value))
+    return re.sub(r'\s+', '', value)
+
+
+def canonical_url(url, base=None):
+    """比較用にURLを正規化します。
+
+    相対URLは base を基準に絶対URLにし、スキームは https に、ホスト名は小文字にそろえて www. を除きます。
+    末尾の index.html やスラッシュ、フラグメント、utm_* などの計測用パラメータを取り除き、
+    残りのクエリパラメータは並べ替えます。
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return url
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    for index_file in INDEX_FILES:
+        if path.endswith("/" + index_file):
+            path = path[:-len(index_file)]
+            break
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.startswith("utm_") and key not in TRACKING_PARAMS)
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def content_hash(text):
+    """本文の指紋を返します（タグ・空白を除いて正規化した本文の SHA-256）。"""
+    if not text:
+        return ""
+    text = re.sub(r'(?is)<(script|style)\b.*?</\1>', '', text)
+    text = html.unescape(re.sub(r'<[^>]+>', '', text))
+    return hashlib.sha256(normalize_key(text).encode('utf-8')).hexdigest()
+
+
+class DedupIndex:
+    """既存データのキー（既定ではタイトル）とリンクの集合です。"""
+
+    def __init__(self, items=(), fields=('title',)):
+        self.fields = tuple(fields)
+        self._keys = set()
+        self._links = set()
+        self._items = {}        # キー -> 記事
+        self._contents = {}     # 本文の指紋 -> リンク
+        # lookup() を持つもの（SourceHistory）はデータベースで判定し、今回追加した分だけを集合で持つ
+        self._store = items if hasattr(items, 'lookup') else None
+        if self._store is None:
+            for item in items:
+                self.add(item)
+
+    def _key(self, values):
+        if isinstance(values, tuple):
+            return tuple(normalize_key(value) for value in values)
+        return (normalize_key(values),)
+
+    def __contains__(self, values):
+        """キーが既にあるかを返します。fields が1項目なら文字列、複数項目ならタプルで渡します。"""
+        key = self._key(values)
+        if key in self._keys:
+            return True
+        return self._store is not None and self._store.lookup(self.fields, key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def has_link(self, link):
+        """リンクが既にあるかを返します。"""
+        if canonical_url(link) in self._links:
+            return True
+        return self._store is not None and self._store.lookup_link(link)
+
+    def same_content(self, fingerprint):
+        """本文の指紋が一致する既存の記事のリンクを返します。なければ None を返します。"""
+        if not fingerprint:
+            return None
+        link = self._contents.get(fingerprint)
+        if link is None and self._store is not None:
+            link = self._store.lookup_content(fingerprint)
+        return link
+
+    def stored_item(self, values):
+        """キーが一致する既存の記事を返します。なければ None を返します。"""
+        item = self._items.get(self._key(values))
+        if item is None and self._store is not None and self.fields == ('title',):
+            item = self._store.stored_item(values)
+        return item
+
+    def claimed_elsewhere(self, link):
+        """リンクの記事を他の取得源が既に保存済み、または今回の実行で取得中なら True を返します。
+
+        False を返した場合、この取得源が記事を引き受けたものとして記録し、他の取得源には True を返すようにします。
+        記事データベースを使わない場合は判定できないため、常に False を返します。
+        """
+        if not link or self._store is None:
+            return False
+        return not self._store.claim(link)
+
+    def add(self, item):
+        """記事（news_item の辞書）をインデックスに加えます。"""
+        key = tuple(normalize_key(item.get(field)) for field in self.fields)
+        self._keys.add(key)
+        self._items[key] = item
+        if item.get('content_hash'):
+            self._contents[item['content_hash']] = item.get('link')
+        if item.get('link'):
+            self._links.add(canonical_url(item['link']))
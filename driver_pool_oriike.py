@@ -0,0 +1,198 @@
+# 起動済みのブラウザ（WebDriver）を使い回すためのプールです。
+# ブラウザの起動が取得処理で最も重いため、取得源ごと・記事ごとに起動/終了せず、プールから借りて返す。
+#
+#     driver = borrow_driver(executable_path, options)
+#     try:
+#         driver.get(url)
+#         ...
+#     finally:
+#         driver.quit()   # 実際には終了せず、状態をリセットしてプールに返却される
+#
+# プールはプロセスごとにあり、取得源を実行する子プロセス（isolation_oriike）は複数の取得源で使い回されるため、
+# 同じ子プロセスで後から実行する取得源が起動済みのブラウザを借りる。返却時には Cookie・キャッシュと、
+# 開いたオリジンのストレージを DevTools Protocol（CDP）で消して、前の取得源の状態を残さない。
+import atexit
+import threading
+from urllib.parse import urlsplit
+from selenium import webdriver
+from selenium.webdriver.edge.service import Service as EdgeService
+from ratelimit_oriike import host_slot
+from browser_profile_oriike import browser_options, configure_options, block_resources
+
+MAX_SESSIONS = 4        # 同時に起動しておくブラウザの最大数
+MAX_PAGES = 50          # 1つのブラウザで読み込むページ数の上限（超えたら作り直す）
+MAX_HEAP_MB = 512       # ページのJSヒープがこれを超えたらブラウザを作り直す
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class _Session:
+    """プールが管理するブラウザ1つ分の状態です。"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.origins = set()    # 読み込んだページのオリジン（返却時にストレージを消す）
+
+
+class PooledDriver:
+    """プールから借りたWebDriverです。
+
+    WebDriverと同じように使えますが、quit() でブラウザを終了せずプールに返却します。
+    get() の回数を数え、一定回数を超えたブラウザは返却時に作り直されます。
+    """
+
+    def __init__(self, pool, session):
+        self._pool = pool
+        self._session = session
+
+    def get(self, url):
+        self._session.pages += 1
+        self._session.origins.add(_origin(url))
+        with host_slot(url):
+            return self._session.driver.get(url)
+
+    def quit(self):
+        # 2回呼ばれても1回だけ返却する
+        session, self._session = self._session, None
+        if session is not None:
+            self._pool.release(session)
+
+    def __del__(self):
+        # quit() を呼ばずに捨てられた場合もプールに返却する
+        if self.__dict__.get('_session') is not None:
+            self.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
+
+    def __getattr__(self, name):
+        if self.__dict__.get('_session') is None:
+            raise RuntimeError("返却済みのドライバは使用できません。")
+        return getattr(self._session.driver, name)
+
+
+class DriverPool:
+    """WebDriverのプールです。factory はWebDriverを新しく起動する関数です。"""
+
+    def __init__(self, factory, size=MAX_SESSIONS, max_pages=MAX_PAGES, max_heap_mb=MAX_HEAP_MB):
+        self._factory = factory
+        self._max_pages = max_pages
+        self._max_heap_mb = max_heap_mb
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ブラウザを1つ借ります。空きがなければ返却されるまで待ちます。"""
+        self._slots.acquire()
+        with self._lock:
+            session = self._idle.pop() if self._idle else None
+        if session is None:
+            try:
+                session = _Session(self._factory())
+            except Exception:
+                self._slots.release()
+                raise
+        return PooledDriver(self, session)
+
+    def release(self, session):
+        """ブラウザを返却します。状態をリセットできない、または使い古したブラウザは終了します。"""
+        try:
+            if self._worn_out(session) or not self._reset(session):
+                self._discard(session)
+            else:
+                with self._lock:
+                    self._idle.append(session)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """待機中のブラウザをすべて終了します。"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session in idle:
+            self._discard(session)
+
+    def _worn_out(self, session):
+        if session.pages >= self._max_pages:
+            return True
+        try:
+            heap = session.driver.execute_script(
+                "return window.performance.memory ? window.performance.memory.usedJSHeapSize : 0;")
+        except Exception:
+            return True
+        return (heap or 0) > self._max_heap_mb * 1024 * 1024
+
+    @staticmethod
+    def _reset(session):
+        """次の利用者に前の取得源の状態が残らないようにします。"""
+        driver = session.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            session.origins.add(_origin(driver.current_url))
+            driver.execute_script("try { sessionStorage.clear(); } catch (e) {}")
+            # delete_all_cookies() や localStorage.clear() は今のオリジンの分しか消さないため、CDP で消す
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in session.origins - {None}:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                       {"origin": origin, "storageTypes": "all"})
+            session.origins.clear()
+            driver.implicitly_wait(0)
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"⚠️ ドライバのリセットに失敗したため破棄します: {e}")
+            return False
+
+    @staticmethod
+    def _discard(session):
+        try:
+            session.driver.quit()
+        except Exception as e:
+            print(f"⚠️ driver.quit()失敗: {e}")
+
+
+def _origin(url):
+    """URL のオリジン（https://example.jp）を返します。http(s) でなければ None を返します。"""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_pool(executable_path, options=None):
+    """msedgedriver のパスごとに共有されるプールを返します。options は最初に作るときだけ使われます。"""
+    with _pools_lock:
+        pool = _pools.get(executable_path)
+        if pool is None:
+            def factory():
+                driver = webdriver.Edge(service=EdgeService(executable_path=executable_path),
+                                        options=configure_options(options) if options else browser_options())
+                block_resources(driver)
+                return driver
+            pool = _pools[executable_path] = DriverPool(factory)
+        return pool
+
+
+def borrow_driver(executable_path, options=None):
+    """プールからEdgeのドライバを借ります。使い終わったら quit() で返却してください。"""
+    return get_pool(executable_path, options).acquire()
+
+
+@atexit.register
+def close_pools():
+    """すべてのプールのブラウザを終了します。"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
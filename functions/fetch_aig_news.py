@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,20 +32,19 @@ def fetch_aig_news(max_count, execution_timestamp, executable_path):
     url = "https://www.aig.co.jp/sonpo/company/news"
     json_file = "./data/aig_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ディレクトリが存在しない場合は作成
     os.makedirs(os.path.dirname(json_file), exist_ok=True)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)  # ページロードを待機
+        wait_for(driver, "ul.cmp-newslist")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"AIG損保: ページ取得中にエラー発生 - {e}")
@@ -76,7 +79,7 @@ def fetch_aig_news(max_count, execution_timestamp, executable_path):
         pub_date = article.find('div', class_='cmp-newslist-item__date').get_text(strip=True)
 
         # 既存のデータにタイトルが存在する場合はスキップ
-        if any(item['title'] == title for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue
 
         print(f"AIG損保: 記事取得開始 - {title}")
@@ -85,7 +88,7 @@ def fetch_aig_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # 本文の抽出方法はページの構造に依存します。適宜調整してください。
@@ -102,7 +105,7 @@ def fetch_aig_news(max_count, execution_timestamp, executable_path):
             # 要約の生成
             summary = ""
             if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             # ニュースアイテムを構築
             news_item = {
@@ -116,6 +119,7 @@ def fetch_aig_news(max_count, execution_timestamp, executable_path):
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
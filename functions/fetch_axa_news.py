@@ -2,13 +2,16 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,13 +31,12 @@ def fetch_axa_news(max_count, execution_timestamp, executable_path):
     url = "https://www.axa-direct.co.jp/company/official_info/announce/"
     json_file = "./data/axa_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
@@ -77,7 +79,7 @@ def fetch_axa_news(max_count, execution_timestamp, executable_path):
         pub_date = pub_date_tag.get_text(strip=True) if pub_date_tag else ''
 
         # 既存データとの重複チェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"AXA: 記事取得開始 - {title}")
@@ -85,7 +87,7 @@ def fetch_axa_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -95,7 +97,7 @@ def fetch_axa_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -107,6 +109,7 @@ def fetch_axa_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"AXA_お知らせ: 要約中にエラー発生 - {e}")
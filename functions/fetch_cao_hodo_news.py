@@ -2,7 +2,10 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from validator_cache_oriike import parse_feed, commit_validators
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -28,14 +31,18 @@ def fetch_cao_hodo_news(max_count, execution_timestamp, executable_path):
     url = "https://www.cao.go.jp/rss/news.rdf"
     json_file = f"./data/cao-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
-    feed = feedparser.parse(url)
+    feed = parse_feed(url)
+    if feed is None:
+        return []  # 前回から更新がない
     new_news = []
     new_count = 0  # カウンターを追加
 
+    failed = False  # 取得できなかった記事があれば、一覧の ETag / Last-Modified を保存せずに次回取得し直す
     for entry in feed.entries:
         # タイトルが既に存在する場合はスキップ
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen or seen.claimed_elsewhere(entry.link):
             continue
 
         print(f"内閣府_報道発表: 記事取得開始 - {entry.title}")
@@ -44,17 +51,18 @@ def fetch_cao_hodo_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
             if not content:
                 print(f"内閣府_報道発表: コンテンツ取得失敗 - {entry.link}")
+                failed = True
                 continue
 
             summary = ""
             if new_count < max_count:  # max_count件に達したら要約をスキップ
-                summary = summarize_text(entry.title, content)
+                summary = summarize_later(entry.title, content)
 
             # 公開日が存在しない場合はupdatedを使用
             pub_date = entry.get('published', entry.get('updated', ''))
@@ -69,10 +77,14 @@ def fetch_cao_hodo_news(max_count, execution_timestamp, executable_path):
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
+            failed = True
             print(f"内閣府_報道発表: 要約中にエラー発生 - {e}")
 
     save_json(existing_data, json_file)
+    if not failed:
+        commit_validators(url)
     return new_news
\ No newline at end of file
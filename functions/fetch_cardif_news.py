@@ -2,7 +2,9 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -28,9 +30,10 @@ def fetch_cardif_news(max_count, execution_timestamp, executable_path):
     url = "https://nonlife.cardif.co.jp/company/news/release"
     json_file = "./data/cardif_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
     except Exception as e:
@@ -55,7 +58,7 @@ def fetch_cardif_news(max_count, execution_timestamp, executable_path):
         link = a_tag.get('href')
 
         # 既存のデータと重複していないか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"新しいニュースを検出: {title}")
@@ -64,7 +67,7 @@ def fetch_cardif_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -74,7 +77,7 @@ def fetch_cardif_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_count < max_count:
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -87,6 +90,7 @@ def fetch_cardif_news(max_count, execution_timestamp, executable_path):
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"ニュース処理中にエラーが発生しました: {e}")
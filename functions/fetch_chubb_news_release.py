@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,17 +32,16 @@ def fetch_chubb_news_release(max_count, execution_timestamp, executable_path):
     url = "https://www.chubb.com/jp-jp/news/news-release.html"
     json_file = "./data/chubb_news_release.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "ul.news-block")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"Chubb_news_release: ページ取得中にエラー発生 - {e}")
@@ -73,7 +76,7 @@ def fetch_chubb_news_release(max_count, execution_timestamp, executable_path):
             link = "https://www.chubb.com" + link
 
         # 既に存在するニュースはスキップ
-        if any(item['title'] == title for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue
 
         print(f"Chubb_news_release: 記事取得開始 - {title}")
@@ -81,7 +84,7 @@ def fetch_chubb_news_release(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 response.encoding = 'UTF-8'
                 content_soup = BeautifulSoup(response.text, 'html.parser')
@@ -97,7 +100,7 @@ def fetch_chubb_news_release(max_count, execution_timestamp, executable_path):
                 print(f"Chubb_news_release: コンテンツ取得失敗 - {link}")
                 continue
 
-            summary = summarize_text(title, content) if new_count < max_count else ""
+            summary = summarize_later(title, content) if new_count < max_count else ""
 
             news_item = {
                 'pubDate': pub_date,
@@ -109,6 +112,7 @@ def fetch_chubb_news_release(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"Chubb_news_release: 要約中にエラー発生 - {e}")
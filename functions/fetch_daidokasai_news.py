@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,17 +32,16 @@ def fetch_daidokasai_news(max_count, execution_timestamp, executable_path):
     url = "https://www.daidokasai.co.jp/news/"
     json_file = "./data/daidokasai_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "ul.post-group")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"ページ取得中にエラーが発生しました: {e}")
@@ -76,7 +79,7 @@ def fetch_daidokasai_news(max_count, execution_timestamp, executable_path):
         category = badge.get_text(strip=True) if badge else "その他"
 
         # 既に存在するニュースか確認
-        if any(item['title'] == title for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在する場合はスキップ
 
         print(f"新規記事取得: {title}")
@@ -85,7 +88,7 @@ def fetch_daidokasai_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.raise_for_status()
                 page_soup = BeautifulSoup(response.text, 'html.parser')
                 # 主要な記事コンテンツを抽出（適宜調整が必要）
@@ -101,7 +104,7 @@ def fetch_daidokasai_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_count < max_count:
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -115,6 +118,7 @@ def fetch_daidokasai_news(max_count, execution_timestamp, executable_path):
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
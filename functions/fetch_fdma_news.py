@@ -2,7 +2,10 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from validator_cache_oriike import parse_feed, commit_validators
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -26,14 +29,18 @@ options.use_chromium = True
 def fetch_fdma_news(max_count, execution_timestamp, executable_path):
     """消防庁の最新情報を収集・要約します。"""
     url = "https://www.fdma.go.jp/index.xml"
-    feed = feedparser.parse(url)
+    feed = parse_feed(url)
+    if feed is None:
+        return []  # 前回から更新がない
     json_file = f"./data/fdma.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
+    failed = False  # 取得できなかった記事があれば、一覧の ETag / Last-Modified を保存せずに次回取得し直す
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen or seen.claimed_elsewhere(entry.link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"消防庁: 記事取得開始 - {entry.title}")
@@ -42,7 +49,7 @@ def fetch_fdma_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -63,11 +70,12 @@ def fetch_fdma_news(max_count, execution_timestamp, executable_path):
 
             if not content_text:
                 print(f"消防庁: コンテンツ取得失敗 - {entry.link}")
+                failed = True
                 continue
 
             summary = ""
             if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(entry.title, content_text)
+                summary = summarize_later(entry.title, content_text)
 
             news_item = {
                 'pubDate': entry.published,
@@ -79,9 +87,13 @@ def fetch_fdma_news(max_count, execution_timestamp, executable_path):
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
+            failed = True
             print(f"消防庁: 要約中にエラー発生 - {e}")
 
     save_json(existing_data, json_file)
+    if not failed:
+        commit_validators(url)
     return new_news
\ No newline at end of file
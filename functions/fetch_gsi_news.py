@@ -2,7 +2,8 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -44,6 +45,7 @@ def fetch_gsi_news(max_count, execution_timestamp, executable_path):
     url = "https://www.gsi.go.jp/index.rdf"
     json_file = "./data/gsi-rss.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ---- 共通 SSLContext ----
     ctx = ssl.create_default_context(cafile=certifi.where())
@@ -57,7 +59,7 @@ def fetch_gsi_news(max_count, execution_timestamp, executable_path):
     new_news, new_count = [], 0
 
     for entry in feed.entries:
-        if any(entry.title == n["title"] for n in existing_data):
+        if entry.title in seen or seen.claimed_elsewhere(entry.link):
             continue
 
         try:
@@ -74,7 +76,7 @@ def fetch_gsi_news(max_count, execution_timestamp, executable_path):
             if not content:
                 continue
 
-            summary = summarize_text(entry.title, content) if new_count < max_count else ""
+            summary = summarize_later(entry.title, content) if new_count < max_count else ""
             item = {
                 "pubDate": entry.updated,
                 "execution_timestamp": execution_timestamp,
@@ -85,6 +87,7 @@ def fetch_gsi_news(max_count, execution_timestamp, executable_path):
             }
             new_news.append(item)
             existing_data.append(item)
+            seen.add(item)
             new_count += 1
 
         except Exception as e:
@@ -2,13 +2,16 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from driver_pool_oriike import borrow_driver
+from static_first_oriike import fetch_html, submit_html
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -24,29 +27,24 @@ options.add_argument("--start-maximized")
 options.use_chromium = True
 options.set_capability("acceptInsecureCerts", True)
 
+# 記事ページの本文の枠（HTTP GETの結果にこれがなければブラウザで取得する。ページの作りによって違うため候補を並べる）
+ARTICLE_SELECTOR = "#main, main, #contents, .contents, #mainContents"
+
 
 def fetch_jftc_news(max_count, execution_timestamp, executable_path):
     """公正取引委員会の最新情報を収集・要約します。"""
     url = "https://www.jftc.go.jp/index.html"
     json_file = f"./data/jftc.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
-    # ただし options.set_capability を加えると安定性UP
-    options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
-
+    # HTTP GETでニュースセクションが取れなければブラウザで取得する
     try:
-        driver.get(url)
-        driver.implicitly_wait(10)  # ページの読み込みを待つ
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        html = fetch_html("公正取引委員会", url, "div.newsWrap", executable_path)
+        soup = BeautifulSoup(html, 'html.parser')
     except Exception as e:
         print(f"公正取引委員会: ページ取得中にエラー発生 - {e}")
-        driver.quit()
         return []
-    driver.quit()
 
     news_items = []
     new_count = 0  # カウンターを追加
@@ -78,6 +76,8 @@ def fetch_jftc_news(max_count, execution_timestamp, executable_path):
         print("公正取引委員会: 情報リストが見つかりませんでした。")
         return []
 
+    # 記事ページはまとめて並行に取得する
+    candidates = []
     for li in info_list.find_all('li'):
 
         # 各ニュースアイテムの情報を抽出
@@ -110,32 +110,26 @@ def fetch_jftc_news(max_count, execution_timestamp, executable_path):
             link = "https://www.jftc.go.jp" + link
 
         # 既存データと照合して新規か確認
-        if any(title == item['title'] for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"公正取引委員会: 記事取得開始 - {title}")
+        # requestsで記事が取得できない場合はSeleniumで描画する（PDFはそのまま取得）
+        page = None if is_pdf_link(link) else submit_html("公正取引委員会", link, ARTICLE_SELECTOR, executable_path)
+        candidates.append((pub_date, category, press_type, title, link, page))
+
+    for pub_date, category, press_type, title, link, page in candidates:
         try:
-            if is_pdf_link(link):
+            if page is None:
                 content = extract_text_from_pdf(link)
             else:
-                # requestsでは記事が取得できないため、Seleniumを使用
-                # ただし options.set_capability を加えると安定性UP
-                options.set_capability("browserName", "MicrosoftEdge")
-                # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-                service = EdgeService(executable_path=executable_path)
-                # ドライバ起動
-                driver = webdriver.Edge(service=service, options=options)
-
                 try:
-                    driver.get(link)
-                    driver.implicitly_wait(10)  # ページの読み込みを待つ
-                    soup = BeautifulSoup(driver.page_source, 'html.parser')
+                    soup = BeautifulSoup(page.result(), 'html.parser')
                 except Exception as e:
                     print(f"公正取引委員会: ページ取得中にエラー発生 -{link}, {e}")
-                    driver.quit()
-                driver.quit()
-
-                content = soup.get_text(separator='\n', strip=True)
+                    continue
+                body = soup.select_one(ARTICLE_SELECTOR) or soup
+                content = body.get_text(separator='\n', strip=True)
 
             if not content:
                 print(f"公正取引委員会: コンテンツ取得失敗 - {link}")
@@ -143,7 +137,7 @@ def fetch_jftc_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -157,6 +151,7 @@ def fetch_jftc_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
         except Exception as e:
             print(f"公正取引委員会: 要約中にエラー発生 - {e}")
@@ -2,7 +2,9 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -32,6 +34,7 @@ def fetch_kensatsu_news(max_count, execution_timestamp, executable_path):
     url      = f"{base_url}/oshirase/index.shtml"
     json_file = "./data/kensatsu.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # --- EdgeDriver 初期化 ---
     opts = Options()
@@ -71,7 +74,7 @@ def fetch_kensatsu_news(max_count, execution_timestamp, executable_path):
     # --- quit 後は文字列処理なので安全 ---
     news_items, new_cnt = [], 0
     for title, href in tmp:
-        if any(title == it["title"] for it in existing_data):
+        if title in seen or seen.claimed_elsewhere(href):
             continue
 
         try:
@@ -79,7 +82,7 @@ def fetch_kensatsu_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(href):
                 content = extract_text_from_pdf(href)
             else:
-                r = requests.get(href, headers={"User-Agent": ua}, timeout=10)
+                r = http_get(href, headers={"User-Agent": ua}, timeout=10)
                 r.encoding = "utf-8"
                 content = r.text
             if not content:
@@ -88,7 +91,7 @@ def fetch_kensatsu_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_cnt < max_count:
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
 
             item = {
                 "pubDate": "",
@@ -100,6 +103,7 @@ def fetch_kensatsu_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(item)
             existing_data.append(item)
+            seen.add(item)
             new_cnt += 1
 
         except Exception as e:
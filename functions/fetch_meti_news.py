@@ -2,7 +2,9 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from validator_cache_oriike import parse_feed, commit_validators
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -26,14 +28,17 @@ options.use_chromium = True
 def fetch_meti_news(max_count, execution_timestamp, executable_path):
     """経済産業省の新着情報を収集・要約します。"""
     url = "https://www.meti.go.jp/ml_index_release_atom.xml"
-    feed = feedparser.parse(url)
+    feed = parse_feed(url)
+    if feed is None:
+        return []  # 前回から更新がない
     json_file = f"./data/meti.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
 
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen or seen.claimed_elsewhere(entry.link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"経済産業省: 記事取得開始 - {entry.title}")
@@ -50,6 +55,8 @@ def fetch_meti_news(max_count, execution_timestamp, executable_path):
         }
         new_news.append(news_item)
         existing_data.append(news_item)
+        seen.add(news_item)
 
     save_json(existing_data, json_file)
+    commit_validators(url)
     return new_news
\ No newline at end of file
@@ -9,8 +9,10 @@ from selenium.webdriver.edge.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
 from utilities_oriike import (
-    client, summarize_text, load_existing_data,
+    client, summarize_later, load_existing_data,
     save_json, is_pdf_link, extract_text_from_pdf
 )
 from urllib.parse import urljoin
@@ -33,6 +35,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
     base_url = "https://www.meti.go.jp"
     json_file = "./data/meti_oshirase.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
     organization = "経済産業省お知らせ"
     news_items = []
     new_count = 0
@@ -82,7 +85,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
             href = link.get_attribute("href")
             href = href if href.startswith("http") else urljoin(base_url, href)
 
-            if any(title == item['title'] for item in existing_data):
+            if title in seen or seen.claimed_elsewhere(href):
                 continue
 
             link_info_list.append((pub_date, title, href))
@@ -95,7 +98,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
                     content = extract_text_from_pdf(href)
                 elif href.startswith("https://wwws.meti.go.jp"):
                     try:
-                        response = requests.get(href, timeout=10)
+                        response = http_get(href, timeout=10)
                         response.encoding = "utf-8"
                         content = response.text
                     except Exception as e:
@@ -112,7 +115,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
 
                 summary = ""
                 if new_count < max_count:
-                    summary = summarize_text(title, content)
+                    summary = summarize_later(title, content)
 
                 news_item = {
                     'pubDate': pub_date,
@@ -125,6 +128,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
 
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1
 
             except Exception as e:
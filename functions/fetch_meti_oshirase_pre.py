@@ -3,6 +3,8 @@ import sys
 sys.path.append('c:/sasase/packages')
 sys.path.append('C:\sasase\ichiyasa\codespaces-jupyter-fsa-rss')
 import requests
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
 from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
@@ -33,6 +35,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
     json_file = f"./data/meti_oshirase.json"
     # 既存のデータをロード
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # 明示的に Chromium ベースを指定する capabilities は もう不要（Seleniumが自動対応）
     # ただし options.set_capability を加えると安定性UP
@@ -82,14 +85,14 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
             href = href if href.startswith("http") else "https://www.meti.go.jp" + href
             print(f"{pub_date} - {title} → {href}")
             
-            if any(title == item['title'] for item in existing_data):
+            if title in seen or seen.claimed_elsewhere(href):
                 continue
             print(f"経済産業省お知らせ: 記事取得開始 - {title}")
             try:
                 if is_pdf_link(href):
                     content = extract_text_from_pdf(href)
                 else:
-                    response = requests.get(href)
+                    response = http_get(href)
                     response.encoding = 'UTF-8'
                     content = response.text
                     print(content)
@@ -112,6 +115,7 @@ def fetch_meti_oshirase(max_count, execution_timestamp, executable_path):
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"経済産業省お知らせ: 要約中にエラー発生 - {e}")
@@ -3,6 +3,9 @@ import sys
 sys.path.append('c:/sasase/packages')
 sys.path.append('C:\sasase\ichiyasa\codespaces-jupyter-fsa-rss')
 import requests
+from http_oriike import http_get
+from validator_cache_oriike import parse_feed, commit_validators
+from dedup_oriike import DedupIndex
 from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
@@ -14,32 +17,37 @@ import feedparser
 def fetch_mic_news(max_count, execution_timestamp, executable_path):
     """総務省のリリースの新着情報を収集・要約します。"""
     url = "https://www.soumu.go.jp/news.rdf"
-    feed = feedparser.parse(url)
+    feed = parse_feed(url)
+    if feed is None:
+        return []  # 前回から更新がない
     json_file = f"./data/soumu_release.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     new_news = []
     new_count = 0  # カウンターを追加
+    failed = False  # 取得できなかった記事があれば、一覧の ETag / Last-Modified を保存せずに次回取得し直す
     for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen or seen.claimed_elsewhere(entry.link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"総務省: 記事取得開始 - {entry.title}")
         
-        if any(entry.title == item['title'] for item in existing_data):
+        if entry.title in seen:
             continue
         print(f"総務省お知らせ: 記事取得開始 - {entry.title}")
         try:
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'UTF-8'
                 content = response.text
                 #print(content)
             
             if not content:
                 print(f"総務省お知らせ: コンテンツ取得失敗 - {entry.link}")
+                failed = True
                 continue
         
             summary = ""
@@ -57,11 +65,15 @@ def fetch_mic_news(max_count, execution_timestamp, executable_path):
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
+            failed = True
             print(f"総務省お知らせ: 要約中にエラー発生 - {e}")
         
 
 
     save_json(existing_data, json_file)
+    if not failed:
+        commit_validators(url)
     return new_news
\ No newline at end of file
@@ -2,13 +2,14 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from async_oriike import collect_source
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -23,22 +24,9 @@ options.add_argument("--start-maximized")
 options.use_chromium = True
 
 
-def fetch_mlit_disaster_info(max_count, execution_timestamp, executable_path):
-    """国土交通省の災害・防災情報を収集・要約します。"""
-    url = "https://www.mlit.go.jp/saigai/index.html"
-    json_file = f"./data/mlit_disaster.json"
-    existing_data = load_existing_data(json_file)
-
-    try:
-        response = requests.get(url)
-        response.encoding = 'UTF-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
-    except Exception as e:
-        print(f"国土交通省: ページ取得中にエラー発生 {e}")
-        return []
-
-    news_items = []
-    new_count = 0  # カウンターを追加
+def parse_disaster_list(text):
+    """災害・防災情報のページから記事の一覧を取り出します。"""
+    soup = BeautifulSoup(text, 'html.parser')
 
     # 災害情報のリストを取得
     disaster_section = soup.find('div', class_='SaigaiPressRelease01')
@@ -46,6 +34,7 @@ def fetch_mlit_disaster_info(max_count, execution_timestamp, executable_path):
         print("災害情報のセクションが見つかりません。")
         return []
 
+    entries = []
     for dd in disaster_section.find_all('dd'):
         text_p = dd.find('p', class_='text')
         if not text_p:
@@ -60,47 +49,29 @@ def fetch_mlit_disaster_info(max_count, execution_timestamp, executable_path):
             link = "https://www.mlit.go.jp" + link
 
         # 日付の抽出
-        # 例: "令和6年9月20日からの大雨による被害状況等について（第11報　2024年9月26日 08時00分現在）"
+        # 例: "令和6年9月20日からの大雨による被害状況等について（第11報　2024年9月26日 08時00分現在）"
         try:
             pub_date_str = title.split('（')[1].split('報')[1].split('）')[0].strip()
-            pub_date = datetime.datetime.strptime(pub_date_str, '%Y年%m月%d日 %H時%M分現在').strftime('%Y-%m-%d %H:%M:%S')
+            pub_date = datetime.datetime.strptime(pub_date_str, '%Y年%m月%d日 %H時%M分現在').strftime('%Y-%m-%d %H:%M:%S')
         except:
             pub_date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        # 既存のニュースに含まれているか確認
-        if any(title == item['title'] for item in existing_data):
-            continue  # 既に存在するニュースはスキップ
+        entries.append({'title': title, 'link': link, 'pubDate': pub_date})
+    return entries
 
-        print(f"国土交通省: 記事取得開始 - {title}")
-        try:
-            if is_pdf_link(link):
-                content = extract_text_from_pdf(link)
-            else:
-                response = requests.get(link)
-                response.encoding = 'UTF-8'
-                content = response.text
-
-            if not content:
-                print(f"国土交通省: コンテンツ取得失敗 - {link}")
-                continue
 
-            summary = ""
-            if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(title, content)
+# 非同期エンジン（async_oriike）で取得する情報取得源の定義
+SOURCE = {
+    'organization': "国土交通省",
+    'url': "https://www.mlit.go.jp/saigai/index.html",
+    'json_file': "./data/mlit_disaster.json",
+    'parse': parse_disaster_list,
+    # 被害状況は更新のたびに「（第N報 …現在）」の新しい記事になるため、前の報とほとんど同じものは要約しない
+    # （しきい値を実際の報で確かめるまでは、捨てずに duplicate_of を付けて出力に残す）
+    'near_duplicate': "flag",
+}
 
-            news_item = {
-                'pubDate': pub_date,
-                'execution_timestamp': execution_timestamp,
-                'organization': "国土交通省",
-                'title': title,
-                'link': link,
-                'summary': summary
-            }
-            news_items.append(news_item)
-            existing_data.append(news_item)
-            new_count += 1  # カウンターを増加
-        except Exception as e:
-            print(f"国土交通省: 要約中にエラー発生 - {e}")
 
-    save_json(existing_data, json_file)
-    return news_items
\ No newline at end of file
+def fetch_mlit_disaster_info(max_count, execution_timestamp, executable_path):
+    """国土交通省の災害・防災情報を収集・要約します。"""
+    return collect_source(SOURCE, max_count, execution_timestamp)
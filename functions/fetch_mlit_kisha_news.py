@@ -2,7 +2,10 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from validator_cache_oriike import parse_feed, commit_validators
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -26,16 +29,20 @@ options.use_chromium = True
 def fetch_mlit_kisha_news(max_count, execution_timestamp, executable_path):
     """国土交通省_記者会見の新着情報を収集・要約します。"""
     url = "https://www.mlit.go.jp/index.rdf"
-    feed = feedparser.parse(url)
+    feed = parse_feed(url)
+    if feed is None:
+        return []  # 前回から更新がない
     json_file = f"./data/mlit_kisha.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data, ('title', 'pubDate'))
 
     new_news = []
     new_count = 0  # カウンターを追加
 
+    failed = False  # 取得できなかった記事があれば、一覧の ETag / Last-Modified を保存せずに次回取得し直す
     for entry in feed.entries:
         # 既に存在するニュース(タイトルが同じかつ更新日時が同じ場合)はスキップ
-        if any(entry.title + entry.updated == item['title'] + item['pubDate'] for item in existing_data):
+        if (entry.title, entry.updated) in seen or seen.claimed_elsewhere(entry.link):
             continue
 
         print(f"国土交通省_記者会見: 記事取得開始 - {entry.title}, {entry.updated}")
@@ -44,18 +51,19 @@ def fetch_mlit_kisha_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(entry.link):
                 content = extract_text_from_pdf(entry.link)
             else:
-                response = requests.get(entry.link)
+                response = http_get(entry.link)
                 response.encoding = 'utf-8'
                 content = response.text
 
             if not content:
                 print(f"国土交通省_記者会見: コンテンツ取得失敗 - {entry.link}")
+                failed = True
                 continue
 
             summary = ""
             # 新しい記事がmax_count件に達していない場合は要約を実行
             if new_count < max_count:
-                summary = summarize_text(entry.title, content)
+                summary = summarize_later(entry.title, content)
 
             # ニュースアイテムを作成
             news_item = {
@@ -68,11 +76,15 @@ def fetch_mlit_kisha_news(max_count, execution_timestamp, executable_path):
             }
             new_news.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
 
         except Exception as e:
+            failed = True
             print(f"国土交通省_記者会見: 要約中にエラー発生 - {e}")
 
     # 既存データを更新してJSONファイルに保存
     save_json(existing_data, json_file)
+    if not failed:
+        commit_validators(url)
     return new_news
\ No newline at end of file
@@ -2,13 +2,14 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from async_oriike import collect_source, parse_feed_entries
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -23,50 +24,15 @@ options.add_argument("--start-maximized")
 options.use_chromium = True
 
 
-def fetch_mlit_news(max_count, execution_timestamp, executable_path):
-    """国土交通省の新着情報を収集・要約します。"""
-    url = "https://www.mlit.go.jp/pressrelease.rdf"
-    feed = feedparser.parse(url)
-    json_file = f"./data/mlit-pressrelease.json"
-    existing_data = load_existing_data(json_file)
-
-    new_news = []
-    new_count = 0  # カウンターを追加
-
-    for entry in feed.entries:
-        if any(entry.title == item['title'] for item in existing_data):
-            continue  # 既に存在するニュースはスキップ
-
-        print(f"国土交通省_プレスリリース: 記事取得開始 - {entry.title}")
-        try:
-            if is_pdf_link(entry.link):
-                content = extract_text_from_pdf(entry.link)
-            else:
-                response = requests.get(entry.link)
-                response.encoding = 'utf-8'
-                content = response.text
+# 非同期エンジン（async_oriike）で取得する情報取得源の定義
+SOURCE = {
+    'organization': "国土交通省_プレスリリース",
+    'url': "https://www.mlit.go.jp/pressrelease.rdf",
+    'json_file': "./data/mlit-pressrelease.json",
+    'parse': parse_feed_entries,
+}
 
-            if not content:
-                print(f"国土交通省_プレスリリース: コンテンツ取得失敗 - {entry.link}")
-                continue
 
-            summary = ""
-            if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                summary = summarize_text(entry.title, content)
-
-            news_item = {
-                'pubDate': entry.updated,
-                'execution_timestamp': execution_timestamp,
-                'organization': "国土交通省_プレスリリース",
-                'title': entry.title,
-                'link': entry.link,
-                'summary': summary
-            }
-            new_news.append(news_item)
-            existing_data.append(news_item)
-            new_count += 1  # カウンターを増加
-        except Exception as e:
-            print(f"国土交通省_プレスリリース: 要約中にエラー発生 - {e}")
-
-    save_json(existing_data, json_file)
-    return new_news
\ No newline at end of file
+def fetch_mlit_news(max_count, execution_timestamp, executable_path):
+    """国土交通省の新着情報を収集・要約します。"""
+    return collect_source(SOURCE, max_count, execution_timestamp)
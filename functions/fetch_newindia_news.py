@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,17 +32,16 @@ def fetch_newindia_news(max_count, execution_timestamp, executable_path):
     url = "https://www.newindia.co.jp/topics/"  # 最新情報ページのURLを指定
     json_file = f"./data/newindia.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "div#nProgram")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"ニューインディア: ページ取得中にエラー発生 - {e}")
@@ -80,7 +83,7 @@ def fetch_newindia_news(max_count, execution_timestamp, executable_path):
         elif not link.startswith('http'):
             link = "https://www.newindia.co.jp/" + link
 
-        if any(title == item['title'] for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"ニューインディア: 記事取得開始 - {title}")
@@ -88,7 +91,7 @@ def fetch_newindia_news(max_count, execution_timestamp, executable_path):
             if is_pdf_link(link):
                 content = extract_text_from_pdf(link)
             else:
-                response = requests.get(link)
+                response = http_get(link)
                 response.encoding = 'UTF-8'
                 content = response.text
 
@@ -108,7 +111,7 @@ def fetch_newindia_news(max_count, execution_timestamp, executable_path):
                     # 見つからない場合は全文を使用
                     text_content = soup_content.get_text(separator='\n', strip=True)
 
-                summary = summarize_text(title, text_content)
+                summary = summarize_later(title, text_content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -120,6 +123,7 @@ def fetch_newindia_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1  # カウンターを増加
         except Exception as e:
             print(f"ニューインディア: 要約中にエラー発生 - {e}")
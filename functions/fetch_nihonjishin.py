@@ -2,13 +2,16 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,13 +31,12 @@ def fetch_nihonjishin(max_count, execution_timestamp, executable_path):
     url = "https://www.nihonjishin.co.jp/news.html"
     json_file = "./data/nihonjishin_news.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
@@ -97,7 +99,7 @@ def fetch_nihonjishin(max_count, execution_timestamp, executable_path):
 
                 # カテゴリーを追加
                 # チェック: 既に存在するか
-                if any(title == item.get('title') for item in existing_data):
+                if title in seen or seen.claimed_elsewhere(link):
                     continue
 
                 print(f"日本地震再保険: 記事取得開始 - {title}")
@@ -105,7 +107,7 @@ def fetch_nihonjishin(max_count, execution_timestamp, executable_path):
                     if is_pdf_link(link):
                         content = extract_text_from_pdf(link)
                     else:
-                        response = requests.get(link)
+                        response = http_get(link)
                         response.raise_for_status()
                         response.encoding = 'UTF-8'
                         content_soup = BeautifulSoup(response.text, 'html.parser')
@@ -118,7 +120,7 @@ def fetch_nihonjishin(max_count, execution_timestamp, executable_path):
 
                     summary = ""
                     if new_count < max_count:
-                        summary = summarize_text(title, content)
+                        summary = summarize_later(title, content)
 
                     news_item = {
                         'pubDate': pub_date,
@@ -131,6 +133,7 @@ def fetch_nihonjishin(max_count, execution_timestamp, executable_path):
                     }
                     news_items.append(news_item)
                     existing_data.append(news_item)
+                    seen.add(news_item)
                     new_count += 1
                 except Exception as e:
                     print(f"日本地震再保険: 要約中にエラー発生 - {e}")
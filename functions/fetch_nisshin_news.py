@@ -2,7 +2,9 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
@@ -28,9 +30,10 @@ def fetch_nisshin_news(max_count, execution_timestamp, executable_path):
     url = "https://www.nisshinfire.co.jp/news_release/"  # ニュースリリースページのURL
     json_file = f"./data/nisshin_fire_news_release.json"  # 保存するJSONファイルのパス
     existing_data = load_existing_data(json_file)  # 既存のデータをロード
+    seen = DedupIndex(existing_data)
 
     try:
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
     except Exception as e:
@@ -68,7 +71,7 @@ def fetch_nisshin_news(max_count, execution_timestamp, executable_path):
             size_text = tds[0].get_text(strip=True).split('(')[-1].rstrip(')') if '(' in tds[0].get_text() else ""
 
             # 既に存在するニュースか確認
-            if any(title == item['title'] for item in existing_data):
+            if title in seen or seen.claimed_elsewhere(link):
                 continue  # 既存のニュースはスキップ
 
             print(f"日新火災海上保険_news_release: 記事取得開始 - {title}")
@@ -78,7 +81,7 @@ def fetch_nisshin_news(max_count, execution_timestamp, executable_path):
                 content = extract_text_from_pdf(link)
             else:
                 try:
-                    page_response = requests.get(link)
+                    page_response = http_get(link)
                     page_response.raise_for_status()
                     page_soup = BeautifulSoup(page_response.content, 'html.parser')
                     # ニュース内容の抽出方法は実際のページ構造に合わせて調整
@@ -95,7 +98,7 @@ def fetch_nisshin_news(max_count, execution_timestamp, executable_path):
 
             # ニュースの要約
             if new_count < max_count:
-                summary = summarize_text(title, content)
+                summary = summarize_later(title, content)
             else:
                 summary = ""
 
@@ -111,6 +114,7 @@ def fetch_nisshin_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -30,15 +34,14 @@ def fetch_nisshinfire_news(max_count, execution_timestamp, executable_path):
 
     # 既存データのロード
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "table.newsinfo__idx__table")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"日新火災: ページ取得中にエラー発生 - {e}")
@@ -103,7 +106,7 @@ def fetch_nisshinfire_news(max_count, execution_timestamp, executable_path):
         title_text = a_tag.get_text(strip=True)
 
         # 重複チェック
-        if any(item['title'] == title_text for item in existing_data):
+        if title_text in seen or seen.claimed_elsewhere(link):
             continue
 
         print(f"日新火災: 記事取得開始 - {title_text}")
@@ -115,7 +118,7 @@ def fetch_nisshinfire_news(max_count, execution_timestamp, executable_path):
                 content = extract_text_from_pdf(link)
             else:
                 # 通常Webページの場合
-                response = requests.get(link, verify=False)  # 必要なら証明書をチェック
+                response = http_get(link, verify=False)  # 必要なら証明書をチェック
                 response.encoding = 'utf-8'
                 content = response.text
 
@@ -126,7 +129,7 @@ def fetch_nisshinfire_news(max_count, execution_timestamp, executable_path):
             summary = ""
             # max_count を超えない範囲でのみ要約を実行（例: 3件まで要約など）
             if new_count < max_count:
-                summary = summarize_text(title_text, content)
+                summary = summarize_later(title_text, content)
 
             news_item = {
                 'pubDate': pub_date,
@@ -140,6 +143,7 @@ def fetch_nisshinfire_news(max_count, execution_timestamp, executable_path):
 
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
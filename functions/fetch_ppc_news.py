@@ -2,13 +2,16 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 # from selenium.webdriver.edge.options import Options
@@ -32,6 +35,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
     url = "https://www.ppc.go.jp/information/"
     json_file = f"./data/ppc.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # # ただし options.set_capability を加えると安定性UP
     # options.set_capability("browserName", "MicrosoftEdge")
@@ -43,7 +47,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
     driver = webdriver.Chrome(options=options)
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "ul.news-list")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"個人情報保護委員会: ページ取得中にエラー発生 - {e}")
@@ -82,7 +86,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
                 link = "https://www.ppc.go.jp" + link
 
             # 既存のデータに存在するかチェック
-            if any(title == item['title'] for item in existing_data):
+            if title in seen or seen.claimed_elsewhere(link):
                 continue  # 既に存在するニュースはスキップ
 
             print(f"個人情報保護委員会: 記事取得開始 - {title}")
@@ -90,7 +94,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'UTF-8'
                     content = response.text
 
@@ -100,7 +104,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
 
                 summary = ""
                 if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                    summary = summarize_text(title, content)
+                    summary = summarize_later(title, content)
 
                 news_item = {
                     'pubDate': pub_date,
@@ -112,6 +116,7 @@ def fetch_ppc_news(max_count, execution_timestamp, executable_path):
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
                 new_count += 1  # カウンターを増加
             except Exception as e:
                 print(f"個人情報保護委員会: 要約中にエラー発生 - {e}")
@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,17 +32,16 @@ def fetch_rakuten_news(max_count, execution_timestamp, executable_path):
     url = "https://www.rakuten-sonpo.co.jp/news/tabid/85/Default.aspx"
     json_file = f"./data/rakuten_sonpo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)
+        wait_for(driver, "div.ViewAnnouncements")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"楽天損保: ページ取得中にエラー発生 - {e}")
@@ -76,7 +79,7 @@ def fetch_rakuten_news(max_count, execution_timestamp, executable_path):
             summary = summary_tag.get_text(strip=True) if summary_tag else ""
 
             # 既存のデータに存在するか確認
-            if any(item['title'] == title for item in existing_data):
+            if title in seen or seen.claimed_elsewhere(link):
                 continue  # 既に存在するニュースはスキップ
 
             print(f"楽天損保: 記事取得開始 - {title}")
@@ -84,7 +87,7 @@ def fetch_rakuten_news(max_count, execution_timestamp, executable_path):
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.raise_for_status()
                     response.encoding = 'UTF-8'
                     page_soup = BeautifulSoup(response.text, 'html.parser')
@@ -104,7 +107,7 @@ def fetch_rakuten_news(max_count, execution_timestamp, executable_path):
 
                 summary_generated = ""
                 if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                    summary_generated = summarize_text(title, content)
+                    summary_generated = summarize_later(title, content)
                     new_count += 1  # カウンターを増加
 
                 news_item = {
@@ -117,6 +120,7 @@ def fetch_rakuten_news(max_count, execution_timestamp, executable_path):
                 }
                 news_items.append(news_item)
                 existing_data.append(news_item)
+                seen.add(news_item)
             except Exception as e:
                 print(f"楽天損保: 要約中にエラー発生 - {e}")
 
@@ -2,13 +2,17 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from browser_profile_oriike import wait_for
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -28,17 +32,16 @@ def fetch_sonpohogo_news(max_count, execution_timestamp, executable_path):
     url = "http://www.sonpohogo.or.jp/"  # 最新情報ページのURLを設定
     json_file = "./data/sonpohogo.json"
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
 
     try:
         driver.get(url)
-        driver.implicitly_wait(10)  # ページの読み込みを待機
+        wait_for(driver, "div.whatnew")  # ニュース一覧が現れた時点で読み取る
         soup = BeautifulSoup(driver.page_source, 'html.parser')
     except Exception as e:
         print(f"損保機構: ページ取得中にエラー発生 - {e}")
@@ -82,7 +85,7 @@ def fetch_sonpohogo_news(max_count, execution_timestamp, executable_path):
             link = ""
 
         # 既存のデータに存在するかチェック
-        if any(title == item['title'] for item in existing_data):
+        if title in seen or seen.claimed_elsewhere(link):
             continue  # 既に存在するニュースはスキップ
 
         print(f"損保機構: 記事取得開始 - {title}")
@@ -93,7 +96,7 @@ def fetch_sonpohogo_news(max_count, execution_timestamp, executable_path):
                 if is_pdf_link(link):
                     content = extract_text_from_pdf(link)
                 else:
-                    response = requests.get(link)
+                    response = http_get(link)
                     response.encoding = 'EUC-JP'  # ソースがEUC-JPエンコーディングのため
                     content = response.text
 
@@ -102,7 +105,7 @@ def fetch_sonpohogo_news(max_count, execution_timestamp, executable_path):
                     continue
 
                 if new_count < max_count:  # 新しい記事がmax_count件に達したら要約をスキップ
-                    summary = summarize_text(title, content)
+                    summary = summarize_later(title, content)
                     new_count += 1  # カウンターを増加
 
             news_item = {
@@ -115,6 +118,7 @@ def fetch_sonpohogo_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
 
         except Exception as e:
             print(f"損保機構: 要約中にエラー発生 - {e}")
@@ -2,13 +2,16 @@
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -31,13 +34,12 @@ def fetch_yamap_sonpo_news(max_count, execution_timestamp, executable_path):
 
     # 既存データのロード（外部 or グローバルで定義されている想定）
     existing_data = load_existing_data(json_file)
+    seen = DedupIndex(existing_data)
 
     # ただし options.set_capability を加えると安定性UP
     options.set_capability("browserName", "MicrosoftEdge")
-    # Edgeドライバのパス（バージョン135に対応したmsedgedriver.exeを配置済み）
-    service = EdgeService(executable_path=executable_path)
-    # ドライバ起動
-    driver = webdriver.Edge(service=service, options=options)
+    # 起動済みのドライバをプールから借りる（quit()でプールに返却される）
+    driver = borrow_driver(executable_path, options)
     try:
         driver.get(url)
         driver.implicitly_wait(10)
@@ -91,7 +93,7 @@ def fetch_yamap_sonpo_news(max_count, execution_timestamp, executable_path):
             continue
 
         # 重複チェック
-        if any(item['title'] == title_text for item in existing_data):
+        if title_text in seen or seen.claimed_elsewhere(full_link):
             continue
 
         print(f"ヤマップ損保: 記事取得 - 日付: {pub_date}, タイトル: {title_text}")
@@ -99,7 +101,7 @@ def fetch_yamap_sonpo_news(max_count, execution_timestamp, executable_path):
         try:
             # (3) コンテンツ取得 & 要約
             #     必要に応じて PDF判定などを追加
-            resp = requests.get(full_link, verify=False)
+            resp = http_get(full_link, verify=False)
             resp.encoding = 'utf-8'
             content = resp.text
 
@@ -109,7 +111,7 @@ def fetch_yamap_sonpo_news(max_count, execution_timestamp, executable_path):
 
             summary = ""
             if new_count < max_count:
-                summary = summarize_text(title_text, content)
+                summary = summarize_later(title_text, content)
 
             # (4) news_itemにまとめる
             news_item = {
@@ -123,6 +125,7 @@ def fetch_yamap_sonpo_news(max_count, execution_timestamp, executable_path):
             }
             news_items.append(news_item)
             existing_data.append(news_item)
+            seen.add(news_item)
             new_count += 1
 
         except Exception as e:
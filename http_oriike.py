@@ -0,0 +1,63 @@
+# すべての取得関数で共有するHTTPセッションです。
+# ホストごとに接続を使い回し（keep-alive）、TCP/TLSの接続をリクエストのたびに張り直さないようにする。
+# タイムアウト・リトライ・ヘッダーの既定値もここで一元的に設定する。
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ratelimit_oriike import host_slot
+
+DEFAULT_TIMEOUT = (5, 30)   # (接続, 読み込み)のタイムアウト（秒）
+POOL_CONNECTIONS = 64       # 接続を保持するホストの数
+POOL_MAXSIZE = 8            # 1ホストあたりに保持する接続の数
+
+try:
+    # brotli がインストールされていれば br でも受け取る（urllib3 が自動で展開する）
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0"),
+    "Accept-Language": "ja,en-US;q=0.8,en;q=0.6",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class _Session(requests.Session):
+    """timeout を指定しなかったリクエストに既定のタイムアウトを設定するセッションです。"""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+def get_session():
+    """共有のHTTPセッションを返します。"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = _Session()
+            session.headers.update(DEFAULT_HEADERS)
+            retry = Retry(total=2, backoff_factor=1,
+                          status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=("GET", "HEAD"))
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                  pool_maxsize=POOL_MAXSIZE,
+                                  max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def http_get(url, **kwargs):
+    """共有セッションでGETします。引数は requests.get と同じです。ホストごとの頻度・同時接続数の制限に従います。"""
+    with host_slot(url):
+        return get_session().get(url, **kwargs)
@@ -0,0 +1,157 @@
+# 情報取得源（fetch_*関数）を別プロセスで実行し、制限時間を超えたらドライバごと強制終了するためのユーティリティです。
+# 20241105 fetch_meti_news のように処理が止まる取得源があっても、後続の取得源が待たされないようにする。
+#
+# 子プロセスは取得源ごとに起動し直さず、実行するスレッドごとに1つを使い回す。起動したブラウザ
+# （driver_pool_oriike のプール）も子プロセスが終わるまで残るため、後の取得源が同じブラウザを借りられる。
+# 制限時間を超えた・異常終了した子プロセスだけを強制終了して作り直す。
+import os
+import sys
+import signal
+import subprocess
+import time
+import queue
+import atexit
+import threading
+import multiprocessing
+from run_journal_oriike import source_context
+from summary_service_oriike import resolve_summaries
+
+SOURCE_TIMEOUT = 600    # 1つの取得源にかけてよい最大時間（秒）
+MAX_TASKS_PER_WORKER = 20   # 1つの子プロセスで実行する取得源の数の上限（超えたら作り直す）
+
+_local = threading.local()
+_workers = set()
+_workers_lock = threading.Lock()
+
+
+def _close_browsers():
+    # 子プロセスの終了時には atexit が呼ばれないため、起動済みのブラウザはここで終了する
+    for module_name, closer in (("driver_pool_oriike", "close_pools"),
+                                ("tab_renderer_oriike", "close_renderers")):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, closer)()
+
+
+def _serve(task_queue, result_queue):
+    """子プロセス側で取得関数を順に実行し、結果をキューに入れます。None を受け取ったら終了します。"""
+    if os.name != "nt":
+        # ドライバ・ブラウザも含めてまとめて終了できるよう、新しいプロセスグループにする
+        os.setsid()
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            name, func, args = task
+            try:
+                with source_context(name):
+                    result_queue.put(("ok", resolve_summaries(func(*args) or [])))
+            except Exception as e:
+                result_queue.put(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        _close_browsers()
+
+
+def kill_process_tree(pid):
+    """プロセスとその子孫（chromedriver/msedgedriver とブラウザ）を強制終了します。"""
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class _Worker:
+    """取得関数を順に実行する子プロセスです。"""
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self.tasks = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(target=_serve, args=(self.tasks, self.results), daemon=True)
+        self.process.start()
+        self.count = 0
+
+    def close(self, timeout=30):
+        """実行中の取得源がなければ、ブラウザを終了させてから子プロセスを終了します。"""
+        if self.process.is_alive():
+            self.tasks.put(None)
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+
+    def kill(self):
+        kill_process_tree(self.process.pid)
+        self.process.kill()
+        self.process.join(5)
+
+
+def _take_worker():
+    """このスレッドの子プロセスを返します（まだなければ起動します）。"""
+    worker = getattr(_local, 'worker', None)
+    if worker is None or not worker.process.is_alive():
+        worker = _local.worker = _Worker()
+        with _workers_lock:
+            _workers.add(worker)
+    return worker
+
+
+def _drop_worker(worker, kill=False):
+    _local.worker = None
+    with _workers_lock:
+        _workers.discard(worker)
+    if kill:
+        worker.kill()
+    else:
+        worker.close()
+
+
+@atexit.register
+def close_workers():
+    """すべての子プロセスを終了します（起動済みのブラウザも終了します）。"""
+    with _workers_lock:
+        workers = list(_workers)
+        _workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+def run_isolated(name, func, args=(), timeout=SOURCE_TIMEOUT):
+    """取得関数を別プロセスで実行します。
+
+    (状態, ニュースのリスト, 経過秒数) を返します。状態は "ok" / "error" / "timeout" のいずれかで、
+    "ok" 以外のときニュースのリストは空です。func と args は pickle できる必要があります
+    （モジュールのトップレベルで定義された関数を渡してください）。
+    """
+    worker = _take_worker()
+    started = time.monotonic()
+    worker.tasks.put((name, func, args))
+
+    # 結果は子プロセスの終了前に受け取る（大きなリストでパイプが詰まらないようにする）
+    deadline = started + timeout
+    while True:
+        try:
+            status, payload = worker.results.get(timeout=1)
+            break
+        except queue.Empty:
+            if not worker.process.is_alive():
+                status, payload = "error", f"プロセスが異常終了しました (exitcode={worker.process.exitcode})"
+                _drop_worker(worker, kill=True)
+                break
+            if time.monotonic() >= deadline:
+                print(f"⏱️ {name}: {timeout}秒以内に終わらなかったため強制終了します。")
+                _drop_worker(worker, kill=True)
+                return "timeout", [], time.monotonic() - started
+
+    worker.count += 1
+    if worker.count >= MAX_TASKS_PER_WORKER and worker.process.is_alive():
+        _drop_worker(worker)
+    elapsed = time.monotonic() - started
+    if status == "error":
+        print(f"⚠️ {name} の取得でエラー発生: {payload}")
+        return "error", [], elapsed
+    return "ok", payload or [], elapsed
@@ -0,0 +1,130 @@
+# 取得源ごとの既存データを JSON Lines（1行1レコード）で保存するための追記専用ストアです。
+# 毎回ファイル全体を indent=4 で書き直さず、新しい記事だけを末尾に追記して fsync する。
+# ./data/<取得源>.json（JSON配列）は初回読み込み時に ./data/<取得源>.jsonl へ変換し、以降は .jsonl だけを使う。
+#
+#     python jsonl_store_oriike.py convert   # ./data/*.json をまとめて変換する
+#     python jsonl_store_oriike.py compact   # ./data/*.jsonl の重複行・壊れた行を取り除く
+import os
+import sys
+import glob
+import json
+
+DATA_DIR = "./data"
+COMPACT_RATIO = 1.2     # 行数が重複を除いたレコード数のこの倍数を超えたら圧縮する
+
+
+def jsonl_path(json_file):
+    """./data/xxx.json に対応する ./data/xxx.jsonl のパスを返します。"""
+    root, _ = os.path.splitext(json_file)
+    return root + ".jsonl"
+
+
+def iter_records(path):
+    """JSON Linesファイルのレコードを1件ずつ返します（全件をメモリに読み込みません）。
+
+    書き込み途中で中断された行など、解析できない行は読み飛ばします。
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"⚠️ 壊れた行を読み飛ばします: {path}")
+
+
+def append_records(path, records):
+    """レコードをファイルの末尾に追記し、ディスクに書き出されるまで待ちます。
+
+    前回の追記が行の途中で中断されていた場合は、改行を補ってから追記します（壊れた行に次のレコードがつながらないようにする）。
+    """
+    if not records:
+        return
+    lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    with open(path, 'a+b') as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                lines = "\n" + lines
+        f.write(lines.encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_records(path, records):
+    """ファイル全体を書き直します（一時ファイルに書いてから置き換えます）。"""
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def _record_key(record):
+    return (record.get('title'), record.get('link'), record.get('pubDate'))
+
+
+def compact(path):
+    """重複したレコード（同じタイトル・リンク・日付）と壊れた行を取り除きます。
+
+    同じキーのレコードは後から書かれた内容で上書きし、並び順は最初に現れた位置を保ちます。
+    取り除いた行数を返します。
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'r', encoding='utf-8') as f:
+        line_count = sum(1 for line in f if line.strip())
+    records = {}
+    for record in iter_records(path):
+        records[_record_key(record)] = record
+    removed = line_count - len(records)
+    if removed:
+        write_records(path, records.values())
+    return removed
+
+
+def needs_compaction(line_count, record_count):
+    return record_count and line_count > record_count * COMPACT_RATIO
+
+
+def convert_json_to_jsonl(json_file):
+    """JSON配列のファイルを JSON Lines に変換します。JSON配列でないファイルは変換せず False を返します。"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        return False
+    write_records(jsonl_path(json_file), data)
+    return True
+
+
+def convert_all(data_dir=DATA_DIR):
+    """data_dir 内の JSON配列のファイルをまとめて JSON Lines に変換します（変換済みのものは飛ばします）。"""
+    for json_file in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+        if os.path.exists(jsonl_path(json_file)):
+            continue
+        if convert_json_to_jsonl(json_file):
+            print(f"変換しました: {json_file} -> {jsonl_path(json_file)}")
+
+
+def compact_all(data_dir=DATA_DIR):
+    """data_dir 内の JSON Lines ファイルをまとめて圧縮します。"""
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.jsonl"))):
+        removed = compact(path)
+        if removed:
+            print(f"圧縮しました: {path}（{removed}行を削除）")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "convert":
+        convert_all()
+    elif command == "compact":
+        compact_all()
+    else:
+        print("使い方: python jsonl_store_oriike.py convert|compact")
@@ -0,0 +1,114 @@
+# 情報取得源（fetch_*関数）を並列に実行するためのユーティリティです。
+import re
+import time
+import inspect
+from collections import deque
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from isolation_oriike import run_isolated, close_workers
+from ratelimit_oriike import host_concurrency
+from run_journal_oriike import current_journal, source_context
+from summary_service_oriike import resolve_summaries
+
+MAX_WORKERS = 8     # 全体で同時に実行する情報取得源の最大数
+
+# 直近の run_sources の実行結果（名前, 状態, 経過秒数）
+run_report = []
+
+
+def source_host(func):
+    """取得関数のソースコードに最初に現れるURLから、アクセス先のホスト名を推定します。"""
+    func = getattr(func, "func", func)  # functools.partial の場合は元の関数を見る
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return func.__name__
+    match = re.search(r'https?://[^\s"\'<>]+', source)
+    if not match:
+        return func.__name__
+    host = urlparse(match.group(0)).hostname or func.__name__
+    # www.の有無は同一サイトとみなす
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def _run_one(name, func, args, timeout):
+    """取得関数を1つ実行し、(状態, ニュースのリスト, 経過秒数) を返します。
+
+    timeout を指定した場合は別プロセスで実行し、制限時間を超えたら打ち切ります。
+    例外は握りつぶして空リストを返します。
+    """
+    print(f"# {name} から情報取得")
+    if timeout is not None:
+        status, items, elapsed = run_isolated(name, func, args, timeout)
+    else:
+        started = time.monotonic()
+        try:
+            with source_context(name):
+                status, items = "ok", resolve_summaries(func(*args) or [])
+        except Exception as e:
+            print(f"⚠️ {name} の取得でエラー発生: {e}")
+            status, items = "error", []
+        elapsed = time.monotonic() - started
+    if status == "ok":
+        print(f"{name} done")
+        journal = current_journal()
+        if journal is not None:
+            journal.mark_done(name, len(items))
+    return status, items, elapsed
+
+
+def run_sources(sources, args=(), max_workers=MAX_WORKERS, max_per_host=None, timeout=None):
+    """情報取得源を並列に実行し、結果を登録順に結合して返します。
+
+    sources は (名前, 取得関数) のリストです。各取得関数は args を引数に呼び出され、
+    list[dict] を返す前提です。同一ホストの取得源は max_per_host 件までしか同時に実行しません
+    （省略時は ratelimit_oriike のホストごとの同時接続数に従います）。
+    timeout（秒）を指定すると各取得源を別プロセスで実行し、制限時間を超えたものは打ち切って次に進みます。
+    """
+    run_report.clear()
+    hosts = [source_host(func) for _, func in sources]
+    results = [None] * len(sources)
+    pending = deque(range(len(sources)))
+    running = {}        # future -> 取得源のインデックス
+    host_running = {}   # ホスト名 -> 実行中の件数
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            # 空きのあるホストの取得源を登録順に投入する
+            deferred = deque()
+            while pending and len(running) < max_workers:
+                index = pending.popleft()
+                host = hosts[index]
+                if host_running.get(host, 0) >= (max_per_host or host_concurrency(host)):
+                    deferred.append(index)
+                    continue
+                name, func = sources[index]
+                future = executor.submit(_run_one, name, func, args, timeout)
+                running[future] = index
+                host_running[host] = host_running.get(host, 0) + 1
+            deferred.extend(pending)
+            pending = deferred
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                host_running[hosts[index]] -= 1
+                status, items, elapsed = future.result()
+                results[index] = items
+                run_report.append((sources[index][0], status, elapsed))
+
+    if timeout is not None:
+        # 取得源の子プロセスは run_sources の中だけで使い回す（ジャーナルなどの環境変数が変わる次の実行には残さない）
+        close_workers()
+
+    for name, status, elapsed in run_report:
+        if status != "ok":
+            print(f"⚠️ {name}: {status} ({elapsed:.0f}秒)")
+
+    # 登録順に結合する（取得源ごとにリストをコピーし直さない）
+    all_news = []
+    for items in results:
+        all_news.extend(items)
+    return all_news
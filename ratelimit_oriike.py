@@ -0,0 +1,248 @@
+# ホストごとのリクエスト頻度（トークンバケット）と同時接続数の制限です。
+# 取得源を並列に実行すると、mlit.go.jp や cao.go.jp のように複数の取得源が同じホストに集中するため、
+# HTTPセッション・フィード取得・ブラウザのすべてがこの制限を通してアクセスする。
+#
+# ホストごとの設定は HOST_LIMITS で行い、./data/rate_limits.json があればその内容で上書きする。
+#     {"mlit.go.jp": {"rate": 1.0, "burst": 2, "concurrency": 2}}
+# rate は1秒あたりのリクエスト数、burst は連続して送れるリクエスト数、concurrency は同時接続数。
+# リクエスト頻度は SharedTokenBucket（状態を SQLite のファイルに置くトークンバケット）でホストごとに
+# 全プロセスが共有するため、別プロセスで動く取得源が同じホストにアクセスしても上限は1つ分のまま。
+# 同時接続数はプロセスごとに掛かる（別プロセスで動く取得源どうしは run_sources の同時実行数で抑える）。
+# 要約の API の上限（summary_service_oriike）も同じ SharedTokenBucket で共有する。
+import os
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+RATE_LIMIT_FILE = "./data/rate_limits.json"
+SHARED_BUCKET_FILE = "./data/shared_buckets.sqlite3"
+STALE_SECONDS = 600     # これより長く使われていない共有のバケットは、作るときに設定の値に戻す
+
+DEFAULT_LIMIT = {"rate": 2.0, "burst": 4, "concurrency": 4}
+HOST_LIMITS = {
+    "mlit.go.jp": {"rate": 1.0, "burst": 2, "concurrency": 2},
+    "cao.go.jp": {"rate": 1.0, "burst": 2, "concurrency": 2},
+}
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+_config = None
+
+
+class TokenBucket:
+    """rate 件/秒で補充され、最大 burst 件まで貯まるトークンバケットです。
+
+    1回に複数のトークンを取ることもできます（LLMのトークン数の制限など）。burst を超える数は burst に切り詰めます。
+    """
+
+    def __init__(self, rate, burst):
+        self._rate = rate
+        self._capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        """補充の速さを変えます（それまでに貯まった分はそのまま）。"""
+        with self._lock:
+            self._refill()
+            self._rate = rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def try_acquire(self, amount=1):
+        """トークンが amount 個あれば取って True を、なければ False を返します。"""
+        amount = min(amount, self._capacity)
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return True
+            return False
+
+    def acquire(self, amount=1):
+        """トークンが amount 個補充されるまで待って取ります。"""
+        amount = min(amount, self._capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+class SharedTokenBucket:
+    """複数のプロセスで共有するトークンバケットです。TokenBucket と同じように使えます。
+
+    トークンの残りと補充の速さ（rate）は SQLite のファイルに置き、同じ name のバケットを全プロセスで共有します。
+    あるプロセスが rate を落とせば、他のプロセスも同じ速さになります。
+    """
+
+    def __init__(self, name, rate, burst, path=SHARED_BUCKET_FILE):
+        self.name = name
+        self.path = path
+        self._capacity = burst
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, rate REAL NOT NULL,"
+                         " tokens REAL NOT NULL, updated REAL NOT NULL)")
+            conn.execute("INSERT INTO buckets (name, rate, tokens, updated) VALUES (?, ?, ?, ?)"
+                         " ON CONFLICT(name) DO UPDATE SET rate = excluded.rate, tokens = excluded.tokens,"
+                         " updated = excluded.updated WHERE buckets.updated < ?",
+                         (name, rate, burst, now, now - STALE_SECONDS))
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _refill(self, conn):
+        rate, tokens, updated = conn.execute(
+            "SELECT rate, tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+        now = time.time()
+        tokens = min(self._capacity, tokens + max(0.0, now - updated) * rate)
+        return rate, tokens, now
+
+    @property
+    def rate(self):
+        row = self._connection().execute("SELECT rate FROM buckets WHERE name = ?", (self.name,)).fetchone()
+        return row[0]
+
+    @rate.setter
+    def rate(self, rate):
+        """補充の速さを変えます（それまでに貯まった分はそのまま）。"""
+        with self._transaction() as conn:
+            _, tokens, now = self._refill(conn)
+            conn.execute("UPDATE buckets SET rate = ?, tokens = ?, updated = ? WHERE name = ?",
+                         (rate, tokens, now, self.name))
+
+    def _take(self, amount):
+        """トークンが amount 個あれば取って 0 を、なければ補充されるまでの秒数を返します。"""
+        amount = min(amount, self._capacity)
+        with self._transaction() as conn:
+            rate, tokens, now = self._refill(conn)
+            wait = 0.0
+            if tokens >= amount:
+                tokens -= amount
+            else:
+                wait = (amount - tokens) / rate
+            conn.execute("UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?", (tokens, now, self.name))
+        return wait
+
+    def try_acquire(self, amount=1):
+        """トークンが amount 個あれば取って True を、なければ False を返します。"""
+        return self._take(amount) == 0
+
+    def acquire(self, amount=1):
+        """トークンが amount 個補充されるまで待って取ります。"""
+        while True:
+            wait = self._take(amount)
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class HostLimiter:
+    """1つのホストに対するリクエスト頻度（全プロセスで共有）と同時接続数（プロセスごと）の制限です。"""
+
+    def __init__(self, host, rate, burst, concurrency):
+        self.concurrency = concurrency
+        self._bucket = SharedTokenBucket(f"host:{host}", rate, burst)
+        self._slots = threading.BoundedSemaphore(concurrency)
+
+    def acquire(self):
+        """接続枠とトークンが空くまで待ちます。終わったら release() を呼んでください。"""
+        self._slots.acquire()
+        self._bucket.acquire()
+
+    def try_acquire(self):
+        """待たずに接続枠とトークンを取れれば True を返します。"""
+        if not self._slots.acquire(blocking=False):
+            return False
+        if not self._bucket.try_acquire():
+            self._slots.release()
+            return False
+        return True
+
+    def release(self):
+        self._slots.release()
+
+
+def host_key(url):
+    """URL（またはホスト名）から制限の単位となるホスト名を返します。www. は区別しません。"""
+    host = urlparse(url).hostname if "://" in url else url
+    host = (host or url).lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _host_config(host):
+    global _config
+    if _config is None:
+        config = dict(HOST_LIMITS)
+        if os.path.exists(RATE_LIMIT_FILE):
+            with open(RATE_LIMIT_FILE, 'r', encoding='utf-8') as f:
+                config.update(json.load(f))
+        _config = config
+    # サブドメインは親ドメインの設定に従う（例: www.mlit.go.jp, wwwtb.mlit.go.jp → mlit.go.jp）
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        limit = _config.get(".".join(parts[i:]))
+        if limit:
+            return {**DEFAULT_LIMIT, **limit}
+    return dict(DEFAULT_LIMIT)
+
+
+def get_limiter(url):
+    """URLのホストに対する HostLimiter を返します（プロセス内で共有し、リクエスト頻度は全プロセスで共有されます）。"""
+    key = host_key(url)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            config = _host_config(key)
+            limiter = _limiters[key] = HostLimiter(key, config["rate"], config["burst"], config["concurrency"])
+        return limiter
+
+
+def host_concurrency(url):
+    """URL（またはホスト名）のホストに許されている同時接続数を返します。"""
+    return _host_config(host_key(url))["concurrency"]
+
+
+@contextmanager
+def host_slot(url):
+    """URLのホストの制限内でアクセスするためのコンテキストマネージャです。"""
+    limiter = get_limiter(url)
+    limiter.acquire()
+    try:
+        yield
+    finally:
+        limiter.release()
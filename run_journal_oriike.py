@@ -0,0 +1,216 @@
+# 実行ジャーナルです。中断した実行（クラッシュ、Ctrl-C、スリープなど）を --resume で続きから再開できるようにする。
+#
+# ./data/runs/<実行ID>/ に次のファイルを書く。
+#     run.json       実行日時・完了したかどうか
+#     <pid>.jsonl    要約が済んだ記事（item）と、取得が終わった取得源（done）、要約のトークン数（usage）、
+#                    要約の予算（summary_budget_oriike）で後から要約する候補（deferred）を1行ずつ追記する
+# 取得源を別プロセスで実行するため、ジャーナルはプロセスごとのファイルに分けて書き、読むときにまとめる。
+#
+# ジャーナルが有効な間は、取得関数が existing_data.append(news_item) した時点で記事を既存データに保存する
+# （utilities_oriike.load_existing_data の戻り値が record_item を呼ぶ）。再開時は保存済みの記事が
+# 重複チェックで飛ばされるので、同じ記事を取得・要約し直すことはない。
+import os
+import json
+import glob
+import datetime
+import threading
+import contextvars
+from contextlib import contextmanager
+
+RUNS_DIR = "./data/runs"
+RUN_DIR_ENV = "ORIIKE_RUN_DIR"  # 子プロセスにジャーナルの場所を伝える環境変数
+
+_current_source = contextvars.ContextVar("current_source", default=None)
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def _read_meta(run_dir):
+    with open(os.path.join(run_dir, "run.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_meta(run_dir, meta):
+    path = os.path.join(run_dir, "run.json")
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_file, path)
+
+
+class RunJournal:
+    """1回の実行のジャーナルです。"""
+
+    def __init__(self, run_dir):
+        self.run_dir = run_dir
+        self._lock = threading.Lock()
+
+    @property
+    def meta(self):
+        return _read_meta(self.run_dir)
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        path = os.path.join(self.run_dir, f"{os.getpid()}.jsonl")
+        with self._lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_item(self, item, source=None):
+        """要約が済んだ記事を記録します。"""
+        self._append({"type": "item", "source": source or _current_source.get(), "item": item})
+
+    def record_usage(self, source, raw_tokens, input_tokens, output_tokens):
+        """要約1件のトークン数（本文を取り出す前・要約に送った入力・出力）を記録します。"""
+        self._append({"type": "usage", "source": source, "raw": raw_tokens,
+                      "input": input_tokens, "output": output_tokens})
+
+    def record_deferred(self, target, item, content, raw_tokens):
+        """後から要約する候補（要約の予算で選ぶ記事）を記録します。"""
+        self._append({"type": "deferred", "source": _current_source.get(), "target": target,
+                      "item": item, "content": content, "raw": raw_tokens})
+
+    def mark_done(self, source, count):
+        """取得源の取得が最後まで終わったことを記録します。"""
+        self._append({"type": "done", "source": source, "count": count})
+
+    def records(self):
+        """全プロセスの記録を返します。書き込み途中で中断された行は読み飛ばします。"""
+        for path in sorted(glob.glob(os.path.join(self.run_dir, "*.jsonl"))):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    def done_sources(self):
+        """取得が終わった取得源の名前の集合を返します。"""
+        return {record["source"] for record in self.records() if record.get("type") == "done"}
+
+    def items(self):
+        """記録済みの記事を返します。"""
+        return [record["item"] for record in self.records() if record.get("type") == "item"]
+
+    def deferred(self):
+        """まだ要約していない候補を返します（同じ記事は最初に記録したものだけ）。
+
+        本文が更新された記事は、本文の指紋（content_hash）が違えば前の要約と別の候補として扱います。
+        """
+        def key_of(item):
+            return item.get("title"), item.get("link"), item.get("content_hash")
+        records = list(self.records())
+        summarized = {key_of(record["item"]) for record in records
+                      if record.get("type") == "item" and record["item"].get("summary")}
+        jobs = {}
+        for record in records:
+            if record.get("type") != "deferred":
+                continue
+            key = key_of(record["item"])
+            if key not in summarized:
+                jobs.setdefault(key, record)
+        return list(jobs.values())
+
+    def usage(self):
+        """取得源ごとの要約の件数とトークン数の合計を {取得源: {"calls", "raw", "input", "output"}} で返します。"""
+        totals = {}
+        for record in self.records():
+            if record.get("type") != "usage":
+                continue
+            total = totals.setdefault(record["source"], {"calls": 0, "raw": 0, "input": 0, "output": 0})
+            total["calls"] += 1
+            for key in ("raw", "input", "output"):
+                total[key] += record[key]
+        return totals
+
+    def complete(self):
+        """実行が最後まで終わったことを記録します。"""
+        meta = self.meta
+        meta["completed"] = True
+        meta["completed_at"] = datetime.datetime.now().isoformat(timespec='seconds')
+        _write_meta(self.run_dir, meta)
+        end_run()
+
+
+def _activate(run_dir):
+    global _journal
+    with _journal_lock:
+        _journal = RunJournal(run_dir)
+        os.environ[RUN_DIR_ENV] = run_dir
+        return _journal
+
+
+def start_run(execution_timestamp, runs_dir=RUNS_DIR):
+    """新しい実行のジャーナルを作って有効にします。"""
+    run_id = execution_timestamp.replace(" ", "_").replace(";", "-").replace(":", "-")
+    run_dir = os.path.join(runs_dir, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+    _write_meta(run_dir, {
+        "run_id": run_id,
+        "execution_timestamp": execution_timestamp,
+        "started_at": datetime.datetime.now().isoformat(timespec='seconds'),
+        "completed": False,
+    })
+    return _activate(run_dir)
+
+
+def resume_run(runs_dir=RUNS_DIR):
+    """最後に始めた実行が完了していなければ、そのジャーナルを有効にして返します。なければ None を返します。"""
+    runs = []
+    for path in glob.glob(os.path.join(runs_dir, "*", "run.json")):
+        try:
+            meta = _read_meta(os.path.dirname(path))
+        except (OSError, json.JSONDecodeError):
+            continue
+        runs.append((meta.get("started_at", ""), os.path.dirname(path), meta))
+    if not runs:
+        return None
+    _, run_dir, meta = max(runs)
+    if meta.get("completed"):
+        return None
+    return _activate(run_dir)
+
+
+def end_run():
+    """ジャーナルを無効にします。"""
+    global _journal
+    with _journal_lock:
+        _journal = None
+        os.environ.pop(RUN_DIR_ENV, None)
+
+
+def current_journal():
+    """有効なジャーナルを返します。子プロセスでは環境変数から開きます。無効なら None を返します。"""
+    global _journal
+    with _journal_lock:
+        if _journal is None and os.environ.get(RUN_DIR_ENV):
+            _journal = RunJournal(os.environ[RUN_DIR_ENV])
+        return _journal
+
+
+@contextmanager
+def source_context(name):
+    """この中で記録された記事を取得源 name のものとして記録します。"""
+    token = _current_source.set(name)
+    try:
+        yield
+    finally:
+        _current_source.reset(token)
+
+
+def record_usage(raw_tokens, input_tokens, output_tokens):
+    """ジャーナルが有効なら、今の取得源の要約1件のトークン数を記録します。"""
+    journal = current_journal()
+    if journal is not None:
+        journal.record_usage(_current_source.get(), raw_tokens, input_tokens, output_tokens)
+
+
+def record_item(item):
+    """ジャーナルが有効なら記事を記録して True を、無効なら False を返します。"""
+    journal = current_journal()
+    if journal is None:
+        return False
+    journal.record_item(item)
+    return True
@@ -0,0 +1,164 @@
+# 収集した記事（タイトル・要約・本文）の全文検索です。
+# 記事データベース（article_store_oriike）に SQLite FTS5 の trigram 索引を持たせ、記事を保存するたびに索引にも加える。
+# アーカイブに移した記事も索引には残すため、過去の記事もまとめて検索できる。
+#
+#     python search_oriike.py 線状降水帯 --org 国土交通省 --since 2024-01-01 --until 2024-12-31
+#
+#     from search_oriike import search
+#     for hit in search("線状降水帯", organization="国土交通省", since="2024-01-01"):
+#         print(hit['pubDate'], hit['title'], hit['link'])
+#
+# trigram は3文字以上の語を索引で探す。2文字以下の語（「地震」など）は索引を使わずに探す。
+# trigram が使えない古い SQLite では通常のテーブルに保存し、すべての語を索引を使わずに探す。
+import re
+import html
+import sqlite3
+import argparse
+import threading
+from collections import OrderedDict
+
+MAX_BODY_LENGTH = 20000     # 索引に入れる本文の最大文字数
+MAX_PENDING_BODIES = 256    # 保存待ちの本文を覚えておく最大件数
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5(
+    title, summary, body,
+    source UNINDEXED, organization UNINDEXED, link UNINDEXED, norm_date UNINDEXED,
+    tokenize = 'trigram'
+)
+"""
+
+# trigram が使えない場合の代わりのテーブル
+_PLAIN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_fts (
+    rowid INTEGER PRIMARY KEY,
+    title TEXT, summary TEXT, body TEXT,
+    source TEXT, organization TEXT, link TEXT, norm_date TEXT
+)
+"""
+
+_bodies = OrderedDict()
+_bodies_lock = threading.Lock()
+
+
+def _plain_text(text):
+    text = re.sub(r'(?is)<(script|style)\b.*?</\1>', '', text or "")
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', text))
+    return re.sub(r'\s+', ' ', text).strip()[:MAX_BODY_LENGTH]
+
+
+def remember_body(title, text):
+    """記事の本文を、記事が保存されて索引に加わるまで覚えておきます（summarize_text などから呼ばれます）。"""
+    if not title or not text:
+        return
+    with _bodies_lock:
+        _bodies[title] = text
+        _bodies.move_to_end(title)
+        while len(_bodies) > MAX_PENDING_BODIES:
+            _bodies.popitem(last=False)
+
+
+def take_body(title):
+    """remember_body で覚えた本文をテキストにして返し、忘れます。なければ空文字を返します。"""
+    with _bodies_lock:
+        text = _bodies.pop(title, None)
+    return _plain_text(text) if text else ""
+
+
+def create_index(conn):
+    """索引のテーブルを作ります。新しく作った場合は保存済みの記事（タイトル・要約）を索引に加えます。"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'article_fts'").fetchone() is not None
+    if exists:
+        return
+    try:
+        conn.execute(_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        print("⚠️ SQLite の FTS5 trigram が使えないため、全文検索は索引を使わずに行います。")
+        conn.execute(_PLAIN_SCHEMA)
+    conn.execute(
+        "INSERT INTO article_fts (rowid, title, summary, body, source, organization, link, norm_date)"
+        " SELECT id, title, summary, '', source, organization, link, norm_date FROM articles")
+
+
+def index_article(conn, rowid, source, item, norm_date):
+    """記事を索引に加えます（同じ rowid があれば置き換えます）。本文は remember_body で覚えたものを使います。"""
+    body = take_body(item.get('title'))
+    if not body:
+        row = conn.execute("SELECT body FROM article_fts WHERE rowid = ?", (rowid,)).fetchone()
+        body = row[0] if row else ""
+    conn.execute("DELETE FROM article_fts WHERE rowid = ?", (rowid,))
+    conn.execute(
+        "INSERT INTO article_fts (rowid, title, summary, body, source, organization, link, norm_date)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (rowid, item.get('title') or "", item.get('summary') or "", body,
+         source, item.get('organization'), item.get('link'), norm_date))
+
+
+def _is_fts(conn):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'article_fts'").fetchone()
+    return row is not None and "fts5" in row[0].lower()
+
+
+def search(query, organization=None, since=None, until=None, limit=20):
+    """タイトル・要約・本文に query の語をすべて含む記事を、新しい順に返します。
+
+    organization は組織名の一部、since / until は YYYY-MM-DD の日付（両端を含む）で絞り込みます。
+    結果は title, organization, link, pubDate（YYYY-MM-DD）, summary, snippet を持つ辞書のリストです。
+    """
+    from article_store_oriike import get_store
+    conn = get_store().connection()
+    terms = [term.replace('"', '') for term in query.split() if term.strip('"')]
+    if not terms:
+        return []
+
+    where, params = [], []
+    fts = _is_fts(conn)
+    match_terms = [term for term in terms if fts and len(term) >= 3]
+    if match_terms:
+        where.append("article_fts MATCH ?")
+        params.append(" AND ".join(f'"{term}"' for term in match_terms))
+    for term in terms:
+        if term not in match_terms:
+            where.append("(instr(title, ?) OR instr(summary, ?) OR instr(body, ?))")
+            params.extend([term] * 3)
+    if organization:
+        where.append("instr(organization, ?)")
+        params.append(organization)
+    if since:
+        where.append("norm_date >= ?")
+        params.append(since)
+    if until:
+        where.append("norm_date <= ?")
+        params.append(until)
+
+    snippet = "snippet(article_fts, -1, '【', '】', '…', 16)" if match_terms else "substr(summary, 1, 80)"
+    rows = conn.execute(
+        f"SELECT title, organization, link, norm_date, summary, {snippet} FROM article_fts"
+        f" WHERE {' AND '.join(where)} ORDER BY norm_date DESC, rowid DESC LIMIT ?",
+        (*params, limit)).fetchall()
+    return [{'title': row[0], 'organization': row[1], 'link': row[2], 'pubDate': row[3],
+             'summary': row[4], 'snippet': row[5]} for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="収集した記事を全文検索します。")
+    parser.add_argument("query", nargs="+", help="検索語（複数指定するとすべてを含む記事）")
+    parser.add_argument("--org", help="組織名（一部でもよい）")
+    parser.add_argument("--since", help="この日付以降（YYYY-MM-DD）")
+    parser.add_argument("--until", help="この日付以前（YYYY-MM-DD）")
+    parser.add_argument("--limit", type=int, default=20, help="表示する件数")
+    args = parser.parse_args()
+
+    hits = search(" ".join(args.query), args.org, args.since, args.until, args.limit)
+    if not hits:
+        print("該当する記事はありません。")
+    for hit in hits:
+        print(f"{hit['pubDate'] or '----------'}  {hit['organization']}  {hit['title']}")
+        print(f"    {hit['link']}")
+        if hit['snippet']:
+            print(f"    {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# 既存の記事のキー（タイトル・リンク）を64ビットのハッシュで並べたファイルです。
+# 複数の収集プロセスが同じファイルを読み取り専用でメモリマップして共有するため、履歴が増えても
+# プロセスごとのメモリはほとんど増えない。追記はファイルロックを取ってから行う。
+#
+# ファイルの形式（./data/seen_keys.bin、バイト順はマシンのもの）:
+#     先頭16バイト  識別子 b"ORSEEN01" と、並べ替え済みのキーの件数（uint64）
+#     続けて        並べ替え済みのキー（uint64 の配列、二分探索する）
+#     末尾          後から追記したキー（並べ替えていない。MAX_TAIL 件を超えたら並べ替え済みの部分に統合する）
+#
+# Windows では他のプロセスがマップしている間はファイルを置き換えられないため、統合できなかった分は
+# 次にプロセスが既存キーのファイルを開く前（まだどのプロセスもマップしていないとき）に統合する。
+#
+# キーは記事データベース（article_store_oriike）に保存した記事だけを表す。ファイルにあれば保存済み、
+# なければ未保存の可能性があるのでデータベースで確かめる（書き込みの途中で中断しても誤って飛ばさない）。
+#
+#     python seen_keys_oriike.py rebuild   # 記事データベースから作り直す
+import os
+import sys
+import mmap
+import struct
+import bisect
+import hashlib
+import threading
+from contextlib import contextmanager
+
+SEEN_KEYS_FILE = "./data/seen_keys.bin"
+MAX_TAIL = 4096         # 追記部分がこの件数を超えたら並べ替え済みの部分に統合する
+
+_MAGIC = b"ORSEEN01"
+_HEADER = struct.Struct("=8sQ")
+_KEY = struct.Struct("=Q")
+
+
+def seen_key(source, kind, value):
+    """取得源 source の記事のキー（kind は "title" か "link"）を64ビットの整数にします。"""
+    data = "\0".join((source, kind, value or "")).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+@contextmanager
+def _file_lock(path):
+    """プロセス間で排他するためのロック（Windows は msvcrt、それ以外は fcntl）を取ります。"""
+    with open(path + ".lock", 'a+b') as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue    # LK_LOCK は約10秒で諦めるため、取れるまで繰り返す
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _write_file(path, keys):
+    keys = sorted(set(keys))
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, len(keys)))
+        f.write(struct.pack(f"={len(keys)}Q", *keys))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+class SeenKeys:
+    """メモリマップした既存キーのファイルです。"""
+
+    def __init__(self, path=SEEN_KEYS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+        self._stat = None
+        self._sorted = None
+        self._sorted_count = None
+        self._tail = set()
+        self._tail_end = 0      # 追記部分を読み込んだ位置（バイト）
+
+    def _close(self):
+        if self._sorted is not None:
+            self._sorted.release()
+            self._sorted = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _refresh(self):
+        """ファイルが置き換えられたり追記されたりしていれば、マップし直します。
+
+        追記されただけなら、追記部分のうち新しく増えた分だけを読み込みます。
+        """
+        stat = os.stat(self.path)
+        if self._stat is not None and (stat.st_ino, stat.st_size, stat.st_mtime_ns) == self._stat:
+            return
+        appended = self._stat is not None and stat.st_ino == self._stat[0] and stat.st_size >= self._stat[1]
+        self._close()
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        magic, sorted_count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"既存キーのファイルの形式が違います: {self.path}")
+        end = _HEADER.size + sorted_count * _KEY.size
+        self._sorted = memoryview(self._map)[_HEADER.size:end].cast('Q')
+        if not appended or sorted_count != self._sorted_count:
+            self._tail = set()
+            self._tail_end = end
+        tail_count = (size - self._tail_end) // _KEY.size
+        self._tail.update(struct.unpack_from(f"={tail_count}Q", self._map, self._tail_end))
+        self._tail_end += tail_count * _KEY.size
+        self._sorted_count = sorted_count
+        self._stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def __contains__(self, key):
+        with self._lock:
+            self._refresh()
+            if key in self._tail:
+                return True
+            index = bisect.bisect_left(self._sorted, key)
+            return index < len(self._sorted) and self._sorted[index] == key
+
+    def contains(self, source, kind, value):
+        return seen_key(source, kind, value) in self
+
+    def add(self, keys):
+        """キーを追記します。追記部分が大きくなったら並べ替え済みの部分に統合します。"""
+        keys = list(keys)
+        if not keys:
+            return
+        with _file_lock(self.path):
+            with open(self.path, 'ab') as f:
+                f.write(struct.pack(f"={len(keys)}Q", *keys))
+                f.flush()
+                os.fsync(f.fileno())
+            tail_count = _tail_count(self.path)
+        if tail_count > MAX_TAIL:
+            self.merge()
+
+    def merge(self):
+        """追記部分を並べ替え済みの部分に統合します。統合できれば True を返します。"""
+        self.close()    # 自分のマップは外しておく（Windows ではマップ中のファイルを置き換えられない）
+        return merge_file(self.path)
+
+    def close(self):
+        with self._lock:
+            self._close()
+            self._stat = None
+
+
+def _tail_count(path):
+    """追記部分の件数を返します（ファイルの先頭と大きさだけを見ます）。"""
+    with open(path, 'rb') as f:
+        _, sorted_count = _HEADER.unpack(f.read(_HEADER.size))
+    return (os.path.getsize(path) - _HEADER.size) // _KEY.size - sorted_count
+
+
+def merge_file(path=SEEN_KEYS_FILE):
+    """既存キーのファイルの追記部分を並べ替え済みの部分に統合します。統合できれば True を返します。"""
+    with _file_lock(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        count = (len(data) - _HEADER.size) // _KEY.size
+        keys = struct.unpack_from(f"={count}Q", data, _HEADER.size)
+        try:
+            _write_file(path, keys)
+        except PermissionError:
+            # Windows では他のプロセスがマップしている間は置き換えられないため、次にファイルを開く前に統合する
+            os.remove(f"{path}.{os.getpid()}.tmp")
+            return False
+    return True
+
+
+def build_keys(conn):
+    """記事データベース（保存中の記事とアーカイブに移した記事のキー）から既存キーを集めます。"""
+    for table in ("articles", "archived_keys"):
+        for source, hashed_title, canonical_link in conn.execute(
+                f"SELECT source, title_hash, canonical_link FROM {table}"):
+            yield seen_key(source, "title", hashed_title)
+            if canonical_link:
+                yield seen_key(source, "link", canonical_link)
+
+
+def rebuild(conn, path=SEEN_KEYS_FILE):
+    """記事データベースから既存キーのファイルを作り直します。"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with _file_lock(path):
+        _write_file(path, build_keys(conn))
+
+
+_seen_keys = None
+_seen_keys_lock = threading.Lock()
+
+
+def get_seen_keys(conn):
+    """共有の SeenKeys を返します。ファイルがなければ記事データベースから作ります。"""
+    global _seen_keys
+    with _seen_keys_lock:
+        if _seen_keys is None:
+            if not os.path.exists(SEEN_KEYS_FILE):
+                rebuild(conn)
+            elif _tail_count(SEEN_KEYS_FILE) > MAX_TAIL:
+                # 前の実行で統合できなかった追記部分を、マップする前に統合する
+                merge_file(SEEN_KEYS_FILE)
+            _seen_keys = SeenKeys()
+        return _seen_keys
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "rebuild":
+        from article_store_oriike import get_store
+        rebuild(get_store().connection())
+        print(f"作り直しました: {SEEN_KEYS_FILE}")
+    else:
+        print("使い方: python seen_keys_oriike.py rebuild")
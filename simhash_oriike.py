@@ -0,0 +1,210 @@
+# 続報のように「前の記事とほとんど同じ」記事を見つけるための SimHash による近似重複検出です。
+# 国土交通省の災害情報は更新のたびに「（第11報　2024年9月26日 08時00分現在）」のような新しい記事になるため、
+# 要約（LLMの呼び出し）の前に、過去の記事とほぼ同じものを見分けて飛ばせるようにする。
+#
+#     index = get_index()
+#     match = index.find(text, source="mlit_disaster")   # 近い記事があれば (タイトル, リンク, 距離)
+#     index.add(text, source="mlit_disaster", title=title, link=link)
+#
+# 記事ごとに64ビットのハッシュを ./data/simhash.sqlite3 に保存し、16ビットずつ4つの帯に分けて索引を付ける。
+# ハミング距離が MAX_DISTANCE（3）以下の記事は、いずれかの帯が必ず一致するため、帯の一致で候補を絞ってから距離を計算する。
+#
+# 取得源の索引が空のときは、記事データベース（article_store_oriike）に保存済みの記事から作る。
+# 本文は全文検索の索引（search_oriike）に残っているものを使い、なければ要約で代える。
+#
+#     python simhash_oriike.py rebuild                 # すべての取得源の索引を作り直す
+#     python simhash_oriike.py rebuild mlit_disaster   # 指定した取得源の索引だけ作り直す
+import os
+import re
+import sys
+import sqlite3
+import hashlib
+import datetime
+import threading
+import unicodedata
+from collections import Counter
+from bs4 import BeautifulSoup
+
+DB_FILE = "./data/simhash.sqlite3"
+SHINGLE_SIZE = 3        # 文字単位のシングル（n-gram）の長さ
+MAX_DISTANCE = 3        # この距離（異なるビット数）以下なら近似重複とみなす
+BANDS = 4               # 索引の帯の数（MAX_DISTANCE + 1 以上にする）
+BAND_BITS = 64 // BANDS
+MAX_TEXT_LENGTH = 20000 # 長い本文は先頭のこの文字数だけで計算する
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS simhashes (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT,
+    link TEXT,
+    hash INTEGER NOT NULL,
+    band0 INTEGER NOT NULL,
+    band1 INTEGER NOT NULL,
+    band2 INTEGER NOT NULL,
+    band3 INTEGER NOT NULL,
+    added_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_simhashes_band0 ON simhashes (source, band0);
+CREATE INDEX IF NOT EXISTS idx_simhashes_band1 ON simhashes (source, band1);
+CREATE INDEX IF NOT EXISTS idx_simhashes_band2 ON simhashes (source, band2);
+CREATE INDEX IF NOT EXISTS idx_simhashes_band3 ON simhashes (source, band3);
+"""
+
+# 続報ごとに変わる部分（報の番号、日時、数値）は比較の前に取り除く
+_SERIAL_PATTERNS = [
+    re.compile(r'[（(]第\d+報[^）)]*[）)]'),
+    re.compile(r'\d{4}年\d{1,2}月\d{1,2}日'),
+    re.compile(r'\d{1,2}時\d{1,2}分(現在)?'),
+]
+
+
+def normalize_text(text):
+    """比較用にテキストを正規化します（HTMLタグ・続報の番号・日時の除去、数字の統一、空白の除去）。"""
+    if not text:
+        return ""
+    if "<" in text and ">" in text:
+        text = BeautifulSoup(text, 'html.parser').get_text(" ")
+    text = unicodedata.normalize('NFKC', text)
+    for pattern in _SERIAL_PATTERNS:
+        text = pattern.sub("", text)
+    text = re.sub(r'\d+', '0', text)
+    return re.sub(r'\s+', '', text)
+
+
+def simhash(text):
+    """テキストの64ビットの SimHash を返します。"""
+    text = normalize_text(text)[:MAX_TEXT_LENGTH]
+    if len(text) < SHINGLE_SIZE:
+        text = text.ljust(SHINGLE_SIZE)
+    counts = Counter(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+    weights = [0] * 64
+    for shingle, count in counts.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+def _bands(value):
+    mask = (1 << BAND_BITS) - 1
+    return [value >> (BAND_BITS * i) & mask for i in range(BANDS)]
+
+
+def _to_signed(value):
+    # SQLite の INTEGER は符号付き64ビットのため、上位ビットが立っている値は負の数として保存する
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class NearDuplicateIndex:
+    """過去の記事の SimHash を保存し、近い記事を探す索引です。接続はスレッドごとに作ります。"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self._local = threading.local()
+        self._seeded = set()
+        self._seed_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def find(self, text, source, exclude_link=None):
+        """source の過去の記事のうち text に最も近いものを (タイトル, リンク, 距離) で返します。
+
+        距離が MAX_DISTANCE を超える記事しかなければ None を返します。
+        exclude_link と同じリンクの記事（同じ記事の再取得）は対象にしません。
+        """
+        value = simhash(text)
+        bands = _bands(value)
+        where = " OR ".join(f"band{i} = ?" for i in range(BANDS))
+        rows = self.connection().execute(
+            f"SELECT title, link, hash FROM simhashes WHERE source = ? AND ({where})", (source, *bands))
+        best = None
+        for title, link, stored in rows:
+            if exclude_link and link == exclude_link:
+                continue
+            distance = hamming_distance(value, stored & ((1 << 64) - 1))
+            if distance <= MAX_DISTANCE and (best is None or distance < best[2]):
+                best = (title, link, distance)
+        return best
+
+    def add(self, text, source, title=None, link=None):
+        """記事の SimHash を保存します。"""
+        value = simhash(text)
+        with self.connection() as conn:
+            conn.execute(
+                "INSERT INTO simhashes (source, title, link, hash, band0, band1, band2, band3, added_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, title, link, _to_signed(value), *_bands(value),
+                 datetime.datetime.now().isoformat(timespec='seconds')))
+
+    def seed(self, source):
+        """source の索引が空なら、記事データベースに保存済みの記事から作ります。"""
+        with self._seed_lock:
+            if source in self._seeded:
+                return
+            self._seeded.add(source)
+            exists = self.connection().execute(
+                "SELECT 1 FROM simhashes WHERE source = ? LIMIT 1", (source,)).fetchone()
+            if exists is None:
+                count = self.rebuild(source)
+                if count:
+                    print(f"近似重複の索引を保存済みの記事 {count} 件から作りました: {source}")
+
+    def rebuild(self, source):
+        """source の索引を、記事データベースに保存済みの記事から作り直します。加えた件数を返します。"""
+        from article_store_oriike import get_store
+        rows = get_store().connection().execute(
+            "SELECT title, link, summary, body FROM article_fts WHERE source = ? ORDER BY rowid",
+            (source,)).fetchall()
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        values = []
+        for title, link, summary, body in rows:
+            # 新しい記事と同じく「タイトル＋本文」で計算する（本文が残っていない記事は要約で代える）
+            value = simhash((title or "") + "\n" + (body or summary or ""))
+            values.append((source, title, link, _to_signed(value), *_bands(value), now))
+        with self.connection() as conn:
+            conn.execute("DELETE FROM simhashes WHERE source = ?", (source,))
+            conn.executemany(
+                "INSERT INTO simhashes (source, title, link, hash, band0, band1, band2, band3, added_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+        return len(values)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """共有の NearDuplicateIndex を返します。"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = NearDuplicateIndex()
+        return _index
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "rebuild":
+        index = get_index()
+        if len(sys.argv) > 2:
+            sources = sys.argv[2:]
+        else:
+            sources = [row[0] for row in index.connection().execute("SELECT DISTINCT source FROM simhashes")]
+        for name in sources:
+            print(f"作り直しました: {name}（{index.rebuild(name)} 件）")
+    else:
+        print("使い方: python simhash_oriike.py rebuild [取得源 ...]")
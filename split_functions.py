@@ -1,5 +1,6 @@
 import ast
 import os
+import re
 from textwrap import dedent
 
 # ===== 設定 =====
@@ -13,13 +14,16 @@ common_header = '''\
 import sys
 sys.path.append('C:/Users/giroj/packages')
 import requests
-from utilities_oriike import client,summarize_text,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
+from http_oriike import http_get
+from dedup_oriike import DedupIndex
+from utilities_oriike import client,summarize_later,load_existing_data,save_json,is_pdf_link,extract_text_from_pdf
 from bs4 import BeautifulSoup
 import re
 import feedparser
 import datetime
 import os
 from urllib.parse import urljoin
+from driver_pool_oriike import borrow_driver
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options
@@ -34,6 +38,29 @@ options.add_argument("--start-maximized")
 options.use_chromium = True
 '''
 
+# ===== 本文の書き換え =====
+# 要約は要約サービスに任せ（summarize_later）、既存データとの重複チェックは DedupIndex で行う
+_TITLE_SCANS = [
+    re.compile(r"any\(([\w.]+) == item\['title'\] for item in existing_data\)"),
+    re.compile(r"any\(item\['title'\] == ([\w.]+) for item in existing_data\)"),
+    re.compile(r"any\(([\w.]+) == item\.get\('title'\) for item in existing_data\)"),
+]
+
+def rewrite_body(func_lines):
+    """取得関数の本文を、summarize_later と DedupIndex を使う形に書き換えます。"""
+    rewritten = []
+    for line in func_lines:
+        indent = line[:len(line) - len(line.lstrip())]
+        line = line.replace("summarize_text(", "summarize_later(")
+        for pattern in _TITLE_SCANS:
+            line = pattern.sub(r"\1 in seen", line)
+        rewritten.append(line)
+        if line.strip().startswith("existing_data = load_existing_data("):
+            rewritten.append(indent + "seen = DedupIndex(existing_data)")
+        elif line.strip() == "existing_data.append(news_item)":
+            rewritten.append(indent + "seen.add(news_item)")
+    return rewritten
+
 # ===== 元コード読み込み =====
 with open(input_file_path, 'r', encoding='utf-8') as f:
     source_code = f.read()
@@ -60,7 +87,7 @@ for node in tree.body:
             func_lines[0] = def_line
 
         # 組み立てて保存
-        func_body = "\n".join(func_lines)
+        func_body = "\n".join(rewrite_body(func_lines))
         func_body = dedent(func_body)
         final_code = f"{common_header}\n\n{func_body}"
 
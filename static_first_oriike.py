@@ -0,0 +1,104 @@
+# まず通常のHTTP GETでページを取得し、期待する要素がない場合だけブラウザで描画するための取得層です。
+# どちらで取得できたかは取得源・URLパターンごとに記録し、次回以降は確認を省いて最初から適切な方法で取得する。
+import os
+import re
+import json
+import datetime
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from http_oriike import http_get
+from bs4 import BeautifulSoup
+from tab_renderer_oriike import get_renderer
+
+FETCH_MODE_FILE = "./data/fetch_mode.json"
+REQUEST_TIMEOUT = 15    # 通常のHTTP GETのタイムアウト（秒）
+MIN_TEXT_LENGTH = 200   # セレクタを指定しない場合、本文がこの文字数以上あれば取得できたとみなす
+REPROBE_DAYS = 30       # ブラウザが必要と記録してから、この日数が経てば再びHTTP GETを試す
+
+_modes_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=8)
+
+
+def url_pattern(url):
+    """URLをパターン化します（ホスト＋パス。数字の並びは # にまとめる）。記事ページを1つのパターンで扱うためです。"""
+    parsed = urlparse(url)
+    return parsed.netloc + re.sub(r'\d+', '#', parsed.path)
+
+
+def _load_modes():
+    if os.path.exists(FETCH_MODE_FILE):
+        with open(FETCH_MODE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def _remember(key, mode):
+    with _modes_lock:
+        modes = _load_modes()  # 他のプロセスの記録を消さないよう読み直してから書く
+        if modes.get(key, {}).get('mode') == mode == 'static':
+            return
+        modes[key] = {'mode': mode, 'checked': datetime.date.today().isoformat()}
+        os.makedirs(os.path.dirname(FETCH_MODE_FILE), exist_ok=True)
+        tmp_file = f"{FETCH_MODE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(modes, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_file, FETCH_MODE_FILE)
+
+
+def _looks_complete(html, selector):
+    soup = BeautifulSoup(html, 'html.parser')
+    if selector:
+        # 枠だけがあって中身をスクリプトで入れるページもあるため、要素に文字があることも確かめる
+        element = soup.select_one(selector)
+        return element is not None and bool(element.get_text(strip=True))
+    return len(soup.get_text(strip=True)) >= MIN_TEXT_LENGTH
+
+
+def _static_get(url, encoding):
+    response = http_get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    if encoding:
+        response.encoding = encoding
+    elif response.encoding == 'ISO-8859-1':
+        # Content-Typeに文字コードがない場合は本文から推定する
+        response.encoding = response.apparent_encoding
+    return response.text
+
+
+def _needs_browser(record):
+    if not record or record.get('mode') != 'browser':
+        return False
+    checked = datetime.date.fromisoformat(record['checked'])
+    return (datetime.date.today() - checked).days < REPROBE_DAYS
+
+
+def fetch_html(source, url, selector, executable_path, encoding=None):
+    """ページのHTMLを返します。
+
+    source は取得源の名前、selector はページに必ずあるはずの要素（ニュース一覧など）のCSSセレクタです。
+    HTTP GETの結果に selector がなければブラウザで描画し直します（selector が None なら本文の長さで判定します）。
+    ブラウザが必要と記録するのは、HTTP GETの結果に内容がなかった場合だけです（通信の失敗は一時的なことがあるため記録しません）。
+    """
+    key = f"{source} {url_pattern(url)}"
+    record = _load_modes().get(key)
+
+    if not _needs_browser(record):
+        try:
+            html = _static_get(url, encoding)
+        except Exception as e:
+            print(f"{source}: HTTP GETに失敗したため、ブラウザで取得します - {url}, {e}")
+        else:
+            if _looks_complete(html, selector):
+                _remember(key, 'static')
+                return html
+            print(f"{source}: HTTP GETでは内容を取得できなかったため、ブラウザで取得します - {url}")
+            # HTTP GETで内容を取得できなかったことを記録し、次回からはブラウザで直接取得する
+            _remember(key, 'browser')
+
+    return get_renderer(executable_path).render(url, ready=selector)
+
+
+def submit_html(source, url, selector, executable_path, encoding=None):
+    """fetch_html をバックグラウンドで実行し、Futureを返します。"""
+    return _executor.submit(fetch_html, source, url, selector, executable_path, encoding)
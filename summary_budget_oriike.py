@@ -0,0 +1,228 @@
+# 実行全体の要約の予算です（取得源ごとの max_count の代わりに、どの記事を要約するかを全体から選ぶ）。
+#
+# collect_edge.py は enable_budget() してから取得源を実行する。予算が有効な間、summarize_later（utilities_oriike）は
+# API を呼び出さずに PendingSummary（空文字として扱われる要約）を返し、記事を既存データに append した時点で
+# 要約の候補として実行ジャーナル（run_journal_oriike）に記録する（別プロセスの取得源の分も集まる）。
+# すべての取得源が終わったら run_budget() が候補を順位付けし、時間・トークン数・費用の予算に収まる分を要約する。
+# 要約が済んだものから既存データ・ジャーナル・ニュースのリストに書き込むため、途中で打ち切っても済んだ分は残る。
+#
+# 順位は 取得源の優先度 × (1 + キーワードの点数) × 新しさ（HALF_LIFE_DAYS 日で半分になる）で決める。
+# 予算は環境変数 ORIIKE_BUDGET_SECONDS / ORIIKE_BUDGET_TOKENS / ORIIKE_BUDGET_COST（米ドル）で変えられる。
+import os
+import math
+import time
+import datetime
+from concurrent.futures import Future, wait
+from run_journal_oriike import current_journal, record_item, source_context
+from summary_service_oriike import estimate_tokens, REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE
+from chunk_planner_oriike import SINGLE_CALL_TOKENS, CHUNK_TOKENS, MAX_INPUT_TOKENS
+
+BUDGET_ENV = "ORIIKE_SUMMARY_BUDGET"    # 子プロセスに予算が有効なことを伝える環境変数
+MAX_SECONDS = float(os.getenv("ORIIKE_BUDGET_SECONDS", "900"))      # 要約にかけてよい時間（秒）
+MAX_TOKENS = int(os.getenv("ORIIKE_BUDGET_TOKENS", "500000"))      # 要約に使ってよいトークン数（入力と出力の合計）
+MAX_COST = float(os.getenv("ORIIKE_BUDGET_COST", "3.0"))           # 要約に使ってよい費用（米ドル）
+INPUT_PRICE = 0.0025 / 1000     # 入力1トークンあたりの費用（米ドル、gpt-4o）
+OUTPUT_PRICE = 0.01 / 1000      # 出力1トークンあたりの費用（米ドル、gpt-4o）
+OUTPUT_TOKENS = 300             # 要約1回で見込む出力のトークン数
+HALF_LIFE_DAYS = 3              # 新しさの点数が半分になる日数
+
+# 取得源の優先度（組織名にこの文字列を含む取得源。含まなければ 1.0）
+SOURCE_PRIORITY = {
+    "金融庁": 3.0,
+    "厚生労働省_緊急情報": 3.0,
+    "損害保険契約者保護機構": 2.0,
+    "個人情報保護委員会": 2.0,
+    "国土交通省": 2.0,
+    "消費者庁": 2.0,
+    "気象庁": 1.5,
+    "消防庁": 1.5,
+    "警察庁": 1.5,
+    "地震本部": 1.5,
+}
+
+# キーワードと点数（タイトルに含まれれば2倍）
+KEYWORDS = {
+    "損害保険": 2.0,
+    "保険": 1.0,
+    "行政処分": 2.0,
+    "業務改善命令": 2.0,
+    "監督指針": 2.0,
+    "自動運転": 1.5,
+    "自動車": 1.0,
+    "災害": 1.0,
+    "地震": 1.0,
+    "大雨": 1.0,
+    "台風": 1.0,
+    "サイバー": 1.5,
+    "個人情報": 1.0,
+    "改正": 1.0,
+    "パブリックコメント": 1.0,
+}
+
+
+class PendingSummary(str):
+    """予算で後から要約する記事の要約です。それまでは空文字として扱われます。"""
+
+    def __new__(cls, content, raw_tokens):
+        summary = super().__new__(cls, "")
+        summary.content = content
+        summary.raw_tokens = raw_tokens
+        return summary
+
+    def __reduce__(self):
+        return (PendingSummary, (self.content, self.raw_tokens))
+
+
+def enable_budget():
+    """予算を有効にします（子プロセスにも引き継がれます）。"""
+    os.environ[BUDGET_ENV] = "1"
+
+
+def disable_budget():
+    os.environ.pop(BUDGET_ENV, None)
+
+
+def budget_enabled():
+    """予算が有効で、候補を記録する実行ジャーナルもあれば True を返します。"""
+    return os.environ.get(BUDGET_ENV) == "1" and current_journal() is not None
+
+
+def defer_summary(item, target):
+    """記事の要約が PendingSummary なら、要約の候補として実行ジャーナルに記録し、要約を空文字にします。
+
+    target は要約を後から書き込む既存データ（{"store": 取得源} または {"jsonl": パス}）です。
+    """
+    summary = item.get('summary')
+    if not isinstance(summary, PendingSummary):
+        return
+    item['summary'] = ""
+    current_journal().record_deferred(target, item, summary.content, summary.raw_tokens)
+
+
+def _priority(organization):
+    return max((weight for name, weight in SOURCE_PRIORITY.items() if name in (organization or "")),
+               default=1.0)
+
+
+def _keyword_score(title, content):
+    score = 0.0
+    for keyword, weight in KEYWORDS.items():
+        if keyword in (title or ""):
+            score += weight * 2
+        elif keyword in (content or ""):
+            score += weight
+    return score
+
+
+def _freshness(pub_date, today):
+    from article_store_oriike import normalize_date
+    norm_date = normalize_date(pub_date)
+    if not norm_date:
+        return 0.5     # 日付がわからない記事は HALF_LIFE_DAYS 日前と同じに扱う
+    try:
+        age = (today - datetime.date.fromisoformat(norm_date)).days
+    except ValueError:
+        return 0.5
+    return 0.5 ** (max(age, 0) / HALF_LIFE_DAYS)
+
+
+def score(job, today=None):
+    """候補の点数（大きいほど先に要約する）を返します。"""
+    item = job["item"]
+    today = today or datetime.date.today()
+    return (_priority(item.get('organization'))
+            * (1 + _keyword_score(item.get('title'), job["content"]))
+            * _freshness(item.get('pubDate'), today))
+
+
+def estimate_cost(job):
+    """候補を要約するのに見込む (呼び出し回数, トークン数, 費用) を返します（長い文書は部分に分けて要約する分も含めます）。"""
+    tokens = min(estimate_tokens(job["content"]), MAX_INPUT_TOKENS) + estimate_tokens(job["item"].get('title'))
+    if tokens <= SINGLE_CALL_TOKENS:
+        calls, input_tokens = 1, tokens
+    else:
+        parts = math.ceil(tokens / CHUNK_TOKENS)
+        calls, input_tokens = parts + 1, tokens + parts * OUTPUT_TOKENS
+    output_tokens = calls * OUTPUT_TOKENS
+    return calls, input_tokens + output_tokens, input_tokens * INPUT_PRICE + output_tokens * OUTPUT_PRICE
+
+
+def plan(jobs, max_seconds=MAX_SECONDS, max_tokens=MAX_TOKENS, max_cost=MAX_COST):
+    """点数の高い順に、予算に収まる候補を選んで返します。
+
+    時間は要約サービスのレート制限（1分あたりのトークン数・リクエスト数）から見積もります。
+    """
+    max_tokens = min(max_tokens, TOKENS_PER_MINUTE * max_seconds / 60)
+    max_calls = REQUESTS_PER_MINUTE * max_seconds / 60
+    selected, tokens, cost, calls = [], 0, 0.0, 0
+    today = datetime.date.today()
+    for job in sorted(jobs, key=lambda job: score(job, today), reverse=True):
+        job_calls, job_tokens, job_cost = estimate_cost(job)
+        if tokens + job_tokens > max_tokens or cost + job_cost > max_cost or calls + job_calls > max_calls:
+            continue    # 小さい候補なら収まるかもしれないので続ける
+        selected.append(job)
+        tokens += job_tokens
+        cost += job_cost
+        calls += job_calls
+    print(f"要約の予算: 候補 {len(jobs)}件のうち {len(selected)}件を要約します"
+          f"（見込み {tokens}トークン、約${cost:.2f}）")
+    return selected
+
+
+def _write_back(job, summary):
+    """要約を既存データに書き込み、実行ジャーナルにも記録します。"""
+    item = {**job["item"], 'summary': summary}
+    target = job["target"]
+    if "store" in target:
+        from article_store_oriike import get_store
+        get_store().update_item(target["store"], item)
+    else:
+        from jsonl_store_oriike import append_records
+        append_records(target["jsonl"], [item])
+    with source_context(job["source"]):
+        record_item(item)
+
+
+def run_budget(journal, news_list, summarize, max_seconds=MAX_SECONDS):
+    """ジャーナルに記録した要約の候補から予算に収まる分を要約し、news_list の記事にも要約を入れます。
+
+    summarize(title, content, raw_tokens) は要約が入る Future を返す関数です（utilities_oriike.summarize_now）。
+    要約は済んだものから書き込みます。max_seconds を過ぎたら、まだ済んでいない要約は待たずに打ち切ります。
+    """
+    started = time.monotonic()
+    selected = plan(journal.deferred(), max_seconds=max_seconds)
+    items = {(item.get('title'), item.get('link')): item for item in news_list}
+
+    def finished(future, job, written):
+        try:
+            if future.cancelled() or not future.result():
+                return
+            summary = future.result()
+            _write_back(job, summary)
+            item = items.get((job["item"].get('title'), job["item"].get('link')))
+            if item is not None:
+                item['summary'] = summary
+        except Exception as e:
+            print(f"⚠️ 要約の書き込みでエラー発生: {e}")
+        finally:
+            written.set_result(None)
+
+    # 書き込みが済むまでを待つため、要約ごとに書き込みの完了を表す Future を作る
+    futures = {}
+    for job in selected:
+        if time.monotonic() - started >= max_seconds:
+            break
+        with source_context(job["source"]):
+            future = summarize(job["item"].get('title'), job["content"], job["raw"])
+        written = Future()
+        futures[written] = future
+        future.add_done_callback(lambda future, job=job, written=written: finished(future, job, written))
+
+    remaining = max(0, max_seconds - (time.monotonic() - started))
+    _, pending = wait(futures, timeout=remaining)
+    skipped = len(selected) - len(futures) + len(pending)
+    for written in pending:
+        futures[written].cancel()
+    if skipped:
+        print(f"⏱️ 要約の予算の時間（{max_seconds:.0f}秒）を過ぎたため、{skipped}件の要約を打ち切りました。")
+    return news_list
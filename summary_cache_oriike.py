@@ -0,0 +1,184 @@
+# 要約のキャッシュです（SQLite、./data/summary_cache.sqlite3）。
+# 同じ本文の記事をもう一度取得した場合（タイトルの手直し、JSON ファイルの消失、他の取得源への転載、--resume など）に、
+# Azure OpenAI を呼び出さずに前回の要約を返す。
+#
+# キーは、正規化した本文・タイトル・プロンプトのテンプレート・モデル名をまとめたハッシュ。プロンプトやモデルを
+# 変えれば別のキーになるため、古い要約が使われることはない。最後に使った日時が古いものから順に、
+# 件数（MAX_ENTRIES）と大きさ（MAX_BYTES）の上限に収まるまで消す。
+#
+# ヒット・ミスの件数は実行ジャーナル（run_journal_oriike）の実行ごとに記録する（別プロセスの取得源の分も合わせる）。
+#
+#     python summary_cache_oriike.py report [実行ID]  # ヒット・ミスの件数（省略時は最後の実行）
+#     python summary_cache_oriike.py evict            # 上限を超えた分を消す
+import os
+import re
+import sys
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from run_journal_oriike import current_journal
+
+CACHE_FILE = "./data/summary_cache.sqlite3"
+MAX_ENTRIES = 100000            # キャッシュする要約の最大件数
+MAX_BYTES = 64 * 1024 * 1024    # キャッシュする要約の合計の最大バイト数
+EVICT_INTERVAL = 100            # この件数を書き込むたびに上限を確かめる
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_last_used ON summaries (last_used);
+CREATE TABLE IF NOT EXISTS cache_runs (
+    run_id TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _normalize(text):
+    text = unicodedata.normalize('NFKC', text or "")
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def cache_key(title, text, prompt, model):
+    """要約のキャッシュのキー（本文・タイトル・プロンプトのテンプレート・モデル名のハッシュ）を返します。"""
+    data = "\0".join((model, prompt, _normalize(title), _normalize(text)))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _run_id():
+    journal = current_journal()
+    return os.path.basename(journal.run_dir) if journal is not None else None
+
+
+class SummaryCache:
+    """要約のキャッシュです。接続はスレッドごとに作ります。"""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        """キャッシュした要約を返します。なければ None を返します。ヒット・ミスの件数も記録します。"""
+        with self.connection() as conn:
+            row = conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE summaries SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._count(conn, hit=row is not None)
+        return row[0] if row else None
+
+    def _count(self, conn, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        run_id = _run_id()
+        if run_id is None:
+            return
+        conn.execute(
+            "INSERT INTO cache_runs (run_id, hits, misses, updated_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(run_id) DO UPDATE SET hits = hits + excluded.hits,"
+            " misses = misses + excluded.misses, updated_at = excluded.updated_at",
+            (run_id, int(hit), int(not hit), time.time()))
+
+    def put(self, key, summary):
+        """要約をキャッシュします。空の要約（要約に失敗したとき）はキャッシュしません。"""
+        if not summary:
+            return
+        now = time.time()
+        with self.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, size, created_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, summary, len(key) + len(summary.encode('utf-8')), now, now))
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % EVICT_INTERVAL == 0
+        if evict:
+            self.evict()
+
+    def evict(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        """最後に使った日時が古いものから、件数と大きさが上限に収まるまで消します。消した件数を返します。"""
+        with self.connection() as conn:
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries").fetchone()
+            removed = max(0, count - max_entries)
+            if size > max_bytes:
+                # 古い順に大きさを足していき、上限を超える分を消す
+                excess, total = size - max_bytes, 0
+                for (entry_size,) in conn.execute("SELECT size FROM summaries ORDER BY last_used"):
+                    if total >= excess:
+                        break
+                    total += entry_size
+                    removed += 1
+                removed = min(removed, count)
+            if removed:
+                conn.execute(
+                    "DELETE FROM summaries WHERE key IN"
+                    " (SELECT key FROM summaries ORDER BY last_used LIMIT ?)", (removed,))
+        return removed
+
+    def report(self, run_id=None):
+        """実行 run_id（省略時は有効な実行、なければ最後の実行）のヒット・ミスの件数を文字列で返します。"""
+        run_id = run_id or _run_id()
+        conn = self.connection()
+        if run_id is None:
+            row = conn.execute(
+                "SELECT run_id, hits, misses FROM cache_runs ORDER BY updated_at DESC LIMIT 1").fetchone()
+        else:
+            row = conn.execute(
+                "SELECT run_id, hits, misses FROM cache_runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            run_id, hits, misses = run_id or "この実行", self.hits, self.misses
+        else:
+            run_id, hits, misses = row
+        total = hits + misses
+        rate = f"{hits / total:.0%}" if total else "-"
+        return f"要約のキャッシュ（{run_id}）: ヒット {hits}件、ミス {misses}件、ヒット率 {rate}"
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """共有の SummaryCache を返します。"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SummaryCache()
+        return _cache
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "report":
+        print(get_cache().report(sys.argv[2] if len(sys.argv) > 2 else None))
+    elif command == "evict":
+        print(f"消した件数: {get_cache().evict()}")
+    else:
+        print("使い方: python summary_cache_oriike.py report [実行ID] | evict")
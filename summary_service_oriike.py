@@ -0,0 +1,208 @@
+# 要約（Azure OpenAI の呼び出し）をまとめて引き受けるサービスです。
+# 全取得源の要約を1つの上限付きキューに入れ、複数のスレッドで並行に呼び出す。1分あたりのリクエスト数（RPM）と
+# トークン数（TPM）の上限を全体で守り、429（レート制限）が返ったら全スレッドで待ってから速さを落として再試行する。
+# キューとワーカースレッドはプロセスごとだが、RPM・TPM のトークンバケットは SharedTokenBucket で全プロセス
+# （別プロセスで動く取得源）が共有するため、取得源のプロセスが増えても上限は1つ分のまま。
+#
+#     future = summarize_later(title, content)   # utilities_oriike。すぐに Future が返る
+#     news_item = {..., 'summary': future}         # 要約が終わるのを待たずに次の記事へ進む
+#     existing_data.append(news_item)
+#     save_json(existing_data, json_file)           # 保存の前に要約の完了を待つ
+#
+# 上限は環境変数 ORIIKE_LLM_RPM / ORIIKE_LLM_TPM / ORIIKE_LLM_WORKERS で変えられる。
+import os
+import time
+import queue
+import random
+import threading
+import contextvars
+from concurrent.futures import Future
+from ratelimit_oriike import SharedTokenBucket
+
+REQUESTS_PER_MINUTE = int(os.getenv("ORIIKE_LLM_RPM", "60"))
+TOKENS_PER_MINUTE = int(os.getenv("ORIIKE_LLM_TPM", "120000"))
+SUMMARY_WORKERS = int(os.getenv("ORIIKE_LLM_WORKERS", "8"))
+MAX_QUEUE = 64          # キューに入れておける要約の数（満杯なら submit が待つ）
+MAX_OUTPUT_TOKENS = 300 # 1件の要約で見込む出力のトークン数
+MAX_RETRIES = 5         # 429 のときに再試行する回数
+BACKOFF_SECONDS = 2     # Retry-After がないときの最初の待ち時間（秒）。再試行のたびに倍にする
+MIN_RATE_RATIO = 0.1    # 429 で落とす速さの下限（設定した RPM に対する割合）
+
+
+def estimate_tokens(text):
+    """テキストのトークン数を大まかに見積もります（英数字は4文字で1、それ以外は1文字で1）。"""
+    if not text:
+        return 0
+    ascii_count = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_count // 4 + (len(text) - ascii_count)
+
+
+def _is_rate_limited(error):
+    return getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def _retry_after(error):
+    """429 の応答の Retry-After（秒）を返します。なければ None を返します。"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class SummaryService:
+    """要約のキューとワーカースレッドです。
+
+    call(title, content, **options) は要約を返し、失敗したら例外を送出する関数です。
+    """
+
+    def __init__(self, call, workers=SUMMARY_WORKERS, max_queue=MAX_QUEUE,
+                 requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE):
+        self._call = call
+        self._queue = queue.Queue(max_queue)
+        self._max_rate = requests_per_minute / 60
+        self._requests = SharedTokenBucket("summary_requests", self._max_rate, max(1, requests_per_minute // 6))
+        self._tokens = SharedTokenBucket("summary_tokens", tokens_per_minute / 60, max(1, tokens_per_minute // 6))
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._worker, daemon=True, name=f"summary-{i}")
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, title, content, **options):
+        """要約をキューに入れ、要約（失敗したときは空文字）が入る Future を返します。キューが満杯なら空くまで待ちます。
+
+        options はそのまま call に渡します。
+        """
+        future = Future()
+        self._queue.put((future, title, content, options))
+        return future
+
+    def submit_map_reduce(self, title, chunks, map_options, reduce_options):
+        """長い文書の部分（chunks）をそれぞれ要約し、すべて済んだら部分の要約をまとめて要約します。
+
+        最後の要約（失敗したときは空文字）が入る Future を返します。まとめる要約は、最後の部分を要約した
+        ワーカースレッドがそのまま呼び出します（満杯のキューに入れようとして待ち続けないようにする）。
+        """
+        result = Future()
+        result.set_running_or_notify_cancel()
+        remaining = [len(chunks)]
+        lock = threading.Lock()
+        parts = []
+
+        def part_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            summaries = [part.result() for part in parts if not part.cancelled() and part.result()]
+            if not summaries:
+                result.set_result("")
+                return
+            try:
+                result.set_result(self._summarize(title, "\n\n".join(summaries), reduce_options))
+            except Exception as e:
+                print(f"要約中にエラーが発生しました: {e}")
+                result.set_result("")
+
+        for chunk in chunks:
+            parts.append(self.submit(title, chunk, **map_options))
+        for part in parts:
+            part.add_done_callback(part_done)
+        return result
+
+    def _worker(self):
+        while True:
+            future, title, content, options = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._summarize(title, content, options))
+            except Exception as e:
+                print(f"要約中にエラーが発生しました: {e}")
+                future.set_result("")
+
+    def _wait_pause(self):
+        while True:
+            with self._lock:
+                wait = self._pause_until - time.monotonic()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def _back_off(self, delay):
+        """全スレッドを delay 秒止め、リクエストの速さを半分にします。"""
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.monotonic() + delay)
+        self._requests.rate = max(self._max_rate * MIN_RATE_RATIO, self._requests.rate / 2)
+
+    def _recover(self):
+        """成功するたびに、落としたリクエストの速さを少しずつ設定値に戻します。"""
+        if self._requests.rate < self._max_rate:
+            self._requests.rate = min(self._max_rate, self._requests.rate + self._max_rate * 0.05)
+
+    def _summarize(self, title, content, options):
+        tokens = estimate_tokens(title) + estimate_tokens(content) + MAX_OUTPUT_TOKENS
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_pause()
+            self._requests.acquire()
+            self._tokens.acquire(tokens)
+            try:
+                summary = self._call(title, content, **options)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == MAX_RETRIES:
+                    raise
+                delay = _retry_after(e) or BACKOFF_SECONDS * 2 ** attempt * (1 + random.random() / 2)
+                print(f"⏳ 要約のレート制限に達したため {delay:.0f}秒待って再試行します: {title}")
+                self._back_off(delay)
+                continue
+            self._recover()
+            return summary
+
+
+def summary_result(value):
+    """要約（文字列、または summarize_later の Future）を文字列にします。Future なら完了を待ちます。"""
+    if isinstance(value, Future):
+        return value.result()
+    return value
+
+
+def resolve_summaries(items):
+    """記事の summary が Future なら完了を待って文字列に置き換えます。"""
+    for item in items:
+        if isinstance(item.get('summary'), Future):
+            item['summary'] = item['summary'].result()
+    return items
+
+
+def when_summarized(item, callback):
+    """記事の要約が済んだら callback(item) を呼びます。
+
+    summary が Future なら、完了したときに文字列に置き換えてから、この関数を呼んだ時点のコンテキスト
+    （実行ジャーナルの取得源など）で呼びます。Future でなければすぐに呼びます。
+    """
+    summary = item.get('summary')
+    if not isinstance(summary, Future):
+        callback(item)
+        return
+    context = contextvars.copy_context()
+
+    def done(future):
+        item['summary'] = future.result()
+        context.run(callback, item)
+    summary.add_done_callback(done)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service(call):
+    """共有の SummaryService を返します（最初に呼ばれたときに call で作ります）。"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SummaryService(call)
+        return _service
@@ -0,0 +1,211 @@
+# 1つのヘッドレスブラウザで複数のタブを同時に開き、ページを並行に描画するサービスです。
+# ページの読み込みを待つ間に他のタブの読み込みを進めるため、1ページずつ implicitly_wait で待つより速い。
+#
+#     renderer = get_renderer(executable_path)
+#     futures = [renderer.submit(url) for url in urls]
+#     for future in futures:
+#         soup = BeautifulSoup(future.result(), 'html.parser')
+#
+# extract を渡すと page_source の代わりに extract(driver) の戻り値が返る（そのタブを選択した状態で呼ばれる）。
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.edge.service import Service as EdgeService
+from ratelimit_oriike import get_limiter
+from browser_profile_oriike import browser_options, block_resources
+
+MAX_TABS = 8            # 同時に開くタブの最大数
+PAGE_TIMEOUT = 30       # 1ページの読み込みを待つ最大時間（秒）
+POLL_INTERVAL = 0.2     # 読み込み状況を確認する間隔（秒）
+
+_renderers = {}
+_renderers_lock = threading.Lock()
+
+
+def renderer_options():
+    """タブ描画用のEdgeのオプションを返します。読み込み完了を待たずに次のタブへ進めるよう page_load_strategy を none にします。"""
+    return browser_options(page_load_strategy='none')
+
+
+class _Job:
+    def __init__(self, url, extract, ready):
+        self.url = url
+        self.extract = extract
+        self.ready = ready
+        self.future = Future()
+        self.started = None
+
+
+class TabRenderer:
+    """1つのブラウザの複数タブでページを描画します。Seleniumの操作はすべて専用スレッドで行います。"""
+
+    def __init__(self, factory, max_tabs=MAX_TABS, page_timeout=PAGE_TIMEOUT):
+        self._factory = factory
+        self._max_tabs = max_tabs
+        self._page_timeout = page_timeout
+        self._jobs = queue.Queue()
+        self._waiting = []      # ホストの制限で開くのを待っている依頼
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="TabRenderer", daemon=True)
+        self._thread.start()
+
+    def submit(self, url, extract=None, ready=None):
+        """ページの描画を依頼し、Futureを返します。
+
+        ready にCSSセレクタを渡すと、その要素が現れた時点で読み込み完了とみなします
+        （省略時は document.readyState が complete になるまで待ちます）。
+        """
+        if self._closed.is_set():
+            raise RuntimeError("TabRenderer は終了済みです。")
+        job = _Job(url, extract, ready)
+        self._jobs.put(job)
+        return job.future
+
+    def render(self, url, extract=None, ready=None):
+        """ページを描画して結果を返します（submit(...).result() と同じです）。"""
+        return self.submit(url, extract, ready).result()
+
+    def close(self):
+        """ブラウザを終了します。未処理の依頼は取り消されます。"""
+        self._closed.set()
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self):
+        try:
+            driver = self._factory()
+        except Exception as e:
+            print(f"⚠️ タブ描画用のブラウザを起動できませんでした: {e}")
+            self._closed.set()
+            self._fail_all(e)
+            return
+        base = driver.current_window_handle   # 常に開いておく空のタブ
+        active = {}                           # タブのハンドル -> _Job
+        try:
+            while not self._closed.is_set() or active:
+                self._open_tabs(driver, active)
+                if not active and self._waiting:
+                    time.sleep(POLL_INTERVAL)
+                    continue
+                if not active:
+                    # 開いているタブがなければ次の依頼が来るまで待つ
+                    job = self._jobs.get()
+                    if job is not None:
+                        self._open(driver, active, job)
+                    continue
+                finished = self._poll_tabs(driver, base, active)
+                if not finished:
+                    time.sleep(POLL_INTERVAL)
+        finally:
+            # 実行中（RUNNING）の Future は cancel() できないため、完了していない依頼はすべて例外で終わらせる
+            error = RuntimeError("TabRenderer は終了しました。")
+            for job in active.values():
+                get_limiter(job.url).release()
+                if not job.future.done():
+                    job.future.set_exception(error)
+            for job in self._waiting:
+                if job.future.set_running_or_notify_cancel():
+                    job.future.set_exception(error)
+            self._waiting = []
+            self._fail_all(error)
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"⚠️ driver.quit()失敗: {e}")
+
+    def _open_tabs(self, driver, active):
+        # ホストの制限で開けなかった依頼は、次の周回で先に試す
+        waiting, self._waiting = self._waiting, []
+        for job in waiting:
+            self._open(driver, active, job)
+        while len(active) < self._max_tabs and not self._closed.is_set():
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is None:
+                return
+            self._open(driver, active, job)
+
+    def _open(self, driver, active, job):
+        if job.future.cancelled():
+            return
+        if len(active) >= self._max_tabs or not get_limiter(job.url).try_acquire():
+            self._waiting.append(job)
+            return
+        if not job.future.set_running_or_notify_cancel():
+            get_limiter(job.url).release()
+            return
+        try:
+            driver.switch_to.new_window('tab')
+            block_resources(driver)
+            driver.get(job.url)     # page_load_strategy = none のためすぐに戻る
+        except Exception as e:
+            get_limiter(job.url).release()
+            job.future.set_exception(e)
+            return
+        job.started = time.monotonic()
+        active[driver.current_window_handle] = job
+
+    def _poll_tabs(self, driver, base, active):
+        finished = 0
+        for handle, job in list(active.items()):
+            try:
+                driver.switch_to.window(handle)
+                if job.ready:
+                    loaded = bool(driver.find_elements(By.CSS_SELECTOR, job.ready))
+                else:
+                    loaded = driver.execute_script("return document.readyState") == "complete"
+                timed_out = time.monotonic() - job.started > self._page_timeout
+                if not loaded and not timed_out:
+                    continue
+                if not loaded:
+                    print(f"⚠️ 読み込みが{self._page_timeout}秒で終わらなかったため、描画済みの内容を返します: {job.url}")
+                result = job.extract(driver) if job.extract else driver.page_source
+                job.future.set_result(result)
+            except Exception as e:
+                job.future.set_exception(e)
+            finished += 1
+            del active[handle]
+            get_limiter(job.url).release()
+            try:
+                driver.close()
+                driver.switch_to.window(base)
+            except Exception as e:
+                print(f"⚠️ タブを閉じられませんでした: {e}")
+        return finished
+
+    def _fail_all(self, error):
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None and job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+
+
+def get_renderer(executable_path):
+    """msedgedriver のパスごとに共有される TabRenderer を返します。"""
+    with _renderers_lock:
+        renderer = _renderers.get(executable_path)
+        if renderer is None:
+            def factory():
+                return webdriver.Edge(service=EdgeService(executable_path=executable_path),
+                                      options=renderer_options())
+            renderer = _renderers[executable_path] = TabRenderer(factory)
+        return renderer
+
+
+@atexit.register
+def close_renderers():
+    """すべての TabRenderer のブラウザを終了します。"""
+    with _renderers_lock:
+        renderers = list(_renderers.values())
+        _renderers.clear()
+    for renderer in renderers:
+        renderer.close()
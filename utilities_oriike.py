@@ -3,16 +3,21 @@ from openai import AzureOpenAI
 import os
 import sys
 sys.path.append('c:/sasase/packages')
-import json
-import requests
+from http_oriike import http_get
+from jsonl_store_oriike import jsonl_path, iter_records, append_records, write_records, convert_json_to_jsonl, needs_compaction
+from article_store_oriike import open_history, SourceHistory
+from run_journal_oriike import record_item, record_usage
+from search_oriike import remember_body
+from summary_service_oriike import get_service, resolve_summaries, when_summarized, estimate_tokens
+from content_extract_oriike import looks_like_html, extract_main_text
+from chunk_planner_oriike import plan_chunks
+from summary_budget_oriike import PendingSummary, budget_enabled, defer_summary
+from summary_cache_oriike import get_cache, cache_key
+from concurrent.futures import Future
+import threading
+import contextvars
 from pypdf import PdfReader
 from io import BytesIO
-import re
-import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import feedparser
 import csv
 
 
@@ -24,43 +29,189 @@ client = AzureOpenAI(
     azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
 )
 
-def summarize_text(title, content):
-    """OpenAI APIを使用してテキストを要約します。"""
-    print(f"要約中: {title}")
+# 要約のプロンプトとモデル（変えると要約のキャッシュのキーも変わる）
+SUMMARY_PROMPT = "『{title}』に関する次の記事を100文字の日本語で要約してください。"
+SUMMARY_MODEL = "gpt-4o"
+# 長い文書を部分に分けて要約するときのプロンプト（部分ごとの要約と、それらをまとめる要約）
+CHUNK_PROMPT = "次の文章は『{title}』に関する文書の一部です。要点を300文字以内の日本語で箇条書きにしてください。"
+REDUCE_PROMPT = "次の文章は『{title}』に関する文書の各部分の要点です。文書全体を100文字の日本語で要約してください。"
+
+def _request_summary(title, content, prompt=SUMMARY_PROMPT):
+    """OpenAI APIを呼び出して要約を返します。失敗したら例外を送出します（再試行は summary_service_oriike が行います）。"""
     messages = [
         {
             "role": "system",
-            "content": f"『{title}』に関する次の記事を100文字の日本語で要約してください。",
+            "content": prompt.format(title=title),
         },
         {
             "role": "user",
             "content": content,
         },
     ]
+    completion = client.chat.completions.create(
+        model=SUMMARY_MODEL,
+        max_tokens=4096,
+        messages=messages,
+        temperature=0.3,
+    )
+    return completion.choices[0].message.content
 
-    try:
-        completion = client.chat.completions.create(
-            model="gpt-4o",
-            max_tokens=4096,
-            messages=messages,
-            temperature=0.3,
-        )
-        return completion.choices[0].message.content
-    except Exception as e:
-        print(f"要約中にエラーが発生しました: {e}")
-        return ""
+def summarize_later(title, content):
+    """要約を要約サービスのキューに入れ、要約が入る Future を返します。
+
+    返った Future はそのまま news_item の 'summary' に入れてかまいません。
+    save_json が保存の前に要約の完了を待ちます（失敗したときの要約は空文字）。
+
+    content が HTML なら本文だけを取り出して（content_extract_oriike）要約に送ります。
+    要約の予算（summary_budget_oriike）が有効な間は API を呼び出さず、PendingSummary（空文字として扱われる要約）を
+    返します。要約するかどうかは、すべての取得源が終わってから予算で選びます。
+    """
+    if not budget_enabled():
+        return summarize_now(title, content)
+    raw_tokens = estimate_tokens(title) + estimate_tokens(content)
+    if looks_like_html(content):
+        content = extract_main_text(content) or content
+    remember_body(title, content)  # 記事を保存するときに全文検索の索引に入れる
+    future = Future()
+    future.set_result(PendingSummary(content, raw_tokens))
+    return future
+
+def summarize_now(title, content, raw_tokens=None):
+    """summarize_later と同じですが、要約の予算が有効でもすぐに要約サービスのキューに入れます。
+
+    同じ本文・タイトルの要約がキャッシュ（summary_cache_oriike）にあれば、API を呼び出さずにそれを返します。
+    長い文書は部分に分けて並行に要約し、最後にまとめて要約します（chunk_planner_oriike）。
+    要約に送ったトークン数は実行ジャーナルに取得源ごとに記録します（raw_tokens は本文を取り出す前のトークン数）。
+    """
+    if raw_tokens is None:
+        raw_tokens = estimate_tokens(title) + estimate_tokens(content)
+    if looks_like_html(content):
+        content = extract_main_text(content) or content
+    remember_body(title, content)  # 記事を保存するときに全文検索の索引に入れる
+    chunks = plan_chunks(content)
+    prompt = SUMMARY_PROMPT if len(chunks) == 1 else "\0".join((CHUNK_PROMPT, REDUCE_PROMPT))
+    cache = get_cache()
+    key = cache_key(title, content, prompt, SUMMARY_MODEL)
+    summary = cache.get(key)
+    if summary is not None:
+        print(f"要約済み（キャッシュ）: {title}")
+        future = Future()
+        future.set_result(summary)
+        return future
+    input_tokens = sum(estimate_tokens(title) + estimate_tokens(chunk) for chunk in chunks)
+    parts = f"{len(chunks)}個に分けて、" if len(chunks) > 1 else ""
+    if input_tokens < raw_tokens:
+        print(f"要約中: {title}（{parts}入力 {input_tokens}トークン、取り出す前 {raw_tokens}トークン）")
+    else:
+        print(f"要約中: {title}（{parts}入力 {input_tokens}トークン）")
+    service = get_service(_request_summary)
+    if len(chunks) == 1:
+        future = service.submit(title, chunks[0])
+    else:
+        future = service.submit_map_reduce(title, chunks, {'prompt': CHUNK_PROMPT}, {'prompt': REDUCE_PROMPT})
+    context = contextvars.copy_context()  # 取得源の名前を要約の完了時にも使う
+
+    def done(future):
+        if future.cancelled():  # 要約の予算の時間を過ぎて打ち切られた
+            return
+        summary = future.result()
+        cache.put(key, summary)
+        context.run(record_usage, raw_tokens, input_tokens, estimate_tokens(summary))
+    future.add_done_callback(done)
+    return future
+
+def summarize_text(title, content):
+    """OpenAI APIを使用してテキストを要約します（要約が済むまで待ちます）。"""
+    return summarize_now(title, content).result()
+
+class History(list):
+    """load_existing_data が返す既存データです。保存済みの件数を覚えておき、save_json では増えた分だけを追記します。
+
+    実行ジャーナルが有効な間は、要約が済んだ時点で追記します。
+    """
+    saved_count = 0
+    path = None
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self._lock = threading.Lock()
+
+    def append(self, item):
+        super().append(item)
+        when_summarized(item, self._summarized)
+
+    def _summarized(self, item):
+        defer_summary(item, {"jsonl": self.path})
+        if record_item(item) and self.path:
+            with self._lock:
+                # 要約が済んでいない記事の手前までを追記する
+                end = self.saved_count
+                while end < len(self) and not isinstance(self[end].get('summary'), Future):
+                    end += 1
+                append_records(self.path, self[self.saved_count:end])
+                self.saved_count = end
+
+    def replace(self, item):
+        """保存済みの記事を item の内容で書き換えます。
+
+        JSON Lines は追記専用のため、同じキーのレコードを追記します（読み込み・圧縮のときに後のものが残ります）。
+        要約の予算で後から要約する記事は、候補として記録するだけで追記しません（選ばれれば要約と一緒に追記します）。
+        """
+        when_summarized(item, self._replaced)
+
+    def _replaced(self, item):
+        if isinstance(item.get('summary'), PendingSummary):
+            defer_summary(item, {"jsonl": self.path})
+            record_item(item)
+            return
+        self.append(item)
+
+# 既存データの保存先（"sqlite": ./data/articles.sqlite3、"jsonl": 取得源ごとの .jsonl）
+STORAGE_BACKEND = os.getenv("ORIIKE_STORAGE", "sqlite")
 
 def load_existing_data(file_path):
-    """既存のJSONデータをロードします。"""
-    if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    """既存データをロードします。
+
+    既定では記事データベース（article_store_oriike）の取得源を開き、全件は読み込みません。
+    重複チェックは DedupIndex がデータベースを検索して行います。
+    file_path のファイルがまだデータベースに取り込まれていなければ、先に取り込みます。
+
+    ORIIKE_STORAGE=jsonl の場合は file_path に対応する JSON Lines（.jsonl）から読みます。
+    .jsonl がまだなく従来の JSON 配列のファイルがある場合は、先に .jsonl へ変換します。
+    """
+    if STORAGE_BACKEND == "sqlite":
+        return open_history(file_path)
+    path = jsonl_path(file_path)
+    if not os.path.exists(path) and os.path.exists(file_path):
+        convert_json_to_jsonl(file_path)
+    data = History(iter_records(path))
+    # 重複した行が増えていたら圧縮しておく
+    unique = {(item.get('title'), item.get('link'), item.get('pubDate')): item for item in data}
+    if needs_compaction(len(data), len(unique)):
+        write_records(path, unique.values())
+        data = History(unique.values())
+    data.saved_count = len(data)
+    data.path = path
+    return data
 
 def save_json(data, file_path):
-    """データをJSONファイルに保存します。"""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    """データを保存します。
+
+    load_existing_data で開いたデータなら、前回の保存以降に追加されたレコードだけを書き込みます
+    （記事データベースには1トランザクションでまとめて挿入します）。
+    要約が summarize_later の Future のままの記事は、要約が済むのを待ってから保存します。
+    """
+    if isinstance(data, SourceHistory):
+        data.flush()
+        return
+    path = jsonl_path(file_path)
+    if isinstance(data, History):
+        resolve_summaries(data[data.saved_count:])
+        with data._lock:
+            append_records(path, data[data.saved_count:])
+            data.saved_count = len(data)
+    else:
+        write_records(path, resolve_summaries(data))
 
 def is_pdf_link(url): #拡張子が.pdfなだけで、中を開くとhtmlということもあるみたいなので、これは改良の余地がある
     #invalid pdf header: b'<!DOC'
@@ -71,21 +222,22 @@ def is_pdf_link(url): #拡張子が.pdfなだけで、中を開くとhtmlとい
 def extract_text_from_pdf(url):
     """PDFリンクからテキストを抽出します。"""
     try:
-        response = requests.get(url, timeout=15)  # ✅ timeoutを設定
+        response = http_get(url, timeout=15)  # ✅ timeoutを設定
         response.raise_for_status()
         # 応答がPDFか確認（まれにHTMLで404など返る）
         if not response.content.startswith(b'%PDF'):
             print(f"❌ PDFヘッダー不正: {url}")
             return ""
-        pdf_file = BytesIO(response.content)
-        reader = PdfReader(pdf_file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
-        return text
+        return extract_text_from_pdf_bytes(response.content)
     except Exception as e:
         print(f"PDFからのテキスト抽出中にエラーが発生しました: {e}")
         return ""
+
+def extract_text_from_pdf_bytes(content):
+    """取得済みのPDFの内容（bytes）からテキストを抽出します（ページの間は "\\f"）。"""
+    reader = PdfReader(BytesIO(content))
+    # ページの間には "\f" を入れる（長い文書を要約するときにページの区切りで分ける）
+    return "\f".join(page.extract_text() or "" for page in reader.pages)
     
     
 def save_to_csv(news_listmax_count, news_list, execution_timestamp):
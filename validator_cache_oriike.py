@@ -0,0 +1,76 @@
+# 一覧ページ・RSSフィードの条件付きGET（If-None-Match / If-Modified-Since）のためのキャッシュです。
+# URLごとに ETag / Last-Modified を保存し、前回から更新がない（304 Not Modified）取得源は丸ごとスキップする。
+#
+# 受け取った ETag / Last-Modified は、取得源の処理が最後まで終わってから commit_validators(url) で保存する。
+# 途中で失敗した場合や、取得できなかった記事がある場合は保存しないため、次回も同じ一覧をもう一度取得し直す
+# （保存すると一覧が 304 になり、取得できなかった記事を一覧が更新されるまで取得し直さなくなる）。
+import os
+import json
+import threading
+import feedparser
+from http_oriike import http_get
+
+VALIDATOR_FILE = "./data/http_validators.json"
+
+_pending = {}           # URL -> 未保存の {'etag', 'modified'}
+_lock = threading.Lock()
+
+
+def _load_validators():
+    if os.path.exists(VALIDATOR_FILE):
+        with open(VALIDATOR_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def conditional_get(url, **kwargs):
+    """前回の ETag / Last-Modified を付けてGETします。
+
+    更新がなければ None を、あればレスポンスを返します（requests.get と同じ引数を受け付けます）。
+    """
+    validators = _load_validators().get(url, {})
+    headers = dict(kwargs.pop('headers', None) or {})
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('modified'):
+        headers['If-Modified-Since'] = validators['modified']
+
+    response = http_get(url, headers=headers, **kwargs)
+    if response.status_code == 304:
+        print(f"前回から更新がないためスキップします: {url}")
+        return None
+    response.raise_for_status()
+
+    etag = response.headers.get('ETag')
+    modified = response.headers.get('Last-Modified')
+    if etag or modified:
+        with _lock:
+            _pending[url] = {'etag': etag, 'modified': modified}
+    return response
+
+
+def parse_feed(url):
+    """条件付きGETでRSS/Atomフィードを取得して解析します。更新がない、または取得できなければ None を返します。"""
+    try:
+        response = conditional_get(url)
+    except Exception as e:
+        print(f"フィード取得中にエラー発生 - {url}, {e}")
+        return None
+    if response is None:
+        return None
+    return feedparser.parse(response.content)
+
+
+def commit_validators(*urls):
+    """conditional_get で受け取った ETag / Last-Modified を保存します。取得源の処理が終わってから呼び出してください。"""
+    with _lock:
+        updates = {url: _pending.pop(url) for url in urls if url in _pending}
+        if not updates:
+            return
+        validators = _load_validators()  # 他のプロセスの記録を消さないよう読み直してから書く
+        validators.update(updates)
+        os.makedirs(os.path.dirname(VALIDATOR_FILE), exist_ok=True)
+        tmp_file = f"{VALIDATOR_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(validators, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_file, VALIDATOR_FILE)